@@ -1,9 +1,16 @@
 # ============== QTILE CONFIGURATION ==============
 import os
+import time
 import subprocess
-from libqtile import bar, layout, widget, hook, qtile
+from collections import deque
+from libqtile import bar, layout, widget, hook
 from libqtile.config import Click, Drag, Group, Key, Match, Screen, ScratchPad, DropDown
 from libqtile.lazy import lazy
+from libqtile.log_utils import logger
+from libqtile.widget import base
+
+from score_widgets import METRICS, ScoresWidget, prespawn_viewer
+from system_widgets import BatteryText, ClockText, MemoryText, probe_widgets
 
 # --- Basic Setup ---
 mod = "mod4"        # Super key (Windows key)
@@ -24,6 +31,10 @@ def autostart():
     except FileNotFoundError:
         pass
 
+@hook.subscribe.startup_complete
+def start_scores_viewer():
+    prespawn_viewer("scores")
+
 # --- Keybindings ---
 keys = [
     # Window Navigation & Manipulation
@@ -56,6 +67,7 @@ keys = [
     
     # --- Scratchpad & Screenshot ---
     Key([mod], "a", lazy.group['scratchpad'].dropdown_toggle('term')),
+    Key([mod], "s", lazy.group['scratchpad'].dropdown_toggle('scores'), desc="Toggle the scores viewer"),
     Key([mod, "shift"], "s", lazy.spawn("flameshot gui"), desc="Take a screenshot with Flameshot"),
 ]
 
@@ -68,6 +80,8 @@ groups = [
 # --- Add ScratchPad Group ---
 groups.append(ScratchPad("scratchpad", [
     DropDown("term", "alacritty", width=0.6, height=0.6, x=0.2, y=0.2, opacity=1),
+    # Előre indított eredmény-néző: a sáv widgetjei socketen küldik ide a listát (scores/viewer.py)
+    DropDown("scores", "alacritty --class scores -e scores-viewer", width=0.6, height=0.7, x=0.2, y=0.15, opacity=1),
 ]))
 
 # --- Group Keybindings ---
@@ -85,78 +99,125 @@ layouts = [ layout.Columns(**layout_theme), layout.Max(**layout_theme) ]
 # --- Bar and Widgets ---
 widget_defaults = dict(font=font_name, fontsize=14, padding=3, background="#282a36", foreground="#f8f8f2")
 
-# --- Function to call the email script ---
-def check_email_script():
-    script_path = os.path.join(home, '.config', 'qtile', 'scripts', 'check_email.py')
-    try:
-        return subprocess.check_output(script_path).decode("utf-8").strip()
-    except Exception:
-        return " SCRIPT ERR"
+# --- Email widget: non-blocking poller ---
+class EmailPoller(base.ThreadPoolText):
+    """Az email szkriptet a Qtile eseményhurkán kívül, munkaszálban és időkorláttal futtatja.
+    Frissítés közben (és hiba esetén) az utolsó jó érték marad kint. Azt is méri, hogy
+    egy lekérdezés mennyi ideig foglalja magát az eseményhurkot."""
+    defaults = [
+        ("script", os.path.join(home, '.config', 'qtile', 'scripts', 'check_email.py'), "Az email szkript"),
+        ("timeout", 30, "Időkorlát másodpercben"),
+        ("error_text", " SCRIPT ERR", "Kiírás, ha még sosem volt sikeres lekérdezés"),
+    ]
+
+    def __init__(self, **config):
+        base.ThreadPoolText.__init__(self, "", **config)
+        self.add_defaults(EmailPoller.defaults)
+        self.last_good = None
+        self.loop_block_ms = deque(maxlen=100)  # lekérdezésenként az eseményhurkon töltött idő
+        self.poll_ms = deque(maxlen=100)        # a szkript futásideje (munkaszálon)
+        self._block = 0.0
+
+    def poll(self):
+        # Munkaszálon fut, nem az eseményhurkon.
+        start = time.perf_counter()
+        try:
+            output = subprocess.check_output([self.script], timeout=self.timeout, stderr=subprocess.DEVNULL)
+            self.last_good = output.decode("utf-8").strip()
+        except subprocess.TimeoutExpired as e:
+            METRICS.error("qtile.poll.email", e)
+            logger.warning("email check timed out after %ss", self.timeout)
+        except Exception as e:
+            METRICS.error("qtile.poll.email", e)
+            logger.exception("email check failed")
+        finally:
+            self.poll_ms.append((time.perf_counter() - start) * 1000)
+            METRICS.record("qtile.poll.email", self.poll_ms[-1])
+            METRICS.maybe_flush()
+        return self.last_good if self.last_good is not None else self.error_text
+
+    def timer_setup(self):
+        start = time.perf_counter()
+        base.ThreadPoolText.timer_setup(self)
+        self._block = time.perf_counter() - start
+
+    def update(self, text):
+        start = time.perf_counter()
+        base.ThreadPoolText.update(self, text)
+        blocked = (self._block + time.perf_counter() - start) * 1000
+        self.loop_block_ms.append(blocked)
+        METRICS.record("qtile.loop_block.email", blocked)
+        logger.debug("email poll: %.1f ms in worker, %.2f ms on main loop",
+                     self.poll_ms[-1] if self.poll_ms else 0.0, blocked)
+
+    def info(self):
+        info = base.ThreadPoolText.info(self)
+        blocks = sorted(self.loop_block_ms)
+        info["loop_block_ms_last"] = self.loop_block_ms[-1] if blocks else None
+        info["loop_block_ms_p50"] = blocks[len(blocks) // 2] if blocks else None
+        info["loop_block_ms_max"] = blocks[-1] if blocks else None
+        info["poll_ms_last"] = self.poll_ms[-1] if self.poll_ms else None
+        return info
+
+# --- System widgets: one shared sampler ---
+def status_widgets():
+    """Akkumulátor, memória, hangerő és óra. Alapból egy közös, igazított ütemről
+    (system_widgets.py); QTILE_NO_SAMPLER=1 mellett a gyári, saját időzítős widgetek.
+    A hangerő PulseAudio eseményekből frissül, az marad a gyári widget."""
+    battery = dict(
+        format='{char} {percent:2.0%}', charge_char='', discharge_char='',
+        full_char='', unknown_char='', foreground="#50fa7b",
+        low_foreground="#ff5555", padding=5
+    )
+    memory = dict(format='󰍛 {MemUsed:.0f}{mm}', foreground="#50fa7b", measure_mem='G', padding=5)
+    clock = dict(format=" %Y-%m-%d %a %I:%M %p", foreground="#8be9fd", padding=10)
+    volume = widget.PulseVolume(fmt='󰕾 {}', foreground="#f1fa8c", padding=5)
+    if os.environ.get("QTILE_NO_SAMPLER"):
+        return [widget.Battery(**battery), widget.Memory(**memory), volume, widget.Clock(**clock)]
+    return [BatteryText(**battery), MemoryText(**memory), volume, ClockText(**clock)]
+
+bar_widgets = [
+    # BAL OLDALI WIDGETEK
+    widget.GroupBox(
+        fontsize=24, active="#f8f8f2", inactive="#6272a4",
+        highlight_method="block", this_current_screen_border="#bd93f9",
+        padding_x=5, borderwidth=3
+    ),
+    widget.WindowName(foreground="#bd93f9", padding=5),
 
-screens = [
-    Screen(
-        top=bar.Bar([
-            # BAL OLDALI WIDGETEK
-            widget.GroupBox(
-                fontsize=24, active="#f8f8f2", inactive="#6272a4",
-                highlight_method="block", this_current_screen_border="#bd93f9",
-                padding_x=5, borderwidth=3
-            ),
-            widget.WindowName(foreground="#bd93f9", padding=5),
-            
-            # ÜRES HELY, AMI JOBBRA TOLJA A KÖVETKEZŐ WIDGETEKET
-            widget.Spacer(bar.STRETCH),
-
-            # JOBB OLDALI WIDGETEK
-            widget.GenPollText(
-                func=lambda: "🎾",
-                update_interval=3600,
-                mouse_callbacks={
-                    # JAVÍTVA: Az új, egyszerűbb parancsnevet használjuk
-                    'Button1': lambda: qtile.cmd_spawn(
-                        f"sh -c 'wimbledon-scores full > /tmp/tennis_today.txt && {terminal} -e less -R /tmp/tennis_today.txt'"
-                    ),
-                    'Button3': lambda: qtile.cmd_spawn(
-                        f"sh -c 'wimbledon-scores full yesterday > /tmp/tennis_yesterday.txt && {terminal} -e less -R /tmp/tennis_yesterday.txt'"
-                    ),
-                }
-            ),
-            widget.Sep(linewidth=0, padding=10),
-            widget.GenPollText(
-                func=lambda: "⚽",
-                update_interval=3600,
-                mouse_callbacks={
-                    # JAVÍTVA: Az új, egyszerűbb parancsnevet használjuk
-                    'Button1': lambda: qtile.cmd_spawn(
-                        f"sh -c 'soccer-scores full > /tmp/soccer_today.txt && {terminal} -e less -R /tmp/soccer_today.txt'"
-                    ),
-                    'Button3': lambda: qtile.cmd_spawn(
-                        f"sh -c 'soccer-scores full yesterday > /tmp/soccer_yesterday.txt && {terminal} -e less -R /tmp/soccer_yesterday.txt'"
-                    ),
-                }
-            ),
-            widget.Sep(linewidth=0, padding=10),
-            widget.Systray(),
-            widget.Pomodoro(
-                color_active="#50fa7b", color_inactive="#ff5555",
-                prefix_inactive='POMO', padding=5
-            ),
-            widget.GenPollText(
-                func=check_email_script, update_interval=300,
-                foreground="#8be9fd", mouse_callbacks={'Button1': lazy.spawn(f"{browser} https://mail.google.com")},
-                padding=5,
-            ),
-            widget.Battery(
-                format='{char} {percent:2.0%}', charge_char='', discharge_char='',
-                full_char='', unknown_char='', foreground="#50fa7b",
-                low_foreground="#ff5555", padding=5
-            ),
-            widget.Memory(format='󰍛 {MemUsed:.0f}{mm}', foreground="#50fa7b", measure_mem='G', padding=5),
-            widget.PulseVolume(fmt='󰕾 {}', foreground="#f1fa8c", padding=5),
-            widget.Clock(format=" %Y-%m-%d %a %I:%M %p", foreground="#8be9fd", padding=10),
-            widget.QuickExit(default_text='', countdown_format='[{}]', fontsize=20, foreground="#ff5555", padding=5),
-        ], 30, opacity=0.9),
+    # ÜRES HELY, AMI JOBBRA TOLJA A KÖVETKEZŐ WIDGETEKET
+    widget.Spacer(bar.STRETCH),
+
+    # JOBB OLDALI WIDGETEK
+    ScoresWidget(
+        sport="tennis", command="wimbledon-scores", icon="🎾",
+        update_interval=60,
     ),
+    widget.Sep(linewidth=0, padding=10),
+    ScoresWidget(
+        sport="soccer", command="soccer-scores", icon="⚽",
+        update_interval=60,
+    ),
+    widget.Sep(linewidth=0, padding=10),
+    widget.Systray(),
+    widget.Pomodoro(
+        color_active="#50fa7b", color_inactive="#ff5555",
+        prefix_inactive='POMO', padding=5
+    ),
+    EmailPoller(
+        update_interval=300, timeout=30,
+        foreground="#8be9fd", mouse_callbacks={'Button1': lazy.spawn(f"{browser} https://mail.google.com")},
+        padding=5,
+    ),
+    *status_widgets(),
+    widget.QuickExit(default_text='', countdown_format='[{}]', fontsize=20, foreground="#ff5555", padding=5),
+]
+# Ébredések, CPU idő és rajzolások widgetenként (scores stats qtile), összehasonlításhoz.
+if os.environ.get("QTILE_BAR_PROBE"):
+    probe_widgets(bar_widgets)
+
+screens = [
+    Screen(top=bar.Bar(bar_widgets, 30, opacity=0.9)),
 ]
 
 # --- Final Settings ---
@@ -0,0 +1,153 @@
+# ============== SYSTEM SAMPLER ==============
+# A sáv rendszer-widgetjeinek (memória, akkumulátor, óra) közös mintavételezője.
+#
+# A gyári widgetek (widget.Memory, widget.Clock: másodpercenként; widget.Battery: percenként)
+# mind saját időzítővel ébresztik az eseményhurkot, egymástól függetlenül. Itt egyetlen
+# ütem van: TICK másodpercenként, a falióra egész többszöröseire igazítva (így a perc
+# váltása pontosan a :00-kor látszik), egyszer olvassuk a forrásokat, és a kijelzők a
+# kész értékekből számolják a szövegüket. Egy kijelző csak akkor rajzol újra, ha a
+# szövege (vagy a színe) tényleg változott.
+#
+# A források ütemenként olcsók (/proc/meminfo); az akkumulátor sysfs olvasása ACPI
+# lekérdezéssel járhat, ezért az csak minden BATTERY_EVERY. ütemben fut.
+#
+# Ez a modul nem függ a libqtile-tól (a widgetek: system_widgets.py), így a mérés
+# (scripts/bench/bar_sampler.py) a Qtile nélkül is ugyanezt a kódot futtatja.
+import os
+import glob
+import time
+
+TICK = 10
+BATTERY_EVERY = 6
+BATTERY_GLOB = "/sys/class/power_supply/BAT*"
+MEMINFO = "/proc/meminfo"
+
+
+def read_meminfo(path=MEMINFO):
+    """MemTotal, MemAvailable és MemUsed (= MemTotal - MemAvailable) bájtban."""
+    values = {}
+    with open(path, "rb") as f:
+        for line in f:
+            key, _, rest = line.partition(b":")
+            if key in (b"MemTotal", b"MemAvailable"):
+                values[key.decode()] = int(rest.split()[0]) * 1024
+                if len(values) == 2:
+                    break
+    values["MemUsed"] = values["MemTotal"] - values["MemAvailable"]
+    return values
+
+
+def _read(directory, name):
+    with open(os.path.join(directory, name)) as f:
+        return f.read().strip()
+
+
+def find_battery(pattern=BATTERY_GLOB):
+    """Az első akkumulátor sysfs könyvtára, vagy None (asztali gép)."""
+    found = sorted(glob.glob(pattern))
+    return found[0] if found else None
+
+
+def read_battery(directory):
+    """{'status': 'Charging'|'Discharging'|'Full'|..., 'percent': 0..1}, vagy None."""
+    if directory is None:
+        return None
+    status = _read(directory, "status")
+    try:
+        percent = int(_read(directory, "capacity")) / 100
+    except OSError:
+        # Régebbi meghajtók: nincs 'capacity', csak energy_/charge_ értékek.
+        prefix = "energy" if os.path.exists(os.path.join(directory, "energy_now")) else "charge"
+        percent = int(_read(directory, f"{prefix}_now")) / int(_read(directory, f"{prefix}_full"))
+    return {"status": status, "percent": min(1.0, percent)}
+
+
+class Sampler:
+    """Egy igazított ütem a forrásokhoz; a kijelzők a változáskor kapják meg a szövegüket."""
+
+    def __init__(self, tick=TICK, battery=None):
+        self.tick = tick
+        self.battery = find_battery() if battery is None else battery
+        self.subscribers = []     # [render(values), show(shown), utoljára kiírt]
+        self.values = {}
+        self.ticks = 0
+        self.redraws = 0
+        self.cpu = 0.0            # az ütemekben töltött CPU idő (s, az ütemező szálán)
+        self.started = time.monotonic()
+
+    def subscribe(self, render, show):
+        """render(values) -> a kiírandó érték; show(érték) csak változáskor hívódik.
+        Ha már van minta, a bejegyzés harmadik eleme a mostani érték (show nélkül)."""
+        entry = [render, show, render(self.values) if self.values else None]
+        self.subscribers.append(entry)
+        return entry
+
+    def unsubscribe(self, entry):
+        if entry in self.subscribers:
+            self.subscribers.remove(entry)
+
+    def delay(self, now=None):
+        """Másodpercek a következő igazított ütemig."""
+        now = time.time() if now is None else now
+        return self.tick - now % self.tick
+
+    def _deliver(self, entry):
+        shown = entry[0](self.values)
+        if shown != entry[2]:
+            entry[2] = shown
+            self.redraws += 1
+            entry[1](shown)
+
+    def sample(self, now=None):
+        """Egy ütem: a források olvasása és a változott kijelzők frissítése."""
+        cpu = time.thread_time()
+        now = time.time() if now is None else now
+        values = dict(self.values)
+        values["time"] = time.localtime(now)
+        try:
+            values["memory"] = read_meminfo()
+        except (OSError, KeyError, ValueError):
+            values["memory"] = None
+        if self.ticks % BATTERY_EVERY == 0:
+            try:
+                values["battery"] = read_battery(self.battery)
+            except (OSError, ValueError, ZeroDivisionError):
+                values["battery"] = None
+        self.values = values
+        self.ticks += 1
+        for entry in list(self.subscribers):
+            self._deliver(entry)
+        self.cpu += time.thread_time() - cpu
+
+    def stats(self):
+        """Ébredések és CPU idő percenként, és az újrarajzolások száma az indulás óta."""
+        minutes = max(1e-9, (time.monotonic() - self.started) / 60)
+        return {"wakeups_per_min": self.ticks / minutes, "cpu_ms_per_min": self.cpu * 1000 / minutes,
+                "redraws": self.redraws}
+
+
+# --- A kijelzők szövege (a gyári widgetek formátumaival) ---
+
+MEMORY_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def memory_text(values, fmt, unit="M"):
+    memory = values.get("memory")
+    if memory is None:
+        return None
+    scaled = {key: value / MEMORY_UNITS[unit] for key, value in memory.items()}
+    return fmt.format(mm=unit, **scaled)
+
+
+def clock_text(values, fmt):
+    return time.strftime(fmt, values["time"])
+
+
+def battery_text(values, fmt, chars, low_percentage=0.1):
+    """(szöveg, alacsony-e), vagy None, ha nincs akkumulátor."""
+    battery = values.get("battery")
+    if battery is None:
+        return None
+    char = chars.get(battery["status"], chars["unknown"])
+    low = battery["status"] == "Discharging" and battery["percent"] <= low_percentage
+    return fmt.format(char=char, percent=battery["percent"]), low
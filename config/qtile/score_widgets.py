@@ -0,0 +1,278 @@
+# ============== SCORE WIDGETS ==============
+# Élő eredmény összefoglaló a sávon (🎾/⚽), közös háttérfrissítéssel.
+#
+# A widget munkaszálon kéri le a scores daemontól (scripts/scores/daemon.py, Unix socket)
+# a 'view' nézetet, ami egyetlen letöltésből adja a sávba szánt összefoglalót és a
+# teljes mai listát. Kattintáskor a már letöltött listát mutatjuk, újabb lekérés nélkül.
+# Ha a daemon nem fut, a CLI-t hívjuk (az maga tölt le).
+#
+# A listát az előre elindított 'scores' DropDown nézője jeleníti meg (scripts/scores/viewer.py):
+# a szöveg socketen megy át egy ott futó 'less -R'-nek, ideiglenes fájl és új terminál nélkül.
+# A kattintástól a látható listáig eltelt időt a widget méri (info() és a napló).
+#
+# A frissítési időt a 'view' válasz 'next_poll' mezője adja (scripts/scores/schedule.py):
+# zajló kedvenc meccs alatt sűrűn, csak később kezdődő meccseknél ritkán, éjjel alig
+# frissítünk. Az update_interval csak addig számít, amíg nincs válasz.
+#
+# Mérések: a lekérdezések ideje ('qtile.poll.<név>'), a kattintástól a látható listáig
+# eltelt idő ('qtile.view.<név>') és a hibák a scores metrikáival azonos formában a
+# $XDG_STATE_HOME/scores/qtile-metrics.jsonl fájlba kerülnek (lásd scripts/scores/telemetry.py);
+# jelentés: scores stats qtile
+import os
+import json
+import time
+import socket
+import tempfile
+import threading
+import subprocess
+from collections import deque
+
+from libqtile import qtile
+from libqtile.log_utils import logger
+from libqtile.widget import base
+
+# A scores daemon socketje és protokollja (lásd scripts/scores/daemon.py).
+SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), "scores.sock")
+# Az eredmény-néző socketje és protokollja (lásd scripts/scores/viewer.py).
+VIEWER_SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), "scores-viewer.sock")
+# A metrika fájl és formátuma (lásd scripts/scores/telemetry.py).
+METRICS_FILE = os.path.join(
+    os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state"), "scores", "qtile-metrics.jsonl"
+)
+METRICS_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+METRICS_FLUSH_INTERVAL = 60
+METRICS_MAX_BYTES = 1024 * 1024
+
+
+class Metrics:
+    """Időmérések hisztogramban és számlálók; munkaszálon, percenként kerülnek a fájlba."""
+
+    def __init__(self, path=METRICS_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.timers = {}
+        self.counters = {}
+        self.flushed = time.monotonic()
+
+    def record(self, name, ms):
+        bucket = next((str(b) for b in METRICS_BUCKETS_MS if ms <= b), "inf")
+        with self.lock:
+            timer = self.timers.setdefault(name, {"count": 0, "sum": 0.0, "max": 0.0, "buckets": {}})
+            timer["count"] += 1
+            timer["sum"] += ms
+            timer["max"] = max(timer["max"], ms)
+            timer["buckets"][bucket] = timer["buckets"].get(bucket, 0) + 1
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def error(self, name, exc):
+        self.count(f"error.{name}.{type(exc).__name__}")
+
+    def maybe_flush(self):
+        """Munkaszálon hívandó (fájlírás); legfeljebb METRICS_FLUSH_INTERVAL-onként ír."""
+        if time.monotonic() - self.flushed < METRICS_FLUSH_INTERVAL:
+            return
+        with self.lock:
+            data = {"time": time.time(), "pid": os.getpid(), "source": "qtile",
+                    "timers": self.timers, "counters": self.counters}
+            self.timers, self.counters = {}, {}
+            self.flushed = time.monotonic()
+        if not data["timers"] and not data["counters"]:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if os.path.exists(self.path) and os.path.getsize(self.path) > METRICS_MAX_BYTES:
+                os.replace(self.path, self.path + ".1")
+            with open(self.path, "a") as f:
+                f.write(json.dumps(data, separators=(",", ":")) + "\n")
+        except OSError:
+            logger.exception("writing qtile metrics failed")
+
+
+METRICS = Metrics()
+
+
+def daemon_request(sport, args, timeout=30):
+    """Egy kérés a scores daemonnak; None, ha nem érhető el."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            sock.connect(SOCKET_PATH)
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps({"sport": sport, "args": list(args)}).encode("utf-8") + b"\n")
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        return json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+
+
+def run_scores(sport, command, args, timeout=30):
+    """A daemon válasza, vagy ha nem fut, a CLI kimenete."""
+    reply = daemon_request(sport, args, timeout)
+    if reply is not None:
+        if not reply.get("ok"):
+            raise RuntimeError(reply.get("error"))
+        return reply["output"]
+    return subprocess.check_output([command, *args], timeout=timeout).decode("utf-8")
+
+
+def viewer_send(text, clicked=None, timeout=2):
+    """Szöveg átadása a nézőnek (text=None: csak él-e); None, ha a néző nem fut."""
+    payload = {"ping": True} if text is None else {"text": text, "clicked": clicked}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            sock.connect(VIEWER_SOCKET_PATH)
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            return json.loads(sock.makefile("rb").readline())
+    except (OSError, ValueError):
+        return None
+
+
+def _dropdown(name):
+    scratchpad = qtile.groups_map.get("scratchpad")
+    return scratchpad, scratchpad.dropdowns.get(name) if scratchpad else None
+
+
+def show_dropdown(name):
+    """Megjeleníti a DropDownt (ha még nem látszik); az eseményhurkon hívandó."""
+    scratchpad, dropdown = _dropdown(name)
+    if scratchpad and (dropdown is None or not dropdown.visible):
+        scratchpad.dropdown_toggle(name)
+
+
+def hide_dropdown(name):
+    scratchpad, dropdown = _dropdown(name)
+    if dropdown is not None and dropdown.visible:
+        scratchpad.dropdown_toggle(name)
+
+
+def wait_for_viewer(limit=5.0):
+    """Megvárja, amíg a frissen indított néző válaszol a socketen."""
+    deadline = time.monotonic() + limit
+    while time.monotonic() < deadline:
+        if viewer_send(None) is not None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def prespawn_viewer(name="scores"):
+    """Induláskor elindítja a néző DropDownját, és amint a néző él, el is rejti,
+    hogy az első kattintásnál már ne kelljen terminált indítani."""
+    if viewer_send(None) is not None:
+        return
+    show_dropdown(name)
+
+    def hide_when_ready():
+        if wait_for_viewer():
+            qtile.call_soon_threadsafe(hide_dropdown, name)
+
+    threading.Thread(target=hide_when_ready, daemon=True).start()
+
+
+class ScoresWidget(base.ThreadPoolText):
+    """Élő összefoglaló a sávon; a kattintásra megnyíló lista ugyanabból a letöltésből jön."""
+    defaults = [
+        ("sport", "tennis", "A daemon sportága ('tennis' vagy 'soccer')"),
+        ("command", "wimbledon-scores", "A CLI parancs, ha a daemon nem fut"),
+        ("icon", "🎾", "Kiírás, amíg nincs adat"),
+        ("viewer", "scores", "A nézőt futtató scratchpad DropDown neve"),
+        ("timeout", 30, "Időkorlát másodpercben"),
+        ("min_interval", 15, "A 'next_poll' szerinti frissítési idő alsó korlátja (s)"),
+        ("max_interval", 1800, "A 'next_poll' szerinti frissítési idő felső korlátja (s)"),
+    ]
+
+    def __init__(self, **config):
+        base.ThreadPoolText.__init__(self, "", **config)
+        self.add_defaults(ScoresWidget.defaults)
+        self.text = self.icon
+        self.summary = self.icon
+        self.full = None
+        self.view_ms = deque(maxlen=100)  # kattintástól a látható listáig
+        self.add_callbacks({"Button1": self.show_today, "Button3": self.show_yesterday})
+
+    def poll(self):
+        # Munkaszálon fut: egy letöltés a sávnak és a részletes nézetnek.
+        start = time.perf_counter()
+        try:
+            view = json.loads(run_scores(self.sport, self.command, ["view"], self.timeout))
+            self.summary = view["summary"]
+            self.full = view["full"]
+            # A következő frissítés ideje; a timer_setup ezzel ütemez újra.
+            if view.get("next_poll"):
+                self.update_interval = min(self.max_interval, max(self.min_interval, view["next_poll"]))
+        except Exception as e:
+            METRICS.error(f"qtile.poll.{self.sport}", e)
+            logger.exception("%s scores refresh failed", self.sport)
+        METRICS.record(f"qtile.poll.{self.sport}", (time.perf_counter() - start) * 1000)
+        METRICS.maybe_flush()
+        # Az összefoglaló már Pango markup (scores/render.py).
+        return self.summary
+
+    def _present(self, text, clicked):
+        # Munkaszálon: átadás a nézőnek; ha még nem fut, a DropDown elindítja.
+        reply = viewer_send(text, clicked)
+        if reply is None:
+            qtile.call_soon_threadsafe(show_dropdown, self.viewer)
+            if not wait_for_viewer():
+                logger.warning("scores viewer did not start")
+                return
+            reply = viewer_send(text, clicked)
+        if not reply or not reply.get("ok"):
+            logger.warning("scores viewer failed: %s", reply and reply.get("error"))
+            return
+        qtile.call_soon_threadsafe(self._shown, clicked)
+
+    def _shown(self, clicked):
+        show_dropdown(self.viewer)
+        elapsed = (time.monotonic() - clicked) * 1000
+        self.view_ms.append(elapsed)
+        METRICS.record(f"qtile.view.{self.sport}", elapsed)
+        logger.info("%s scores view: %.1f ms from click to visible", self.sport, elapsed)
+
+    def show_today(self):
+        """A legutóbb letöltött mai lista, azonnal; ha még nincs (indulás, hibázott első
+        letöltés), most letölti, frissíti a sávot, és a kész listát mutatja."""
+        clicked = time.monotonic()
+        if self.full is not None:
+            qtile.run_in_executor(self._present, self.full, clicked)
+            return
+
+        def fetch_and_present():
+            summary = self.poll()
+            qtile.call_soon_threadsafe(self.update, summary)
+            if self.full is not None:
+                self._present(self.full, clicked)
+
+        qtile.run_in_executor(fetch_and_present)
+
+    def show_yesterday(self):
+        clicked = time.monotonic()
+
+        def fetch_and_present():
+            try:
+                text = run_scores(self.sport, self.command, ["full", "yesterday"], self.timeout)
+            except Exception as e:
+                METRICS.error(f"qtile.yesterday.{self.sport}", e)
+                logger.exception("%s scores (yesterday) failed", self.sport)
+                return
+            self._present(text, clicked)
+
+        qtile.run_in_executor(fetch_and_present)
+
+    def info(self):
+        info = base.ThreadPoolText.info(self)
+        views = sorted(self.view_ms)
+        info["view_ms_last"] = self.view_ms[-1] if views else None
+        info["view_ms_p50"] = views[len(views) // 2] if views else None
+        info["view_ms_max"] = views[-1] if views else None
+        return info
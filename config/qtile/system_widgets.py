@@ -0,0 +1,180 @@
+# ============== SYSTEM WIDGETS ==============
+# Memória, akkumulátor és óra a sávon, egyetlen közös ütemről (sampler.py).
+#
+# A kijelzőknek nincs saját időzítőjük: a közös mintavételező ütemenként egyszer olvassa
+# a forrásokat az eseményhurkon (néhány fájl a /proc és /sys alatt, mikroszekundumok),
+# és csak annak a kijelzőnek adja át az új szövegét, amelyiké változott. A paraméterek a
+# gyári widgetekéi (widget.Memory, widget.Battery, widget.Clock), így a config.py-ban
+# egy sorral visszacserélhetők.
+#
+# Mérés: QTILE_BAR_PROBE=1 mellett a sáv minden widgetjére (gyári és közös ütemű)
+# számoljuk az időzítős ébredéseket ('qtile.wakeup.<widget>'), az eseményhurkon közben
+# elhasznált CPU időt ('qtile.cpu.<widget>') és az újrarajzolásokat ('qtile.draw.<widget>');
+# a közös ütem ébredéseit mindig ('qtile.wakeup.sampler'). Jelentés: scores stats qtile.
+# A QTILE_NO_SAMPLER=1 a gyári widgeteket teszi vissza az összehasonlításhoz.
+import time
+
+from libqtile import qtile
+from libqtile.widget import base
+
+from sampler import Sampler, battery_text, clock_text, memory_text
+from score_widgets import METRICS
+
+SAMPLER = Sampler()
+_handle = None
+
+
+def _tick():
+    global _handle
+    cpu = SAMPLER.cpu
+    SAMPLER.sample()
+    METRICS.count("qtile.wakeup.sampler")
+    METRICS.record("qtile.cpu.sampler", (SAMPLER.cpu - cpu) * 1000)
+    _handle = qtile.call_later(SAMPLER.delay(), _tick)
+
+
+def _start():
+    """Elindítja a közös ütemet (az első kijelző konfigurálásakor); az eseményhurkon hívandó."""
+    global _handle
+    if _handle is None:
+        _handle = qtile.call_soon(_tick)
+
+
+def _stop_if_idle():
+    global _handle
+    if _handle is not None and not SAMPLER.subscribers:
+        _handle.cancel()
+        _handle = None
+
+
+class SampledText(base._TextBox):
+    """Szöveg a közös mintavételezőből; a leszármazott render()-je számolja ki."""
+
+    def __init__(self, **config):
+        base._TextBox.__init__(self, "", **config)
+        self.subscription = None
+
+    def _configure(self, qtile, bar):
+        # Újraindításkor a már meglévő értékekkel indulunk, a következő ütem megvárása nélkül.
+        self.subscription = SAMPLER.subscribe(self.render, self.show)
+        if self.subscription[2] is not None:
+            self.apply(self.subscription[2])
+        base._TextBox._configure(self, qtile, bar)
+        _start()
+
+    def finalize(self):
+        SAMPLER.unsubscribe(self.subscription)
+        _stop_if_idle()
+        base._TextBox.finalize(self)
+
+    def render(self, values):
+        raise NotImplementedError
+
+    def apply(self, shown):
+        """A kiírt érték beállítása rajzolás nélkül."""
+        self.text = shown or ""
+
+    def show(self, shown):
+        # A _TextBox.update csak változáskor rajzol; a szélesség változásakor a sávot is.
+        self.update(shown or "")
+
+    def info(self):
+        info = base._TextBox.info(self)
+        info.update(SAMPLER.stats())
+        return info
+
+
+class MemoryText(SampledText):
+    """A widget.Memory megfelelője ('{MemUsed}', '{MemTotal}', '{MemAvailable}', '{mm}')."""
+    defaults = [
+        ("format", "{MemUsed: .0f}{mm}", "Formátum"),
+        ("measure_mem", "M", "Mértékegység: 'K', 'M' vagy 'G'"),
+    ]
+
+    def __init__(self, **config):
+        SampledText.__init__(self, **config)
+        self.add_defaults(MemoryText.defaults)
+
+    def render(self, values):
+        return memory_text(values, self.format, self.measure_mem)
+
+
+class ClockText(SampledText):
+    """A widget.Clock megfelelője; az ütem TICK másodpercenként, a perc váltására igazítva."""
+    defaults = [("format", "%H:%M", "strftime formátum")]
+
+    def __init__(self, **config):
+        SampledText.__init__(self, **config)
+        self.add_defaults(ClockText.defaults)
+
+    def render(self, values):
+        return clock_text(values, self.format)
+
+
+class BatteryText(SampledText):
+    """A widget.Battery megfelelője; alacsony töltöttségnél merülés közben low_foreground színnel."""
+    defaults = [
+        ("format", "{char} {percent:2.0%}", "Formátum ('{char}', '{percent}')"),
+        ("charge_char", "^", "Töltés közben"),
+        ("discharge_char", "V", "Merülés közben"),
+        ("full_char", "=", "Feltöltve"),
+        ("not_charging_char", "*", "Csatlakoztatva, nem tölt"),
+        ("unknown_char", "?", "Ismeretlen állapot"),
+        ("low_percentage", 0.10, "E szint alatt alacsony"),
+        ("low_foreground", "FF0000", "Szín alacsony töltöttségnél"),
+    ]
+
+    def __init__(self, **config):
+        SampledText.__init__(self, **config)
+        self.add_defaults(BatteryText.defaults)
+        self.normal_foreground = self.foreground
+        self.chars = {"Charging": self.charge_char, "Discharging": self.discharge_char,
+                      "Full": self.full_char, "Not charging": self.not_charging_char,
+                      "unknown": self.unknown_char}
+
+    def render(self, values):
+        return battery_text(values, self.format, self.chars, self.low_percentage)
+
+    def apply(self, shown):
+        text, low = shown or ("", False)
+        self.text = text
+        self.foreground = self.low_foreground if low else self.normal_foreground
+
+    def show(self, shown):
+        text, low = shown or ("", False)
+        foreground = self.low_foreground if low else self.normal_foreground
+        if foreground != self.foreground:
+            self.foreground = self.layout.colour = foreground
+            if text == self.text:
+                self.draw()
+        self.update(text)
+
+
+def probe_widgets(widgets):
+    """A widgetek időzítős ébredéseinek, CPU idejének és rajzolásainak mérése (QTILE_BAR_PROBE=1)."""
+    for widget in widgets:
+        _probe(widget)
+    return widgets
+
+
+def _probe(widget):
+    timeout_add, draw = widget.timeout_add, widget.draw
+
+    def timed(kind, method):
+        def call(*args):
+            start = time.thread_time()
+            try:
+                return method(*args)
+            finally:
+                # A név a sáv konfigurálásakor még változhat (ismétlődő nevek), ezért itt.
+                METRICS.record(f"qtile.{kind}.{widget.name}", (time.thread_time() - start) * 1000)
+        return call
+
+    def probed_timeout_add(seconds, method, method_args=()):
+        def wakeup(*args):
+            METRICS.count(f"qtile.wakeup.{widget.name}")
+            return timed("cpu", method)(*args)
+        return timeout_add(seconds, wakeup, method_args)
+
+    widget.timeout_add = probed_timeout_add
+    widget.draw = timed("draw", draw)
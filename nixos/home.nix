@@ -5,7 +5,23 @@ let
   # Itt létrehozunk egy speciális Python környezetet, amiben benne van a 'requests' csomag.
   pythonWithRequests = pkgs.python3.withPackages (ps: [
     ps.requests
+    ps.jeepney  # D-Bus értesítések (scores/notify.py)
   ]);
+
+  # A scores szkriptek és a közös 'scores' csomag a Nix store-ban.
+  scoresScripts = ../scripts;
+
+  scoresDaemon = pkgs.writeShellScriptBin "scores-daemon" ''
+    export PYTHONPATH=${scoresScripts}
+    exec ${pythonWithRequests}/bin/python3 -m scores.daemon "$@"
+  '';
+
+  # A 'scores' scratchpad DropDownban futó néző (a sáv widgetjei socketen küldik a listát).
+  scoresViewer = pkgs.writeShellScriptBin "scores-viewer" ''
+    export PYTHONPATH=${scoresScripts}
+    export PATH=${pkgs.less}/bin:$PATH
+    exec ${pythonWithRequests}/bin/python3 -m scores.viewer "$@"
+  '';
 in
 {
   home.username = "balint";
@@ -68,15 +84,36 @@ in
     libnotify
     python3
     python3Packages.requests
-    (pkgs.writeScriptBin "wimbledon-scores" ''
-      #!${pythonWithRequests}/bin/python3
-      ${builtins.readFile ../scripts/wimbledon_scores.py}
+    # A szkriptek a teljes scripts/ könyvtárból futnak, így a közös 'scores' modul importálható.
+    (pkgs.writeShellScriptBin "wimbledon-scores" ''
+      exec ${pythonWithRequests}/bin/python3 ${scoresScripts}/wimbledon_scores.py "$@"
     '')
-    (pkgs.writeScriptBin "soccer-scores" ''
-      #!${pythonWithRequests}/bin/python3
-      ${builtins.readFile ../scripts/soccer_scores.py}
+    (pkgs.writeShellScriptBin "soccer-scores" ''
+      exec ${pythonWithRequests}/bin/python3 ${scoresScripts}/soccer_scores.py "$@"
     '')
+    # Közös belépési pont több sportághoz: scores soccer,tennis view
+    (pkgs.writeShellScriptBin "scores" ''
+      export PYTHONPATH=${scoresScripts}
+      exec ${pythonWithRequests}/bin/python3 -m scores "$@"
+    '')
+    scoresDaemon
+    scoresViewer
   ];
+
+  # Tartósan futó eredmény-szolgáltatás; a sáv gombjai Unix socketen kérdezik.
+  systemd.user.services.scores-daemon = {
+    Unit = {
+      Description = "Livescore eredmény-szolgáltatás a Qtile sávhoz";
+    };
+    Service = {
+      ExecStart = "${scoresDaemon}/bin/scores-daemon";
+      Restart = "on-failure";
+      RestartSec = 5;
+    };
+    Install = {
+      WantedBy = [ "default.target" ];
+    };
+  };
   
   fonts.fontconfig.enable = true;
 }
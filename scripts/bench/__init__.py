@@ -0,0 +1,5 @@
+#
+# bench – hálózat nélküli mérések a scores csővezetékhez.
+#
+# Futtatás a scripts könyvtárból: python3 -m bench.<modul>
+#
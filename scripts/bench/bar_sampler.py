@@ -0,0 +1,101 @@
+#
+# bar_sampler.py – a sáv rendszer-widgetjei: gyári időzítők és a közös mintavételező
+# (config/qtile/sampler.py) ébredései, CPU ideje és újrarajzolásai.
+#
+# Hamis órával szimulál --minutes percet, de a forrásokat ténylegesen olvassa ezen a gépen:
+# - gyári: widget.Memory és widget.Clock másodpercenként, widget.Battery percenként, egymástól
+#   független fázisban (a Clock az egész másodpercekre igazít); minden ébredés a saját
+#   forrását olvassa és a saját szövegét formázza,
+# - közös: TICK másodpercenként egy igazított ütem, egy olvasás, a kijelzők a kész értékekből.
+# Percenként: ébredések, a forrásolvasás és formázás CPU ideje, és hogy hány kiírt szöveg
+# változott (újrarajzolás; a Qtile a változatlan szöveget nem rajzolja újra).
+#
+# A Qtile eseményhurkának ébredésenkénti saját költsége (időzítő, hívás, esetleges rajzolás)
+# itt nem látszik; azt a sávban a QTILE_BAR_PROBE=1 mérés adja (config/qtile/system_widgets.py).
+#
+# Futtatás: cd scripts && python3 -m bench.bar_sampler [--minutes 60]
+#
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                "config", "qtile"))
+import sampler
+
+MEMORY_FORMAT = "󰍛 {MemUsed:.0f}{mm}"
+CLOCK_FORMAT = " %Y-%m-%d %a %I:%M %p"
+BATTERY_FORMAT = "{char} {percent:2.0%}"
+CHARS = {"Charging": "+", "Discharging": "-", "Full": "=", "unknown": "?"}
+
+# A gyári widgetek alapértelmezett frissítési ideje (s).
+STOCK = {"memory": 1.0, "clock": 1.0, "battery": 60.0}
+
+
+def _stock_work(name, now):
+    if name == "memory":
+        return sampler.memory_text({"memory": sampler.read_meminfo()}, MEMORY_FORMAT, "G")
+    if name == "clock":
+        return time.strftime(CLOCK_FORMAT, time.localtime(now))
+    # A gyári widget minden ébredéskor újra megkeresi és olvassa az akkumulátort.
+    battery = sampler.read_battery(sampler.find_battery())
+    return sampler.battery_text({"battery": battery}, BATTERY_FORMAT, CHARS)
+
+
+def stock(start, seconds, rng):
+    events = []
+    for name, interval in STOCK.items():
+        phase = 0.0 if name == "clock" else rng.uniform(0, interval)
+        at = start + phase
+        while at < start + seconds:
+            events.append((at, name))
+            at += interval
+    events.sort()
+    shown, redraws = {}, 0
+    cpu = time.process_time()
+    for at, name in events:
+        text = _stock_work(name, at)
+        if text != shown.get(name):
+            shown[name] = text
+            redraws += 1
+    cpu = time.process_time() - cpu
+    return len({at for at, _ in events}), cpu, redraws
+
+
+def shared(start, seconds):
+    shared_sampler = sampler.Sampler()
+    for render in (lambda v: sampler.memory_text(v, MEMORY_FORMAT, "G"),
+                   lambda v: sampler.clock_text(v, CLOCK_FORMAT),
+                   lambda v: sampler.battery_text(v, BATTERY_FORMAT, CHARS)):
+        shared_sampler.subscribe(render, lambda shown: None)
+    at = start + shared_sampler.delay(start)
+    cpu = time.process_time()
+    while at < start + seconds:
+        shared_sampler.sample(at)
+        at += shared_sampler.delay(at)
+    cpu = time.process_time() - cpu
+    return shared_sampler.ticks, cpu, shared_sampler.redraws
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gyári widget időzítők és a közös mintavételező")
+    parser.add_argument("--minutes", type=float, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    seconds = args.minutes * 60
+    start = time.time()
+
+    battery = sampler.find_battery() or "nincs (asztali gép / konténer)"
+    print(f"{args.minutes:g} perc, közös ütem: {sampler.TICK} s, akkumulátor: {battery}")
+    print(f"{'':<10}{'ébredés/perc':>14}{'CPU ms/perc':>14}{'CPU µs/ébredés':>16}{'rajzolás/perc':>15}")
+    for label, (wakeups, cpu, redraws) in (("gyári", stock(start, seconds, random.Random(args.seed))),
+                                           ("közös", shared(start, seconds))):
+        print(f"{label:<10}{wakeups / args.minutes:>14.1f}{cpu * 1000 / args.minutes:>14.2f}"
+              f"{cpu * 1e6 / max(1, wakeups):>16.1f}{redraws / args.minutes:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
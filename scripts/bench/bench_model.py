@@ -0,0 +1,154 @@
+#
+# bench_model.py – a típusos eseménymodell (scores/model.py) memória- és
+# áteresztőképesség-mérése egy többhetes archívum visszajátszásán.
+#
+# Összehasonlításként a korábbi, meccsenkénti dict-es normalizálás referencia-másolata
+# is lefut ugyanazon az adaton.
+#
+# Futtatás: cd scripts && python3 -m bench.bench_model [--days N]
+#
+
+import gc
+import time
+import argparse
+import tracemalloc
+from collections import defaultdict
+
+from scores import filters, pipeline, render, sports
+from bench import fixtures
+
+TENNIS_STATUSES = ['In Progress', 'NS', 'Finished', 'FT', 'Ret.', 'W.O.']
+
+
+def legacy_soccer(data):
+    """A dict-es modell referencia-másolata."""
+    events_by_tournament = defaultdict(list)
+    sorted_stages = sorted(data.get('Stages', []), key=lambda s: (s.get('Cnm', ''), s.get('Snm', '')))
+    for stage in sorted_stages:
+        if not filters.get().is_league(stage.get('Cnm', ''), stage.get('Snm', 'Unknown League')):
+            continue
+        tournament_name = f"{stage.get('Cnm', '')} - {stage.get('Snm', 'Unknown League')}"
+        for event in stage.get('Events', []):
+            event_info = {
+                'team1': event.get('T1', [{}])[0].get('Nm', 'Csapat 1'),
+                'team2': event.get('T2', [{}])[0].get('Nm', 'Csapat 2'),
+                'details': {}, 'winner': None,
+            }
+            status = event.get('Eps')
+            if status == 'NS':
+                event_info['details']['status'] = 'Upcoming'
+            else:
+                score1_str = event.get('Tr1', '0')
+                score2_str = event.get('Tr2', '0')
+                event_info['details']['score'] = f"{score1_str} - {score2_str}"
+                live_minute = event.get('Epr')
+                if live_minute and status not in ['FT', 'HT', 'AET', 'AP']:
+                    event_info['details']['status'] = f"{live_minute}'"
+                else:
+                    event_info['details']['status'] = status
+                if status == 'FT':
+                    try:
+                        score1, score2 = int(score1_str), int(score2_str)
+                        if score1 > score2: event_info['winner'] = 't1'
+                        elif score2 > score1: event_info['winner'] = 't2'
+                    except (ValueError, TypeError):
+                        pass
+            events_by_tournament[tournament_name].append(event_info)
+    return events_by_tournament
+
+
+def legacy_tennis(data):
+    events_by_tournament = defaultdict(list)
+    main_tours = ['ATP', 'WTA', 'Grand Slam']  # az eredeti lista-alapú ellenőrzés
+    for stage in data.get('Stages', []):
+        tour_category = stage.get('Cnm')
+        tournament_name = stage.get('Snm', 'Ismeretlen Torna')
+        for event in stage.get('Events', []):
+            status = event.get('Eps')
+            event_info = {
+                'player1': event.get('T1', [{}])[0].get('Nm', 'P1'),
+                'player2': event.get('T2', [{}])[0].get('Nm', 'P2'),
+                'details': {}, 'server': None, 'winner': None,
+                'id': event.get('Eid'),
+                'priority': 0 if tour_category in main_tours else 1,
+                'is_main_tour': tour_category in main_tours,
+            }
+            if status == 'In Progress':
+                p1_id = event.get('T1', [{}])[0].get('ID')
+                event_info['server'] = 'p1' if event.get('Esv') == p1_id else 'p2'
+                event_info['details']['sets'] = f"{event.get('Tr1', '0')}-{event.get('Tr2', '0')}"
+                if event.get('Tr1G') is not None and event.get('Tr2G') is not None:
+                    event_info['details']['game'] = f"{event.get('Tr1G')}-{event.get('Tr2G')}"
+            elif status == 'NS':
+                event_info['details']['status'] = 'Upcoming'
+            else:
+                event_info['details']['sets'] = f"{event.get('Tr1', '0')}-{event.get('Tr2', '0')}"
+            events_by_tournament[tournament_name].append(event_info)
+    return events_by_tournament
+
+
+def model_soccer(data):
+    return pipeline.process(sports.get('soccer'), data.get('Stages', []))
+
+
+def model_tennis(data):
+    return pipeline.process(sports.get('tennis'), data.get('Stages', []), TENNIS_STATUSES)
+
+
+def format_rate(formatter, history):
+    """A formázó áteresztőképessége: (idő ms-ban)."""
+    start = time.perf_counter()
+    for day in history:
+        formatter(day)
+    return (time.perf_counter() - start) * 1000
+
+
+def replay(normalize, payloads):
+    """(idő ms-ban, megtartott memória MiB-ban, események száma)
+
+    Az időt tracemalloc nélkül mérjük, mert az a foglalásokat erősen lassítja."""
+    gc.collect()
+    start = time.perf_counter()
+    history = [normalize(data) for data in payloads]
+    elapsed = time.perf_counter() - start
+    count = sum(len(events) for day in history for events in day.values())
+    del history
+
+    gc.collect()
+    tracemalloc.start()
+    history = [normalize(data) for data in payloads]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del history
+    return elapsed * 1000, current / (1024 * 1024), count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=28)
+    args = parser.parse_args()
+
+    soccer_days = [fixtures.synthetic_payload("soccer", stages=120, seed=d, top_only=True) for d in range(args.days)]
+    tennis_days = [fixtures.synthetic_payload("tennis", stages=200, seed=d) for d in range(args.days)]
+
+    print(f"{args.days} napos archívum visszajátszása")
+    print(f"{'sport':<8}{'modell':<10}{'idő (ms)':>10}{'memória (MiB)':>15}{'esemény':>9}{'esemény/s':>12}")
+    for sport, payloads, legacy, model in (
+        ("foci", soccer_days, legacy_soccer, model_soccer),
+        ("tenisz", tennis_days, legacy_tennis, model_tennis),
+    ):
+        for label, func in (("dict", legacy), ("Match", model)):
+            ms, mib, count = replay(func, payloads)
+            print(f"{sport:<8}{label:<10}{ms:>10.1f}{mib:>15.1f}{count:>9}{count / (ms / 1000):>12.0f}")
+
+    history = [model_soccer(data) for data in soccer_days]
+    ms = format_rate(sports.get('soccer').render, history)
+    print(f"\nfoci render ({args.days} nap):   {ms:.1f} ms")
+    history = [model_tennis(data) for data in tennis_days]
+    favorites = filters.compile_filters({}, ['Player 12'])
+    ms = format_rate(lambda day: render.tennis_block(day, render.ANSI, favorites.is_favorite), history)
+    print(f"tenisz render ({args.days} nap): {ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#
+# bench_stream.py – a fokozatos stage-feldolgozás (scores/stream.py) összevetése
+# a teljes response.json() dekódolással: futásidő és csúcsmemória.
+#
+# Futtatás: cd scripts && python3 -m bench.bench_stream [--fixtures KÖNYVTÁR] [--repeat N]
+#
+
+import time
+import json
+import argparse
+import tracemalloc
+
+from scores import filters, stream
+from bench import fixtures
+
+
+def full_decode(body, keep_stage):
+    data = json.loads(body)
+    return [s for s in data.get("Stages", []) if keep_stage(s.get("Cnm", ""), s.get("Snm", ""))]
+
+
+def streamed(body, keep_stage):
+    return list(stream.iter_stages(body, keep_stage=keep_stage))
+
+
+def full_decode_status(body, pattern_statuses):
+    data = json.loads(body)
+    return [s for s in data.get("Stages", [])
+            if any(e.get("Eps") in pattern_statuses for e in s.get("Events", []))]
+
+
+def streamed_status(body, pattern):
+    return list(stream.iter_stages(body, require=pattern))
+
+
+def measure(func, *args, repeat=5):
+    """(legjobb idő ms-ban, csúcsmemória MiB-ban, eredmény hossza)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / (1024 * 1024), len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixtures", help="rögzített payloadok könyvtára")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        cases = fixtures.load_bodies(args.fixtures)
+    else:
+        cases = [("soccer (szintetikus)", fixtures.synthetic_body("soccer", stages=800)),
+                 ("tennis (szintetikus)", fixtures.synthetic_body("tennis", stages=400))]
+
+    print(f"{'payload':<28}{'mód':<16}{'idő (ms)':>10}{'csúcs (MiB)':>13}{'stage':>7}")
+    for name, body in cases:
+        print(f"{name:<28}{'':<16}{len(body) / 1024:>9.0f}K")
+        if "tennis" in name:
+            statuses = ["NS"]
+            pattern = stream.status_pattern(statuses)
+            rows = [("json.loads", full_decode_status, statuses), ("stream", streamed_status, pattern)]
+        else:
+            keep = filters.get().is_league
+            rows = [("json.loads", full_decode, keep), ("stream", streamed, keep)]
+        for label, func, arg in rows:
+            ms, mib, count = measure(func, body, arg, repeat=args.repeat)
+            print(f"{'':<28}{label:<16}{ms:>10.1f}{mib:>13.1f}{count:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#
+# fake_notifications.py – hamis org.freedesktop.Notifications szerver a scores/notify.py-hoz.
+#
+# Egy (privát) session buson lefoglalja az értesítési szolgáltatás nevét, és minden
+# Notify hívást rögzít ahelyett, hogy megjelenítené. A 'burst' mód egy Grand Slam napi
+# kezdést játszik le (sok kedvenc meccs egyszerre indul), és összeveti a régi,
+# eseményenként küldött értesítéseket a Dispatcher összevont, korlátozott kimenetével.
+#
+# Futtatás (privát buson, hogy ne zavarja az asztalt):
+#   cd scripts && dbus-run-session -- python3 -m bench.fake_notifications burst --events 40
+#   cd scripts && dbus-run-session -- python3 -m bench.fake_notifications serve
+#
+
+import time
+import argparse
+import threading
+
+from jeepney import HeaderFields, MessageType, new_error, new_method_return
+from jeepney.bus_messages import message_bus
+from jeepney.io.blocking import open_dbus_connection
+
+from scores import notify
+
+BUS_NAME = "org.freedesktop.Notifications"
+
+
+class FakeNotificationServer(threading.Thread):
+    """A beérkező értesítéseket a 'received' listába gyűjti: (app, replaces, cím, szöveg)."""
+
+    def __init__(self, echo=False):
+        super().__init__(daemon=True)
+        self.echo = echo
+        self.received = []
+        self.running = True
+        self.ready = threading.Event()
+        self.conn = open_dbus_connection(bus="SESSION")
+
+    def _reply(self, msg):
+        member = msg.header.fields.get(HeaderFields.member)
+        if member == "Notify":
+            app, replaces, _icon, title, body = msg.body[:5]
+            self.received.append((app, replaces, title, body))
+            if self.echo:
+                print(f"[{len(self.received)}] {app}: {title} – {body!r}", flush=True)
+            return new_method_return(msg, "u", (replaces or len(self.received),))
+        if member == "GetServerInformation":
+            return new_method_return(msg, "ssss", ("fake-notifications", "scores", "1.0", "1.2"))
+        if member == "GetCapabilities":
+            return new_method_return(msg, "as", (["body"],))
+        return new_error(msg, "org.freedesktop.DBus.Error.UnknownMethod")
+
+    def run(self):
+        self.conn.send_and_get_reply(message_bus.RequestName(BUS_NAME))
+        self.ready.set()
+        while self.running:
+            try:
+                msg = self.conn.receive(timeout=0.1)
+            except TimeoutError:
+                continue
+            if msg.header.message_type is MessageType.method_call:
+                self.conn.send(self._reply(msg))
+
+    def stop(self):
+        self.running = False
+        self.join()
+        self.conn.close()
+
+
+def burst(events, updates, window):
+    """Sok egyszerre induló meccs, majd meccsenként több gyors változás."""
+    server = FakeNotificationServer()
+    server.start()
+    server.ready.wait()
+
+    def scenario(dispatcher, flush_each):
+        start = time.perf_counter()
+        for round_ in range(updates):
+            for eid in range(events):
+                title = "Meccs Kezdődött!" if round_ == 0 else "Brék!"
+                dispatcher.submit(eid, title, f"Player {eid} vs Player {eid + 1000}")
+                if flush_each:
+                    dispatcher.flush()
+        dispatcher.close()
+        return time.perf_counter() - start
+
+    results = []
+    for label, dispatcher, flush_each in (
+        ("eseményenként", notify.Dispatcher(window=0, per_event=0), True),
+        ("Dispatcher", notify.Dispatcher(window=window), False),
+    ):
+        before = len(server.received)
+        elapsed = scenario(dispatcher, flush_each)
+        results.append((label, len(server.received) - before, elapsed, dispatcher.sender.name))
+
+    server.stop()
+    print(f"{events} meccs × {updates} változás = {events * updates} esemény")
+    for label, count, elapsed, sender in results:
+        print(f"  {label:<14} {count:>4} értesítés  {elapsed * 1000:8.1f} ms  ({sender})")
+    if server.received:
+        print(f"Utolsó: {server.received[-1][2]!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hamis értesítés-szerver a scores értesítésekhez")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("serve", help="a beérkező értesítések kiírása")
+    p = sub.add_parser("burst", help="régi és összevont küldés összevetése")
+    p.add_argument("--events", type=int, default=40)
+    p.add_argument("--updates", type=int, default=3)
+    p.add_argument("--window", type=float, default=notify.COALESCE_WINDOW)
+    args = parser.parse_args()
+
+    if args.command == "burst":
+        burst(args.events, args.updates, args.window)
+        return
+    server = FakeNotificationServer(echo=True)
+    server.start()
+    server.ready.wait()
+    print(f"{BUS_NAME} lefoglalva, várakozás…", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
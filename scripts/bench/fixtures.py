@@ -0,0 +1,123 @@
+#
+# fixtures.py – livescore-szerű payloadok előállítása és betöltése mérésekhez.
+#
+# Ha van rögzített payload (lásd: python3 -m bench.fixtures record <könyvtár>), azt
+# használjuk; ha nincs, determinisztikus szintetikus payloadot generálunk, ami a valódi
+# végpontok szerkezetét és nagyságrendjét követi (sok száz stage, több ezer esemény).
+#
+
+import os
+import sys
+import json
+import random
+from datetime import datetime, timedelta
+
+SOCCER_TOP = [
+    ("England", "Premier League"), ("Spain", "LaLiga"), ("Germany", "Bundesliga"),
+    ("Italy", "Serie A"), ("France", "Ligue 1"), ("Europe", "Champions League"),
+    ("Europe", "Europa League"),
+]
+TENNIS_TOURS = ["ATP", "WTA", "Grand Slam", "Challenger", "ITF Men", "ITF Women"]
+SOCCER_STATUSES = ["NS", "FT", "HT", "AET", "AP", "1H", "2H"]
+TENNIS_STATUSES = ["NS", "In Progress", "Finished", "Ret.", "W.O."]
+
+
+def _team(rng, idx, prefix):
+    return {
+        "Nm": f"{prefix} {idx}", "ID": str(rng.randint(1000, 999999)),
+        "tbd": 0, "Img": f"enet/{rng.randint(1, 99999)}.png", "Gd": 1,
+        "Pids": {"8": [str(rng.randint(1, 10**6))], "1": [str(rng.randint(1, 10**6))]},
+        "CoNm": "Country", "CoId": str(rng.randint(1, 300)), "Abr": prefix[:3].upper(),
+    }
+
+
+def _event(rng, sport, eid):
+    t1 = _team(rng, rng.randint(1, 5000), "Player" if sport == "tennis" else "Team")
+    t2 = _team(rng, rng.randint(1, 5000), "Player" if sport == "tennis" else "Team")
+    statuses = TENNIS_STATUSES if sport == "tennis" else SOCCER_STATUSES
+    status = rng.choice(statuses)
+    event = {
+        "Eid": str(eid), "Pids": {"8": str(eid), "1": str(eid * 3)},
+        "Sids": {"8": str(eid), "1": str(eid * 7)},
+        "Tr1": str(rng.randint(0, 3)), "Tr2": str(rng.randint(0, 3)),
+        "Trh1": str(rng.randint(0, 2)), "Trh2": str(rng.randint(0, 2)),
+        "T1": [t1], "T2": [t2], "Eps": status, "Esid": rng.randint(1, 10),
+        "Epr": rng.choice([0, 1, 2]), "Ecov": 0, "Ern": rng.randint(1, 38),
+        "Esd": int(datetime(2024, 7, 1, rng.randint(9, 22), rng.choice([0, 30])).strftime("%Y%m%d%H%M%S")),
+        "LuUT": rng.randint(10**13, 10**14), "Eds": 0, "Edf": 0, "Eact": 0,
+        "EO": 1, "EOX": 1, "Spid": 1, "Pid": 8,
+    }
+    if sport == "tennis":
+        event["Esv"] = rng.choice([t1["ID"], t2["ID"]])
+        if status == "In Progress":
+            event["Tr1G"] = str(rng.randint(0, 6))
+            event["Tr2G"] = str(rng.randint(0, 6))
+        if status in ("Finished", "Ret.", "W.O."):
+            event["Ewt"] = rng.choice([t1["ID"], t2["ID"]])
+    elif status in ("1H", "2H"):
+        event["Epr"] = f"{rng.randint(1, 90)}"
+    return event
+
+
+def synthetic_payload(sport="soccer", stages=600, events_per_stage=8, seed=0, top_only=False):
+    """Determinisztikus, valósághű szerkezetű payload (dict).
+    top_only: focinál minden stage a figyelt top ligák egyike (archívum-mérésekhez)."""
+    rng = random.Random(f"{sport}-{seed}")
+    result = []
+    eid = 10**6 * (seed + 1)
+    for idx in range(stages):
+        if sport == "soccer" and (top_only or idx < len(SOCCER_TOP)):
+            cnm, snm = SOCCER_TOP[idx % len(SOCCER_TOP)]
+        elif sport == "tennis":
+            cnm, snm = rng.choice(TENNIS_TOURS), f"Tournament {idx}"
+        else:
+            cnm, snm = f"Country {idx}", f"League {idx}"
+        events = []
+        for _ in range(rng.randint(max(1, events_per_stage // 2), events_per_stage * 3 // 2)):
+            eid += 1
+            events.append(_event(rng, sport, eid))
+        result.append({
+            "Sid": str(idx), "Snm": snm, "Scd": snm.lower().replace(" ", "-"),
+            "Cid": str(idx), "Cnm": cnm, "Csnm": cnm, "Ccd": cnm.lower().replace(" ", "-"),
+            "Scu": 0, "Chi": 0, "Shi": 0, "Sdn": snm, "Events": events,
+        })
+    return {"Stages": result}
+
+
+def synthetic_body(sport="soccer", **kwargs):
+    """Mint a synthetic_payload(), de a nyers JSON bájtokat adja vissza."""
+    return json.dumps(synthetic_payload(sport, **kwargs), separators=(",", ":")).encode("utf-8")
+
+
+def load_bodies(directory, prefix=""):
+    """Egy könyvtár rögzített .json payloadjai név szerint rendezve: [(név, bájtok)]."""
+    bodies = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json") and name.startswith(prefix):
+            with open(os.path.join(directory, name), "rb") as f:
+                bodies.append((name, f.read()))
+    return bodies
+
+
+def record(directory, days=7):
+    """Rögzíti a valódi API payloadjait a megadott könyvtárba (hálózatot igényel)."""
+    from scores import http_client
+    os.makedirs(directory, exist_ok=True)
+    targets = [("tennis-live.json", http_client.live_url("tennis"))]
+    for i in range(days):
+        day = (datetime.now() - timedelta(days=i)).strftime("%Y%m%d")
+        targets.append((f"soccer-{day}.json", http_client.date_url("soccer", day)))
+        targets.append((f"tennis-{day}.json", http_client.date_url("tennis", day)))
+    for name, url in targets:
+        body = http_client.fetch(url, user_agent="scores-recorder/1.0")
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(body)
+        print(f"{name}: {len(body)} bájt")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "record":
+        record(sys.argv[2])
+    else:
+        print("Használat: python3 -m bench.fixtures record <könyvtár>")
+        sys.exit(1)
@@ -0,0 +1,226 @@
+#
+# mock_server.py – helyi livescore helyettesítő terheléses és késleltetési tesztekhez.
+#
+# A valódi API útvonalait szolgálja ki (/.../date/<sport>/<YYYYMMDD>/0 és
+# /.../live/<sport>/0) rögzített payloadokból (bench.fixtures record), vagy ha nincs
+# ilyen, determinisztikus szintetikus adatból. Beállítható:
+# - késleltetés és szórás,
+# - hibák (5xx) és "lefagyó" kérések aránya,
+# - ETag / Last-Modified validátorok és 304 válaszok,
+# - lassan változó élő eredmények (gamek, szettek, adogató, meccsek kezdése/vége).
+#
+# Futtatás:
+#   cd scripts && python3 -m bench.mock_server --port 8765 --latency 200 --error-rate 0.1 --mutate 5
+#   LIVESCORE_API_BASE=http://127.0.0.1:8765/v1/api/app soccer-scores full
+# Statisztika: GET /__stats
+#
+
+import re
+import json
+import gzip
+import time
+import random
+import hashlib
+import argparse
+import threading
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from bench import fixtures
+
+_DATE = re.compile(r"/date/(\w+)/(\d{8})/")
+_LIVE = re.compile(r"/live/(\w+)/")
+
+
+class Payloads:
+    """Az útvonalakhoz tartozó payloadok; az élő payload igény szerint változik."""
+
+    def __init__(self, directory=None, mutate_every=0.0, seed=0):
+        self.recorded = dict(fixtures.load_bodies(directory)) if directory else {}
+        self.mutate_every = mutate_every
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.bodies = {}          # útvonal kulcs -> (bájtok, módosítás ideje)
+        self.live = {}            # sport -> dict payload
+        self.last_mutation = {}
+
+    def _date_body(self, sport, day):
+        name = f"{sport}-{day}.json"
+        if name in self.recorded:
+            return self.recorded[name]
+        return fixtures.synthetic_body(sport, stages=400 if sport == "soccer" else 200, seed=int(day))
+
+    def _live_payload(self, sport):
+        name = f"{sport}-live.json"
+        if name in self.recorded:
+            return json.loads(self.recorded[name])
+        data = fixtures.synthetic_payload(sport, stages=40, seed=1)
+        for stage in data["Stages"]:
+            stage["Events"] = [e for e in stage["Events"] if e["Eps"] in ("In Progress", "1H", "2H", "HT")]
+        return data
+
+    def _mutate(self, data):
+        """Egy lépés a "lassan változó" élő eredményekben."""
+        rng = self.rng
+        for stage in data["Stages"]:
+            for event in stage["Events"]:
+                if rng.random() > 0.3:
+                    continue
+                if "Tr1G" in event:
+                    side = rng.choice(("1", "2"))
+                    games = int(event[f"Tr{side}G"]) + 1
+                    if games >= 6:
+                        event[f"Tr{side}"] = str(int(event[f"Tr{side}"]) + 1)
+                        event["Tr1G"], event["Tr2G"] = "0", "0"
+                    else:
+                        event[f"Tr{side}G"] = str(games)
+                    event["Esv"] = event["T2"][0]["ID"] if event["Esv"] == event["T1"][0]["ID"] else event["T1"][0]["ID"]
+                else:
+                    side = rng.choice(("1", "2"))
+                    event[f"Tr{side}"] = str(int(event.get(f"Tr{side}") or 0) + 1)
+            # Néha egy meccs véget ér.
+            if stage["Events"] and rng.random() < 0.05:
+                stage["Events"].pop(rng.randrange(len(stage["Events"])))
+
+    def get(self, path):
+        """(bájtok, módosítás ideje) vagy None, ha ismeretlen az útvonal."""
+        match = _DATE.search(path)
+        if match:
+            key = ("date",) + match.groups()
+            with self.lock:
+                if key not in self.bodies:
+                    self.bodies[key] = (self._date_body(*match.groups()), time.time())
+                return self.bodies[key]
+        match = _LIVE.search(path)
+        if match:
+            sport = match.group(1)
+            key = ("live", sport)
+            with self.lock:
+                now = time.time()
+                if sport not in self.live:
+                    self.live[sport] = self._live_payload(sport)
+                    self.last_mutation[sport] = now
+                    self.bodies[key] = (json.dumps(self.live[sport]).encode("utf-8"), now)
+                elif self.mutate_every and now - self.last_mutation[sport] >= self.mutate_every:
+                    self._mutate(self.live[sport])
+                    self.last_mutation[sport] = now
+                    self.bodies[key] = (json.dumps(self.live[sport]).encode("utf-8"), now)
+                return self.bodies[key]
+        return None
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        if self.server.verbose:
+            super().log_message(*args)
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        if self.path == "/__stats":
+            self._send(200, json.dumps(server.stats).encode("utf-8"), [("Content-Type", "application/json")])
+            return
+        server.count("requests")
+
+        delay = server.latency + server.rng.uniform(-server.jitter, server.jitter)
+        if server.rng.random() < server.hang_rate:
+            delay = server.hang_seconds
+            server.count("hangs")
+        if delay > 0:
+            time.sleep(delay)
+        if server.rng.random() < server.error_rate:
+            server.count("errors")
+            self._send(server.rng.choice((500, 502, 503)), b"mock error")
+            return
+
+        entry = server.payloads.get(self.path)
+        if entry is None:
+            server.count("not_found")
+            self._send(404, b"not found")
+            return
+        body, modified = entry
+        headers = [("Content-Type", "application/json")]
+        if server.validators:
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()
+            last_modified = formatdate(modified, usegmt=True)
+            headers += [("ETag", etag), ("Last-Modified", last_modified)]
+            if self.headers.get("If-None-Match") == etag or (
+                    not self.headers.get("If-None-Match") and self.headers.get("If-Modified-Since") == last_modified):
+                server.count("not_modified")
+                self._send(304, b"", headers)
+                return
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=5)
+            headers.append(("Content-Encoding", "gzip"))
+        server.count("ok")
+        server.count("bytes", len(body))
+        self._send(200, body, headers)
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, payloads, latency=0.0, jitter=0.0, error_rate=0.0,
+                 hang_rate=0.0, hang_seconds=30.0, validators=True, verbose=False, seed=0):
+        super().__init__(address, MockHandler)
+        self.payloads = payloads
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.validators = validators
+        self.verbose = verbose
+        self.rng = random.Random(seed)
+        self.stats = {"requests": 0, "ok": 0, "not_modified": 0, "errors": 0,
+                      "hangs": 0, "not_found": 0, "bytes": 0}
+        self._stats_lock = threading.Lock()
+
+    def count(self, key, value=1):
+        with self._stats_lock:
+            self.stats[key] += value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Helyi livescore helyettesítő szerver.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", help="rögzített payloadok könyvtára")
+    parser.add_argument("--latency", type=float, default=0.0, help="késleltetés (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="késleltetés szórása (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="5xx válaszok aránya (0-1)")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="lefagyó kérések aránya (0-1)")
+    parser.add_argument("--hang-seconds", type=float, default=30.0)
+    parser.add_argument("--no-validators", action="store_true", help="nincs ETag/Last-Modified és 304")
+    parser.add_argument("--mutate", type=float, default=0.0,
+                        help="az élő eredmények ennyi másodpercenként változnak (0 = soha)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = MockServer(
+        (args.host, args.port), Payloads(args.fixtures, mutate_every=args.mutate),
+        latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate,
+        hang_rate=args.hang_rate, hang_seconds=args.hang_seconds,
+        validators=not args.no_validators, verbose=args.verbose,
+    )
+    print(f"LIVESCORE_API_BASE=http://{args.host}:{args.port}/v1/api/app")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
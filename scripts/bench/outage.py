@@ -0,0 +1,135 @@
+#
+# outage.py – kattintási késleltetés livescore kiesés alatt (scores/resilience.py).
+#
+# Egy helyi mock szervert (bench/mock_server.py) előbb egészségesen használunk (a
+# gyorsítótár és az archívum feltöltődik), a bejegyzéseket egy órával "öregítjük", majd a
+# szerver hibázni kezd, és a sáv kattintásainak megfelelő parancsokat friss folyamatokban,
+# egymás után többször lefuttatjuk. Kattintásonként: medián és legrosszabb idő, hány
+# kimenet jött elavult adatból / hibaüzenettel, és hány kérés érte el a szervert a kiesés
+# alatt (a megszakító ezt fogja vissza).
+#
+# Hibamódok: hang (a kérés nem válaszol), error (5xx), slow (8 s késleltetés).
+#
+# Futtatás:
+#   cd scripts && python3 -m bench.outage [--mode hang|error|slow] [--clicks 3] [--baseline HEAD~1]
+#
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+import threading
+
+from bench.mock_server import MockServer, Payloads
+from bench.startup import SCRIPTS_DIR, export_ref, isolated_env
+
+CLICKS = [
+    ("soccer view", "soccer_scores.py", ["view"]),
+    ("soccer full", "soccer_scores.py", ["full"]),
+    ("soccer full yesterday", "soccer_scores.py", ["full", "yesterday"]),
+    ("tennis view", "wimbledon_scores.py", ["view"]),
+    ("tennis full", "wimbledon_scores.py", ["full"]),
+]
+
+MODES = {
+    "hang": {"hang_rate": 1.0},
+    "error": {"error_rate": 1.0},
+    "slow": {"latency": 8.0},
+}
+HEALTHY = {"hang_rate": 0.0, "error_rate": 0.0, "latency": 0.0}
+
+
+def _configure(server, settings):
+    for key, value in settings.items():
+        setattr(server, key, value)
+
+
+def age_cache(cache_dir, seconds):
+    """A gyorsítótár bejegyzéseit régebbinek jelöli, hogy a kattintások a hálózathoz forduljanak."""
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".cache"):
+            continue
+        path = os.path.join(cache_dir, name)
+        with open(path, "rb") as f:
+            header, _, body = f.read().partition(b"\n")
+        meta = json.loads(header)
+        meta["fetched"] -= seconds
+        with open(path, "wb") as f:
+            f.write(json.dumps(meta).encode("utf-8") + b"\n" + body)
+
+
+def _click(cwd, env, script, args):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, script, *args], cwd=cwd, env=env,
+                            capture_output=True, text=True, timeout=300)
+    elapsed = (time.perf_counter() - start) * 1000
+    output = result.stdout
+    try:
+        view = json.loads(output)
+    except ValueError:
+        view = {}
+    if "Elavult" in output or view.get("stale"):
+        kind = "stale"
+    elif "Hiba" in output or result.returncode:
+        kind = "error"
+    else:
+        kind = "ok"
+    return elapsed, kind
+
+
+def scenario(server, cwd, env, mode, clicks):
+    _configure(server, HEALTHY)
+    for _, script, args in CLICKS:
+        _click(cwd, env, script, args)
+    age_cache(os.path.join(env["XDG_CACHE_HOME"], "scores"), 3600)
+
+    _configure(server, MODES[mode])
+    before = server.stats["requests"]
+    results = {label: [] for label, _, _ in CLICKS}
+    for _ in range(clicks):
+        for label, script, args in CLICKS:
+            results[label].append(_click(cwd, env, script, args))
+    return results, server.stats["requests"] - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kattintási késleltetés livescore kiesés alatt")
+    parser.add_argument("--mode", choices=sorted(MODES), default="hang")
+    parser.add_argument("--clicks", type=int, default=3, help="ismétlés kattintásonként")
+    parser.add_argument("--baseline", help="összevetés egy korábbi committal (git ref)")
+    args = parser.parse_args()
+
+    server = MockServer(("127.0.0.1", 0), Payloads(None), hang_seconds=30.0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = f"http://127.0.0.1:{server.server_address[1]}/v1/api/app"
+    work = tempfile.mkdtemp(prefix="scores-outage-")
+    try:
+        variants = [("jelenlegi", SCRIPTS_DIR)]
+        if args.baseline:
+            variants.append((args.baseline, export_ref(args.baseline, tempfile.mkdtemp(dir=work))))
+
+        print(f"Hibamód: {args.mode}, {args.clicks} kattintás parancsonként (ms; elavult/hiba/ok)")
+        for i, (label, cwd) in enumerate(variants):
+            env = isolated_env(os.path.join(work, str(i)), api_base, SCORES_NO_CACHE="")
+            results, requests = scenario(server, cwd, env, args.mode, args.clicks)
+            print(f"\n{label}: {requests} kérés érte el a szervert a kiesés alatt")
+            print(f"  {'kattintás':<24}{'medián':>10}{'max':>10}   elavult/hiba/ok")
+            for click, samples in results.items():
+                times = [t for t, _ in samples]
+                kinds = [k for _, k in samples]
+                print(f"  {click:<24}{statistics.median(times):>10.0f}{max(times):>10.0f}   "
+                      f"{kinds.count('stale')}/{kinds.count('error')}/{kinds.count('ok')}", flush=True)
+    finally:
+        _configure(server, HEALTHY)
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
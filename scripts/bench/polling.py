@@ -0,0 +1,125 @@
+#
+# polling.py – fix és adaptív (scores/schedule.py) check-notify ütem egy szimulált napon.
+#
+# Hálózat nélkül, hamis órával: a kedvencek meccseinek kiírt kezdése ('Esd'), valódi
+# kezdése és hossza adott, a zajló meccsen néhány percenként változik az állás. Ütemenként:
+# lekérdezések és HTTP kérések száma naponta (az élő payload minden lekérdezésnél; az
+# adaptív tervezéshez a dátum payload, ha a gyorsítótárban már lejárt), és hogy egy
+# változásról, illetve egy meccs kezdéséről mennyi idő múlva tudunk (értesítési késés).
+#
+# Futtatás: cd scripts && python3 -m bench.polling [--fixed 60] [--change-every 240]
+#
+
+import random
+import argparse
+import statistics
+
+from scores import cache, schedule
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Napok: (név, [(kiírt kezdés, késés a kiírthoz képest, hossz) másodpercben]).
+SCENARIOS = [
+    ("két kedvenc meccs", [(11 * HOUR, 20 * 60, 2 * HOUR + 10 * 60),
+                           (16 * HOUR + 30 * 60, 45 * 60, HOUR + 40 * 60)]),
+    ("Grand Slam nap", [(10 * HOUR, 0, 3 * HOUR), (12 * HOUR, 70 * 60, 2 * HOUR),
+                        (15 * HOUR, 10 * 60, 4 * HOUR), (19 * HOUR, 30 * 60, 2 * HOUR + 30 * 60)]),
+    ("nincs kedvenc meccs", []),
+]
+# A következő nap első kedvenc meccse (az éjszakai pihenőhöz).
+NEXT_DAY_START = DAY + 11 * HOUR
+
+
+def _changes(matches, every, rng):
+    """A figyelendő események időpontjai: kezdés, állásváltozások (átlagosan every
+    másodpercenként), befejezés."""
+    times = []
+    for planned, delay, length in matches:
+        start = planned + delay
+        times.append(start)
+        change = start + rng.expovariate(1 / every)
+        while change < start + length:
+            times.append(change)
+            change += rng.expovariate(1 / every)
+        times.append(start + length)
+    return sorted(times)
+
+
+def _state(matches, now):
+    """(zajló meccsek száma, a még el nem kezdődött meccsek kiírt kezdése)."""
+    live, starts = 0, []
+    for planned, delay, length in matches:
+        start = planned + delay
+        if start <= now < start + length:
+            live += 1
+        elif now < start:
+            starts.append(planned)
+    return live, starts
+
+
+def simulate(matches, fixed):
+    """[lekérdezés időpontja], HTTP kérések száma; fixed=None esetén adaptív ütem."""
+    polls, requests = [], 0
+    date_fetched = {}
+    now = 0
+    while now < DAY:
+        polls.append(now)
+        requests += 1  # élő payload (check-notify)
+        if fixed:
+            now += fixed
+            continue
+        live, starts = _state(matches, now)
+        later_starts = None
+        if not live:
+            # A tervezés a mai dátum payloadot kéri (a gyorsítótár TTL-jén belül ingyen).
+            if now - date_fetched.get("today", -DAY) > cache.TTL_TODAY:
+                date_fetched["today"] = now
+                requests += 1
+            if not [s for s in starts if s > now - schedule.OVERDUE_WINDOW]:
+                if now - date_fetched.get("tomorrow", -DAY) > cache.TTL_TODAY:
+                    date_fetched["tomorrow"] = now
+                    requests += 1
+                later_starts = [NEXT_DAY_START]
+        now += schedule.next_poll(live, starts, later_starts, now).delay
+    return polls, requests
+
+
+def _latencies(polls, changes):
+    result = []
+    index = 0
+    for change in changes:
+        while index < len(polls) and polls[index] < change:
+            index += 1
+        if index < len(polls):
+            result.append(polls[index] - change)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fix és adaptív lekérdezési ütem egy szimulált napon")
+    parser.add_argument("--fixed", type=int, default=60, help="a fix ütem (s)")
+    parser.add_argument("--change-every", type=int, default=240, help="állásváltozás átlagosan ennyi mp-enként")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{'nap':<22}{'ütem':<10}{'lekérdezés':>12}{'HTTP kérés':>12}"
+          f"{'késés p50':>11}{'késés max':>11}{'kezdés max':>12}")
+    for name, matches in SCENARIOS:
+        # A kezdések nem esnek egész percre.
+        matches = [(planned, delay + rng.randrange(60), length) for planned, delay, length in matches]
+        changes = _changes(matches, args.change_every, rng)
+        starts = [planned + delay for planned, delay, _ in matches]
+        for label, fixed in ((f"fix {args.fixed} s", args.fixed), ("adaptív", None)):
+            polls, requests = simulate(matches, fixed)
+            latency = _latencies(polls, changes)
+            start_latency = _latencies(polls, starts)
+            p50 = f"{statistics.median(latency):.0f} s" if latency else "-"
+            worst = f"{max(latency):.0f} s" if latency else "-"
+            start_worst = f"{max(start_latency):.0f} s" if start_latency else "-"
+            print(f"{name:<22}{label:<10}{len(polls):>12}{requests:>12}{p50:>11}{worst:>11}{start_worst:>12}")
+
+
+if __name__ == "__main__":
+    main()
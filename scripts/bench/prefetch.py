@@ -0,0 +1,119 @@
+#
+# prefetch.py – a "tegnap" kattintás késleltetése előtöltéssel és nélküle (scores/prefetch.py).
+#
+# Egy helyi mock szerver (bench/mock_server.py, hálózati késleltetéssel) ellen, izolált
+# állapot könyvtárakkal elindítja a daemont előtöltés nélkül (SCORES_NO_PREFETCH=1), illetve
+# előtöltéssel, és a sáv widgethez hasonlóan közvetlenül a daemon socketjén kéri a
+# 'full yesterday' nézetet. Sportáganként: az első és a második kattintás ideje, a
+# kattintás alatt a szerverhez menő kérések száma, és a daemon 'prefetch' jelentése
+# (találati arány, az előtöltésre költött kérések és bájtok).
+#
+# Az előtöltő éjfél után a tegnapi nap véglegessé válásáig (prefetch.yesterday_at) nem fut;
+# ilyenkor a mérés ezt jelzi.
+#
+# Futtatás: cd scripts && python3 -m bench.prefetch [--latency 0.1]
+#
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+import threading
+from datetime import datetime
+
+from scores import daemon, prefetch
+from bench.mock_server import MockServer, Payloads
+from bench.startup import SCRIPTS_DIR, isolated_env
+
+SPORTS = ("soccer", "tennis")
+CLICK = ["full", "yesterday"]
+
+
+def _start_daemon(env):
+    process = subprocess.Popen([sys.executable, "-m", "scores.daemon"], cwd=SCRIPTS_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    socket_path = os.path.join(env["XDG_RUNTIME_DIR"], "scores.sock")
+    deadline = time.monotonic() + 10
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    daemon.SOCKET_PATH = socket_path
+    return process
+
+
+def _request(sport, args):
+    reply = daemon.request(sport, args, timeout=120)
+    if not reply or not reply.get("ok"):
+        raise RuntimeError(f"{sport} {' '.join(args)}: {reply}")
+    return reply["output"]
+
+
+def _wait_for_prefetch(limit=120):
+    """Megvárja, amíg a sportágak 'yesterday' munkája lefutott; False, ha még nem
+    esedékes, vagy nem fut le időben."""
+    if not prefetch.is_due(prefetch.yesterday_at, datetime.now()):
+        return False
+    deadline = time.monotonic() + limit
+    while time.monotonic() < deadline:
+        lines = [line.split() for sport in SPORTS for line in _request(sport, ["prefetch"]).splitlines()]
+        if not any(words[0] == "yesterday" and "nem futott" in " ".join(words) for words in lines if words):
+            return True
+        time.sleep(0.2)
+    return False
+
+
+def _click(server, sport):
+    before = server.stats["requests"]
+    start = time.perf_counter()
+    _request(sport, CLICK)
+    return (time.perf_counter() - start) * 1000, server.stats["requests"] - before
+
+
+def scenario(server, work, api_base, enabled):
+    env = isolated_env(os.path.join(work, "on" if enabled else "off"), api_base,
+                       SCORES_NO_CACHE="", SCORES_NO_DAEMON="",
+                       SCORES_NO_PREFETCH="" if enabled else "1")
+    process = _start_daemon(env)
+    try:
+        ready = _wait_for_prefetch() if enabled else True
+        results = {sport: [_click(server, sport), _click(server, sport)] for sport in SPORTS}
+        reports = [_request(sport, ["prefetch"]) for sport in SPORTS] if enabled else []
+        return ready, results, reports
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A 'tegnap' kattintás előtöltéssel és nélküle")
+    parser.add_argument("--latency", type=float, default=0.1, help="a mock szerver késleltetése (s)")
+    args = parser.parse_args()
+
+    server = MockServer(("127.0.0.1", 0), Payloads(None), latency=args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = f"http://127.0.0.1:{server.server_address[1]}/v1/api/app"
+    work = tempfile.mkdtemp(prefix="scores-prefetch-")
+    try:
+        print(f"'full yesterday' a daemonon át, {args.latency * 1000:.0f} ms szerver késleltetéssel")
+        print(f"{'':<18}{'sport':<8}{'1. kattintás':>16}{'2. kattintás':>16}")
+        for label, enabled in (("előtöltés nélkül", False), ("előtöltéssel", True)):
+            ready, results, reports = scenario(server, work, api_base, enabled)
+            if not ready:
+                print(f"{label}: az előtöltő nem futott le (a tegnapi nap véglegessé válásáig nem fut)")
+                continue
+            for sport, clicks in results.items():
+                cells = "".join(f"{ms:>9.1f} ms/{requests:>2}k" for ms, requests in clicks)
+                print(f"{label:<18}{sport:<8}{cells}")
+            for report in reports:
+                print("  " + report.replace("\n", "\n  "))
+        print("(k: a kattintás alatt a szerverhez menő kérések)")
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
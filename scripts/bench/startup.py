@@ -0,0 +1,169 @@
+#
+# startup.py – a parancssori belépési pontok hidegindítása és import-profilja.
+#
+# 'cold': a soccer-scores, wimbledon-scores és check-notify futások falióra-ideje friss
+#   folyamatokban, egy helyi mock szerver (bench/mock_server.py) ellen, daemon és
+#   gyorsítótár nélkül, izolált állapot könyvtárakkal. Viszonyítási alapok: az üres
+#   interpreter (python3 -c pass), ugyanez requests klienssel (SCORES_HTTP=requests),
+#   és opcionálisan egy korábbi commit (--baseline REF, git archive-ból kicsomagolva).
+# 'importtime': -X importtime jelentés egy parancsról: a legdrágább modulok kumulatív
+#   és saját ideje, valamint a scores csomag moduljai.
+#
+# Futtatás:
+#   cd scripts && python3 -m bench.startup cold [--runs 15] [--baseline HEAD~1]
+#   cd scripts && python3 -m bench.startup importtime [--top 15] soccer full
+#
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+import threading
+
+from bench.mock_server import MockServer, Payloads
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (címke, szkript, argumentumok)
+CASES = [
+    ("soccer-scores", "soccer_scores.py", []),
+    ("soccer-scores view", "soccer_scores.py", ["view"]),
+    ("soccer-scores full", "soccer_scores.py", ["full"]),
+    ("wimbledon-scores", "wimbledon_scores.py", []),
+    ("wimbledon-scores view", "wimbledon_scores.py", ["view"]),
+    ("wimbledon-scores full", "wimbledon_scores.py", ["full"]),
+    ("check-notify", "wimbledon_scores.py", ["check-notify"]),
+]
+
+
+def isolated_env(base_dir, api_base, **extra):
+    """Izolált környezet: saját HOME (egy nem létező kedvenccel, hogy a check-notify a
+    teljes utat végigjárja, de értesítés ne menjen ki), állapot és adat könyvtár."""
+    config_dir = os.path.join(base_dir, "home", ".config", "qtile", "scripts")
+    os.makedirs(config_dir, exist_ok=True)
+    os.makedirs(os.path.join(base_dir, "run"), exist_ok=True)
+    with open(os.path.join(config_dir, "tennis_favorites.json"), "w") as f:
+        json.dump(["Nincs Ilyen Játékos"], f)
+    env = dict(os.environ)
+    env.update(
+        HOME=os.path.join(base_dir, "home"),
+        XDG_STATE_HOME=os.path.join(base_dir, "state"),
+        XDG_DATA_HOME=os.path.join(base_dir, "data"),
+        XDG_CACHE_HOME=os.path.join(base_dir, "cache"),
+        XDG_RUNTIME_DIR=os.path.join(base_dir, "run"),
+        LIVESCORE_API_BASE=api_base,
+        SCORES_NO_DAEMON="1",
+        SCORES_NO_CACHE="1",
+        DBUS_SESSION_BUS_ADDRESS="disabled:",
+    )
+    env.pop("SCORES_HTTP", None)
+    env.update(extra)
+    return env
+
+
+def _time(command, cwd, env, runs):
+    """[ms] futásonként; az első (bemelegítő) futást eldobjuk."""
+    samples = []
+    for i in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+        if i:
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def export_ref(ref, target):
+    """A scripts könyvtár egy korábbi commitból (git archive)."""
+    archive = subprocess.run(["git", "archive", ref, "."], cwd=SCRIPTS_DIR,
+                             capture_output=True, check=True).stdout
+    subprocess.run(["tar", "-x", "-C", target], input=archive, check=True)
+    return target
+
+
+def cold(runs, baseline):
+    server = MockServer(("127.0.0.1", 0), Payloads(None))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = f"http://127.0.0.1:{server.server_address[1]}/v1/api/app"
+    work = tempfile.mkdtemp(prefix="scores-startup-")
+    try:
+        variants = [("stdlib", SCRIPTS_DIR, {}), ("requests", SCRIPTS_DIR, {"SCORES_HTTP": "requests"})]
+        if baseline:
+            variants.append((baseline, export_ref(baseline, tempfile.mkdtemp(dir=work)), {}))
+
+        floor = _time([sys.executable, "-c", "pass"], SCRIPTS_DIR, dict(os.environ), runs)
+        print(f"{runs} futás esetenként, medián / min (ms); üres interpreter: "
+              f"{statistics.median(floor):.1f} / {min(floor):.1f}")
+        print(f"{'eset':<24}" + "".join(f"{label:>20}" for label, _, _ in variants))
+        for label, script, args in CASES:
+            row = f"{label:<24}"
+            for i, (_, cwd, extra) in enumerate(variants):
+                env = isolated_env(os.path.join(work, str(i)), api_base, **extra)
+                samples = _time([sys.executable, script, *args], cwd, env, runs)
+                row += f"{statistics.median(samples):>12.1f} / {min(samples):>5.1f}"
+            print(row, flush=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def parse_importtime(stderr):
+    """[(név, mélység, saját µs, kumulatív µs)] a -X importtime kimenetéből."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        modules.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return modules
+
+
+def importtime(args, top):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "scores", *args],
+                            cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    wall = (time.perf_counter() - start) * 1000
+    modules = parse_importtime(result.stderr)
+    roots = [m for m in modules if m[1] == 0]
+    total = sum(m[3] for m in roots) / 1000
+
+    print(f"python3 -m scores {' '.join(args)}: {wall:.1f} ms falióra, ebből import {total:.1f} ms "
+          f"({len(modules)} modul)")
+    print("\nLegdrágább közvetlen importok (kumulatív):")
+    for name, _, self_us, cumulative_us in sorted(roots, key=lambda m: -m[3])[:top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+    print("\nLegnagyobb saját idő:")
+    for name, _, self_us, _ in sorted(modules, key=lambda m: -m[2])[:top]:
+        print(f"  {self_us / 1000:>8.1f} ms  {name}")
+    print("\nA scores csomag moduljai (kumulatív):")
+    for name, _, _, cumulative_us in modules:
+        if name == "scores" or name.startswith("scores."):
+            print(f"  {cumulative_us / 1000:>8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A scores parancsok indulási ideje")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("cold", help="hidegindítás mérése a helyi mock szerver ellen")
+    p.add_argument("--runs", type=int, default=10)
+    p.add_argument("--baseline", help="összevetés egy korábbi committal (git ref)")
+    p = sub.add_parser("importtime", help="-X importtime jelentés egy parancsról")
+    p.add_argument("--top", type=int, default=12)
+    p.add_argument("args", nargs=argparse.REMAINDER, help="pl. soccer full")
+    args = parser.parse_args()
+
+    if args.command == "cold":
+        cold(args.runs, args.baseline)
+    else:
+        importtime(args.args or ["soccer"], args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#
+# suite.py – hálózat nélküli mérőkészlet a scores csővezeték forró pontjaira.
+#
+# Rögzített (python3 -m bench.fixtures record <könyvtár>) vagy szintetikus payloadokat
+# játszik vissza, és a lépéseket külön méri:
+#   decode     – nyers bájtok -> stage-ek (scores/stream.py)
+#   normalize  – szűrés és normalizálás (scores/pipeline.py process)
+#   group      – csoportosítás és rendezés (a plugin prioritize-a, torna-sorrend)
+#   render     – ANSI megjelenítés (a plugin render-e)
+# Lépésenként: p50/p99 késleltetés, áteresztőképesség és csúcsmemória. Opcionálisan egy
+# korábban elmentett alapvonalhoz hasonlít, és regresszió esetén nem nulla kóddal lép ki.
+#
+# Futtatás: cd scripts && python3 -m bench.suite [--fixtures KÖNYVTÁR] [--iterations N]
+#                                               [--save alap.json] [--compare alap.json]
+#
+
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+from scores import filters, pipeline, sports, stream
+from scores.sports.tennis import FINISHED_STATUSES as FINISHED
+from bench import fixtures
+
+
+def soccer_case(body):
+    """A foci napi nézet lépései; mindegyik az előző lépés kimenetét kapja."""
+    soccer = sports.get('soccer')
+    score_filters = filters.get()
+    return [
+        ("decode", lambda _: list(stream.iter_stages(body, keep_stage=soccer.keep_stage(score_filters)))),
+        ("normalize", lambda stages: pipeline.process(soccer, stages)),
+        ("group", lambda events: dict(sorted(events.items()))),
+        ("render", lambda events: soccer.render(events, title="bench")),
+    ]
+
+
+def tennis_case(body, statuses):
+    tennis = sports.get('tennis')
+    pattern = stream.status_pattern(statuses)
+    return [
+        ("decode", lambda _: list(stream.iter_stages(body, require=pattern))),
+        ("normalize", lambda stages: pipeline.process(tennis, stages, statuses)),
+        ("group", lambda events: dict(sorted(tennis.prioritize(events).items(),
+                                             key=lambda item: item[1][0].priority))),
+        ("render", lambda events: tennis.render(events)),
+    ]
+
+
+def load_cases(directory):
+    """[(név, bájtok, lépések)] a rögzített vagy a szintetikus payloadokból."""
+    if directory:
+        bodies = fixtures.load_bodies(directory)
+    else:
+        bodies = [
+            ("soccer-synthetic.json", fixtures.synthetic_body("soccer", stages=600)),
+            ("tennis-synthetic.json", fixtures.synthetic_body("tennis", stages=300)),
+            ("tennis-live-synthetic.json", fixtures.synthetic_body("tennis", stages=60, seed=1)),
+        ]
+    cases = []
+    for name, body in bodies:
+        if name.startswith("soccer"):
+            cases.append((name, body, soccer_case(body)))
+        elif "live" in name:
+            cases.append((name, body, tennis_case(body, ['In Progress'])))
+        elif name.startswith("tennis"):
+            cases.append((name, body, tennis_case(body, ['NS'])))
+            cases.append((name + " (eredmények)", body, tennis_case(body, FINISHED)))
+    return cases
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _count(result):
+    if isinstance(result, dict):
+        return sum(len(events) for events in result.values())
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+
+def run_case(body, steps, iterations):
+    """Lépésenként: {'p50', 'p99' (ms), 'throughput' (elem/s), 'peak_kib', 'items'}."""
+    results = {}
+    value = None
+    for step, func in steps:
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            output = func(value)
+            samples.append((time.perf_counter() - start) * 1000)
+        tracemalloc.start()
+        func(value)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        p50 = _percentile(samples, 50)
+        items = len(body) if step == "decode" else _count(output)
+        results[step] = {
+            "p50": p50, "p99": _percentile(samples, 99),
+            "throughput": items / (p50 / 1000) if p50 else 0.0,
+            "peak_kib": peak / 1024, "items": items,
+        }
+        value = output
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A scores csővezeték offline mérése.")
+    parser.add_argument("--fixtures", help="rögzített payloadok könyvtára")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--save", help="az eredmények mentése alapvonalként (JSON)")
+    parser.add_argument("--compare", help="összehasonlítás egy elmentett alapvonallal")
+    parser.add_argument("--tolerance", type=float, default=20.0,
+                        help="megengedett p50 romlás százalékban (alapértelmezés: 20)")
+    parser.add_argument("--min-ms", type=float, default=0.5,
+                        help="ennél kisebb abszolút p50 romlás nem számít regressziónak (zaj)")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    report = {}
+    regressions = 0
+    header = f"{'lépés':<11}{'p50 ms':>9}{'p99 ms':>9}{'átvitel/s':>13}{'csúcs KiB':>11}"
+    if baseline:
+        header += f"{'Δ p50':>9}"
+    for name, body, steps in load_cases(args.fixtures):
+        print(f"\n{name} ({len(body) / 1024:.0f} KiB)")
+        print(header)
+        results = run_case(body, steps, args.iterations)
+        report[name] = results
+        for step, r in results.items():
+            unit = "B" if step == "decode" else ""
+            line = (f"{step:<11}{r['p50']:>9.2f}{r['p99']:>9.2f}"
+                    f"{r['throughput']:>12.0f}{unit or ' '}{r['peak_kib']:>11.0f}")
+            old = baseline.get(name, {}).get(step)
+            if old and old["p50"]:
+                delta = (r["p50"] - old["p50"]) / old["p50"] * 100
+                worse = delta > args.tolerance and r["p50"] - old["p50"] > args.min_ms
+                flag = " !" if worse else ""
+                regressions += bool(flag)
+                line += f"{delta:>+8.0f}%{flag}"
+            print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nAlapvonal elmentve: {args.save}")
+    if regressions:
+        print(f"\n{regressions} lépés romlott {args.tolerance:.0f}%-nál többet.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+#
+# scores – a sportág pluginek (scores/sports) és a közös csővezeték modulja.
+# Parancssor: python3 -m scores <sportág> [parancs], lásd scores/cli.py.
+#
@@ -0,0 +1,5 @@
+import sys
+
+from scores import cli
+
+sys.exit(cli.main())
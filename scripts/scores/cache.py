@@ -0,0 +1,190 @@
+#
+# cache.py – lemezes HTTP válasz-gyorsítótár a livescore letöltőkhöz.
+#
+# A bejegyzések URL szerint kulcsoltak, és a $XDG_CACHE_HOME/scores könyvtárba kerülnek.
+# Egy bejegyzés egy fájl: az első sor a metaadat (JSON), utána a nyers válasz törzse.
+# Az élettartam végpontonként eltér:
+# - lezárt (múltbeli) nap: gyakorlatilag örökké érvényes; a /date/ payloadok UTC napok,
+#   és egy nap csak a UTC vége után FINAL_MARGIN-nel letöltve lezárt (is_final),
+# - mai nap: rövid TTL,
+# - élő végpont: néhány másodperc.
+# Kilakoltatás: a legrégebben használt bejegyzések mennek (az mtime a találatkor frissül,
+# touch). A könyvtárat csak akkor listázzuk, ha a nyilvántartott méret (SIZE_FILE: az
+# utolsó listázáskori méret és az azóta írt bájtok) átlépi a korlátot, vagy ha a
+# nyilvántartás RESCAN_INTERVAL-nál régebbi (más folyamatok írásai, kézi törlés).
+#
+
+import os
+import re
+import json
+import time
+import hashlib
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "scores"
+)
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+# A kilakoltatás a korlát ekkora hányadáig töröl, hogy ne minden írás listázzon.
+EVICT_TO = 0.8
+SIZE_FILE = os.path.join(CACHE_DIR, "size")
+RESCAN_INTERVAL = 3600
+# Méréshez (pl. 'soccer-scores timing') kikapcsolható; SCORES_NO_CACHE=1 is kikapcsolja.
+ENABLED = not os.environ.get("SCORES_NO_CACHE")
+
+TTL_LIVE = 10
+TTL_TODAY = 120
+TTL_DEFAULT = 60
+TTL_FOREVER = None
+# A nap UTC vége után ennyi ideig még tarthatnak a késő esti meccsek (amerikai kezdések,
+# US Open éjszakai menet); addig a nap payloadja nem végleges.
+FINAL_MARGIN = 6 * 3600
+
+_DATE_URL = re.compile(r"/date/[^/]+/(\d{8})/")
+
+
+def final_after(day):
+    """Az időpont (epoch), amelytől egy nap (YYYYMMDD, UTC) payloadja véglegesnek számít."""
+    end = datetime.strptime(day, "%Y%m%d").replace(tzinfo=timezone.utc) + timedelta(days=1)
+    return end.timestamp() + FINAL_MARGIN
+
+
+def is_final(day, fetched_at):
+    """Egy nap csak akkor végleges, ha a letöltés a nap UTC vége után, FINAL_MARGIN-nel történt."""
+    return fetched_at >= final_after(day)
+
+
+def ttl_for(url, fetched_at):
+    """Megadja egy URL érvényességi idejét másodpercben (None = örökké)."""
+    if "/live/" in url:
+        return TTL_LIVE
+    match = _DATE_URL.search(url)
+    if not match:
+        return TTL_DEFAULT
+    if is_final(match.group(1), fetched_at):
+        return TTL_FOREVER
+    return TTL_TODAY
+
+
+def _path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".cache")
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        header, _, body = f.read().partition(b"\n")
+    return json.loads(header), body
+
+
+def load_entry(url):
+    """Visszaadja a bejegyzés (metaadat, törzs) párját frissességtől függetlenül, vagy None-t."""
+    if not ENABLED:
+        return None
+    try:
+        meta, body = _read(_path(url))
+    except (FileNotFoundError, ValueError):
+        return None
+    if meta.get("url") != url:
+        return None
+    return meta, body
+
+
+def is_fresh(meta):
+    ttl = ttl_for(meta["url"], meta["fetched"])
+    return ttl is TTL_FOREVER or time.time() - meta["fetched"] <= ttl
+
+
+def touch(url):
+    """Felhasználtként jelöli a bejegyzést: az mtime a kilakoltatás (LRU) kulcsa."""
+    if not ENABLED:
+        return
+    try:
+        os.utime(_path(url))
+    except OSError:
+        pass
+
+
+def store(url, body, validators=None):
+    """Atomikusan elmenti egy URL válaszát (és az ETag/Last-Modified validátorokat),
+    majd szükség esetén kilakoltat."""
+    if not ENABLED:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    meta = {"url": url, "fetched": time.time()}
+    if validators:
+        meta.update(validators)
+    header = json.dumps(meta).encode("utf-8")
+    path = _path(url)
+    try:
+        replaced = os.stat(path).st_size
+    except OSError:
+        replaced = 0
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header + b"\n" + body)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return
+    tracked = _tracked_size()
+    size = len(header) + 1 + len(body) - replaced
+    if tracked is None or tracked[0] + size > MAX_CACHE_BYTES:
+        evict()
+    else:
+        _save_size(tracked[0] + size, tracked[1])
+
+
+def _tracked_size():
+    """(méret, az utolsó listázás ideje) a SIZE_FILE-ból, vagy None, ha nincs vagy elavult."""
+    try:
+        with open(SIZE_FILE) as f:
+            total, scanned_at = f.read().split()
+        total, scanned_at = int(total), float(scanned_at)
+    except (OSError, ValueError):
+        return None
+    if time.time() - scanned_at > RESCAN_INTERVAL:
+        return None
+    return total, scanned_at
+
+
+def _save_size(total, scanned_at):
+    try:
+        with open(SIZE_FILE, "w") as f:
+            f.write(f"{total} {scanned_at}")
+    except OSError:
+        pass
+
+
+def evict(max_bytes=None):
+    """Ha a méret a korlát (alapból MAX_CACHE_BYTES) fölött van, a legrégebben használt
+    bejegyzéseket törli, amíg a korlát EVICT_TO hányada alá nem kerül; a maradó méretet
+    nyilvántartásba veszi."""
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    scanned_at = time.time()
+    entries = []
+    total = 0
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".cache"):
+                    continue
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    except FileNotFoundError:
+        return
+    if total > max_bytes:
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= max_bytes * EVICT_TO:
+                break
+    _save_size(total, scanned_at)
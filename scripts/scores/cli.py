@@ -0,0 +1,130 @@
+#
+# cli.py – közös parancssori belépési pont az összes sportághoz.
+#
+#   python3 -m scores <sportág[,sportág...]> [parancs] [argumentumok]
+#   pl.: python3 -m scores soccer full yesterday
+#        python3 -m scores soccer,tennis view
+#        python3 -m scores stats [--hours N | --all] [szűrő]   (mérések, scores/telemetry.py)
+#
+# Először a daemont kérdezzük (scores/daemon.py), ha nem fut, helyben töltünk le.
+# Több sportág egy futásban párhuzamosan töltődik, a közös HTTP sessionnel
+# (scores/http_client.py); a 'view' kimenete ekkor sportáganként egy JSON objektum.
+#
+# A sáv és a kattintások sokszor indítják újra, ezért az indulás számít: a helyi futás
+# a standard könyvtári HTTP klienst használja (requests import nélkül), a ritkán kellő
+# modulok (szálkészlet, D-Bus, subprocess) csak használatkor töltődnek be. Az argumentum
+# nélküli futás (a sáv ikonja) a sportág plugint sem tölti be (így a json, sqlite3 és
+# dataclasses sem töltődik be).
+# Mérés: python3 -m bench.startup (lásd bench/startup.py).
+#
+# A futás mérései (letöltés, dekódolás, megjelenítés, hibák) a végén a metrika fájlba
+# kerülnek; a daemon kérés körbejárási ideje 'daemon.request' néven (ha a daemon nem
+# fut: 'daemon.unavailable').
+#
+
+import os
+import sys
+import time
+
+from scores import sports, telemetry
+
+
+def run_one(sport, args):
+    """Egy sportág egy parancsa: a daemonon át, vagy ha az nem fut, helyben."""
+    try:
+        use_daemon = any(command in args for command in sport.daemon_commands)
+        reply = None
+        if use_daemon:
+            from scores import daemon
+            start = time.perf_counter()
+            reply = daemon.request(sport.name, args)
+            if reply is None:
+                telemetry.count('daemon.unavailable')
+            else:
+                telemetry.record('daemon.request', time.perf_counter() - start)
+
+        if reply is None:
+            try:
+                return sport.run(args)
+            finally:
+                sport.close()
+        if reply['ok']:
+            return reply['output']
+        return f"{sport.icon} Hiba: {reply['error']}"
+    except Exception as e:
+        telemetry.error('cli', e)
+        return f"{sport.icon} Hiba: {e}"
+
+
+def _view(sport, output):
+    import json
+    try:
+        return json.loads(output)
+    except ValueError:
+        return {"summary": f"{sport.icon} ?", "full": output}
+
+
+def stats(args):
+    """'stats [--hours N | --all] [szűrő]': a mérések hisztogramjai a metrika fájlokból."""
+    hours, words = 24, []
+    args = iter(args)
+    for arg in args:
+        if arg == '--all':
+            hours = 0
+        elif arg == '--hours':
+            hours = float(next(args, 24))
+        else:
+            words.append(arg)
+    print(telemetry.report(hours, " ".join(words)))
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(f"Használat: python3 -m scores <{'|'.join(sports.names())}>[,...] [parancs]"
+              f" | stats", file=sys.stderr)
+        return 2
+    try:
+        # 'scores stats', illetve a régi belépési pontokról 'soccer-scores stats'
+        if 'stats' in argv[:2]:
+            return stats(argv[argv.index('stats') + 1:])
+        return _run(argv)
+    except BrokenPipeError:
+        # Az olvasó (pl. head) a kimenet vége előtt kilépett: nincs mit kiírni. A stdout
+        # lezárásakor a Python újra próbálna üríteni, ezért az a /dev/null-ra mutat.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        telemetry.flush()
+
+
+def _run(argv):
+    names = argv[0].split(',')
+    args = argv[1:]
+    try:
+        if not args:
+            print("\n\n".join(sports.icon(name) for name in names))
+            return 0
+        selected = [sports.get(name) for name in names]
+    except KeyError as e:
+        print(f"Ismeretlen sportág: {e.args[0]}", file=sys.stderr)
+        return 2
+    from scores import http_client
+    http_client.prefer_stdlib()
+
+    if len(selected) == 1:
+        outputs = [run_one(selected[0], args)]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(selected)) as pool:
+            outputs = list(pool.map(lambda sport: run_one(sport, args), selected))
+
+    if len(selected) > 1 and 'view' in args:
+        import json
+        print(json.dumps({sport.name: _view(sport, output) for sport, output in zip(selected, outputs)}))
+        return 0
+    output = "\n\n".join(output for output in outputs if output)
+    if output:
+        print(output)
+    return 0
@@ -0,0 +1,137 @@
+#
+# daemon.py – tartósan futó eredmény-szolgáltatás a Qtile sáv gombjaihoz.
+#
+# A daemon egyszer tölti be a sportág plugineket (scores/sports), egyetlen meleg
+# (keep-alive) HTTP sessionnel tölt, és egy helyi Unix socketen válaszol a 'full',
+# 'full yesterday', 'view' és 'check-notify' kérésekre; a kéréseket szálanként,
+# párhuzamosan szolgálja ki. A parancssori kliens (scores/cli.py) először ide fordul,
+# és csak akkor tölt le maga, ha a daemon nem fut.
+# A sportágak polled_commands parancsait (teniszben a check-notify) a daemon maga futtatja,
+# az adatból számolt ütemben (scores/schedule.py): külső időzítő nem kell hozzá.
+# A "tegnap" nézeteket a tegnapi nap véglegessé válása után előre elkészíti, a mai
+# payloadot reggel letölti (scores/prefetch.py); a találati arány: '<sport> prefetch'.
+#
+# Protokoll: a kliens egy JSON sort küld ({"sport": ..., "args": [...]}), a daemon
+# egy JSON választ ír vissza ({"ok": true, "output": ...} vagy {"ok": false, "error": ...}).
+#
+# Futtatás: PYTHONPATH=<scripts könyvtár> python3 -m scores.daemon
+#
+
+import os
+import sys
+import json
+import signal
+import socket
+import tempfile
+import socketserver
+
+from scores import telemetry
+
+SOCKET_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), "scores.sock"
+)
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30
+
+
+def request(sport, args, timeout=REQUEST_TIMEOUT):
+    """Elküld egy kérést a daemonnak. None-t ad vissza, ha a daemon nem érhető el."""
+    if os.environ.get("SCORES_NO_DAEMON"):
+        return None
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(SOCKET_PATH)
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps({"sport": sport, "args": list(args)}).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            req = json.loads(self.rfile.readline())
+            handler = self.server.handlers[req["sport"]]
+            reply = {"ok": True, "output": handler(req.get("args", []))}
+        except Exception as e:
+            telemetry.error('daemon', e)
+            reply = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(reply).encode("utf-8"))
+
+
+class ScoresServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, handlers):
+        self.handlers = handlers
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        super().__init__(path, _Handler)
+        os.chmod(path, 0o600)
+
+
+def default_handlers():
+    """Az összes sportág plugin 'run' metódusa."""
+    from scores import sports
+    return {name: sports.get(name).run for name in sports.names()}
+
+
+def start_pollers():
+    """Háttérszálak a sportágak polled_commands parancsaihoz (scores/schedule.py)."""
+    from scores import schedule, sports
+    return [schedule.Poller(sports.get(name), command).start()
+            for name in sports.names() for command in sports.get(name).polled_commands]
+
+
+def start_prefetchers():
+    """Előtöltők a sportágakhoz (scores/prefetch.py), ha nincs kikapcsolva."""
+    from scores import prefetch, sports
+    if not prefetch.ENABLED:
+        return []
+    return [prefetch.start(sports.get(name)) for name in sports.names()]
+
+
+def main():
+    from scores import resilience
+    # Az elavult adattal kiszolgált kéréseket a háttérben frissítjük a következő kattintásra.
+    resilience.BACKGROUND_REVALIDATE = True
+    # A mérések percenként kerülnek a metrika fájlba (scores/telemetry.py).
+    telemetry.set_source("daemon")
+    flusher = telemetry.start_flusher()
+    server = ScoresServer(SOCKET_PATH, default_handlers())
+    workers = start_pollers() + start_prefetchers()
+    # systemd SIGTERM-mel állít le; így a socket fájl is eltakarításra kerül.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            worker.stop()
+        flusher.set()
+        telemetry.flush()
+        server.server_close()
+        try:
+            os.unlink(SOCKET_PATH)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    sys.exit(main())
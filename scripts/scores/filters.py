@@ -0,0 +1,112 @@
+#
+# filters.py – előre lefordított liga/torna szűrők és kedvencek mindkét szkripthez.
+#
+# A fehérlista és a kedvencek egyszer töltődnek be, és hash-elt, fagyasztott
+# szerkezetekbe kerülnek: a ligák (Cnm, Snm) párok halmazába, a főbb tenisz tornák és a
+# casefold-olt kedvencek frozenset-be. Így a szűrés költsége nem nő a listák hosszával.
+#
+# A fehérlista a tennis_favorites.json-hoz hasonlóan kézzel szerkeszthető:
+#   ~/.config/qtile/scripts/scores_filters.json
+#   {
+#     "soccer_leagues": {"England": ["Premier League"], "Spain": ["LaLiga"]},
+#     "tennis_main_tours": ["ATP", "WTA", "Grand Slam"]
+#   }
+# A hiányzó kulcsok az alapértelmezett értékeket kapják.
+#
+
+import os
+import json
+from dataclasses import dataclass, field
+
+CONFIG_DIR = os.path.expanduser("~/.config/qtile/scripts")
+FILTERS_FILE = os.path.join(CONFIG_DIR, "scores_filters.json")
+FAVORITES_FILE = os.path.join(CONFIG_DIR, "tennis_favorites.json")
+
+DEFAULT_SOCCER_LEAGUES = {
+    "England": ["Premier League"],
+    "Spain": ["LaLiga"],
+    "Germany": ["Bundesliga"],
+    "Italy": ["Serie A"],
+    "France": ["Ligue 1"],
+    "Europe": ["Champions League", "Europa League", "Europa Conference League", "European Championship"],
+    "World": ["World Cup"],
+    "South America": ["Copa America"]
+}
+DEFAULT_TENNIS_MAIN_TOURS = ["ATP", "WTA", "Grand Slam"]
+
+
+@dataclass(frozen=True)
+class Filters:
+    leagues: frozenset            # {(Cnm, Snm), ...}
+    main_tours: frozenset         # {Cnm, ...}
+    favorites: frozenset          # casefold-olt játékosnevek
+    _favorite_names: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def is_league(self, country_name, league_name):
+        """Igaz, ha a liga a figyelt top ligák között van."""
+        return (country_name, league_name) in self.leagues
+
+    def is_main_tour(self, tour_category):
+        return tour_category in self.main_tours
+
+    def is_favorite(self, name):
+        """Kedvenc-e a játékos; a casefold eredményét nevenként megjegyzi."""
+        try:
+            return self._favorite_names[name]
+        except KeyError:
+            result = self._favorite_names[name] = name.casefold() in self.favorites
+            return result
+
+    def any_favorite(self, name1, name2):
+        return self.is_favorite(name1) or self.is_favorite(name2)
+
+
+def _read_json(path, default):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def compile_filters(config, favorites):
+    """A nyers konfigurációból és kedvenclistából Filters objektumot fordít."""
+    leagues = config.get("soccer_leagues", DEFAULT_SOCCER_LEAGUES)
+    tours = config.get("tennis_main_tours", DEFAULT_TENNIS_MAIN_TOURS)
+    return Filters(
+        leagues=frozenset((country, league) for country, names in leagues.items() for league in names),
+        main_tours=frozenset(tours),
+        favorites=frozenset(str(player).casefold() for player in favorites),
+    )
+
+
+_current = None
+_stamp = None
+
+
+def get():
+    """A betöltött szűrők (első híváskor betölti őket)."""
+    if _current is None:
+        refresh()
+    return _current
+
+
+def refresh():
+    """Újratölti a szűrőket, ha a konfigurációs fájlok megváltoztak (a daemon minden
+    kérés elején hívja, hogy a kézi szerkesztés újraindítás nélkül érvényes legyen)."""
+    global _current, _stamp
+    stamp = (_mtime(FILTERS_FILE), _mtime(FAVORITES_FILE))
+    if _current is None or stamp != _stamp:
+        config = _read_json(FILTERS_FILE, {})
+        favorites = _read_json(FAVORITES_FILE, [])
+        _current = compile_filters(config if isinstance(config, dict) else {},
+                                   favorites if isinstance(favorites, list) else [])
+        _stamp = stamp
+    return _current
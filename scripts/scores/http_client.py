@@ -0,0 +1,312 @@
+#
+# http_client.py – közös HTTP kliens a livescore letöltőkhöz.
+#
+# - Egyetlen, kapcsolat-újrahasznosító kliens (keep-alive, pool). A daemonban ez egy
+#   requests.Session; egyszeri parancssori futásnál (prefer_stdlib) a standard könyvtár
+#   http.client-je szálanként és hostonként egy tartós kapcsolattal, így a requests
+#   importja (~70 ms) nem terheli az indulást. Proxy beállítás esetén, vagy ha a
+#   SCORES_HTTP=requests|stdlib változó mást kér, az dönt. A kliens az első kérésnél jön létre.
+# - Feltételes kérések a tárolt ETag / Last-Modified validátorokból; a 304 gyorsítótár-találat.
+# - Tömörített (gzip/deflate) válaszok elfogadása.
+# - Parancsonkénti határidő, elavult adat hibánál és hostonkénti megszakító: scores/resilience.py.
+# - Számlálók: átvitt bájtok, friss találatok, újraérvényesített és újratöltött kérések;
+#   egy munka (pl. előtöltés, scores/prefetch.py) a tally() blokkban külön is megkapja a sajátjait.
+#   A számlálók és a hálózati kérések ideje a metrikákba is bekerül (scores/telemetry.py).
+# - A served() blokk a kiszolgált válaszok valódi letöltési idejét gyűjti (gyorsítótárból és
+#   elavult tartalékból a bejegyzésé), hogy az archívum (scores/store.py) ne a falióra
+#   szerint döntse el, lezárt napot látott-e.
+#
+# Mérés (pl. ETag-et küldő helyi teszt szerver ellen):
+#   PYTHONPATH=scripts python3 -m scores.http_client <url> [ismétlések]
+#
+
+import os
+import sys
+import json
+import time
+import zlib
+import threading
+import contextvars
+from contextlib import contextmanager
+
+from scores import cache, resilience, telemetry
+
+# Az API alap URL-je; helyi teszt szerverhez (bench/mock_server.py) a LIVESCORE_API_BASE
+# változóval felülírható.
+API_BASE = os.environ.get("LIVESCORE_API_BASE", "https://prod-public-api.livescore.com/v1/api/app")
+
+TIMEOUT = 10
+POOL_SIZE = 10
+
+# 'requests', 'stdlib', vagy üres: requests, ha telepítve van.
+BACKEND = os.environ.get("SCORES_HTTP", "")
+
+STATS = {
+    "requests": 0,       # hálózati kérések száma
+    "bytes": 0,          # a hálózaton átvitt (tömörített) törzs bájtok
+    "decoded_bytes": 0,  # kicsomagolt törzs bájtok
+    "cache_hits": 0,     # friss gyorsítótár-találat, nem volt hálózati kérés
+    "revalidated": 0,    # 304 Not Modified – a tárolt törzs újra érvényes
+    "refetched": 0,      # 200 – teljes törzs letöltve
+    "errors": 0,         # sikertelen kérés (időtúllépés, kapcsolati hiba, 5xx)
+    "stale": 0,          # elavult gyorsítótár-bejegyzéssel kiszolgálva
+}
+_stats_lock = threading.Lock()
+# A tally() blokk számlálói; a resilience.bind()-olt szálakra is érvényes.
+_tally = contextvars.ContextVar("scores_tally", default=None)
+# A served() blokkban kiszolgált válaszok letöltési ideje.
+_served = contextvars.ContextVar("scores_served", default=None)
+
+
+def _count(**deltas):
+    tally_counts = _tally.get()
+    with _stats_lock:
+        for key, value in deltas.items():
+            STATS[key] += value
+            if tally_counts is not None:
+                tally_counts[key] += value
+    for key, value in deltas.items():
+        telemetry.count(f"http.{key}", value)
+
+
+@contextmanager
+def tally():
+    """A blokkban (és az onnan indított bind()-olt szálakban) futó letöltések számlálói."""
+    counts = dict.fromkeys(STATS, 0)
+    token = _tally.set(counts)
+    try:
+        yield counts
+    finally:
+        _tally.reset(token)
+
+
+def _note_served(fetched_at):
+    served_at = _served.get()
+    if served_at is not None:
+        served_at.append(fetched_at)
+
+
+@contextmanager
+def served():
+    """A blokkban kiszolgált válaszok letöltési ideje (epoch) listában: hálózatról (200, 304)
+    a mostani idő, gyorsítótárból vagy elavult tartalékból a bejegyzés letöltési ideje."""
+    served_at = []
+    token = _served.set(served_at)
+    try:
+        yield served_at
+    finally:
+        _served.reset(token)
+
+
+class HTTPError(Exception):
+    pass
+
+
+class RequestsSession:
+    """requests.Session kapcsolat-pool-lal; a daemon alapértelmezése."""
+    name = "requests"
+
+    def __init__(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE))
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE))
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+
+    def get(self, url, headers, timeout=TIMEOUT):
+        """(státusz, fejlécek, kicsomagolt törzs, átvitt bájtok)"""
+        response = self.session.get(url, headers=headers, timeout=timeout)
+        body = response.content
+        return response.status_code, response.headers, body, response.raw.tell() or len(body)
+
+
+class StdlibSession:
+    """http.client, szálanként és hostonként egy tartós kapcsolattal. Átirányítást nem követ."""
+    name = "stdlib"
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _connection(self, scheme, netloc):
+        connections = self._local.__dict__.setdefault("connections", {})
+        conn = connections.get((scheme, netloc))
+        if conn is None:
+            import http.client
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = connections[(scheme, netloc)] = cls(netloc, timeout=TIMEOUT)
+        return conn
+
+    def get(self, url, headers, timeout=TIMEOUT):
+        from http.client import HTTPException
+        from urllib.parse import urlsplit
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        headers = dict(headers, **{"Accept-Encoding": "gzip, deflate"})
+        conn = self._connection(parts.scheme, parts.netloc)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        for attempt in (1, 2):
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                raw = response.read()
+                break
+            except (ConnectionError, HTTPException):
+                # A szerver lezárhatta a tétlen kapcsolatot: egyszer újranyitjuk.
+                conn.close()
+                if attempt == 2:
+                    raise
+            except BaseException:
+                # Pl. időtúllépés: a félbemaradt válasz miatt a kapcsolat nem használható tovább.
+                conn.close()
+                raise
+
+        encoding = response.getheader("Content-Encoding", "")
+        if encoding == "gzip":
+            body = zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            try:
+                body = zlib.decompress(raw)
+            except zlib.error:
+                body = zlib.decompress(raw, -zlib.MAX_WBITS)
+        else:
+            body = raw
+        return response.status, response.headers, body, len(raw)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def prefer_stdlib():
+    """Egyszeri futáshoz: a standard könyvtári kliens, ha nincs más kérve. A proxy
+    változókat csak a requests kezeli, ezért ha van ilyen, marad az."""
+    global BACKEND
+    if not BACKEND and not any(key.lower().endswith("_proxy") for key in os.environ):
+        BACKEND = "stdlib"
+
+
+def session():
+    """A közös kliens; az első hívásnál jön létre a BACKEND szerint."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _make_session()
+    return _session
+
+
+def _make_session():
+    if BACKEND != "stdlib":
+        try:
+            return RequestsSession()
+        except ImportError:
+            if BACKEND == "requests":
+                raise
+    return StdlibSession()
+
+
+def date_url(sport, date_str):
+    """Egy nap összes eseménye: /date/<sport>/<YYYYMMDD>/0"""
+    return f"{API_BASE}/date/{sport}/{date_str}/0"
+
+
+def live_url(sport):
+    """Az éppen zajló események: /live/<sport>/0"""
+    return f"{API_BASE}/live/{sport}/0"
+
+
+def _fallback(url, user_agent, entry, error):
+    """Az utolsó jó válasz elavultként, ha a parancs megengedi; egyébként a hiba továbbdobása.
+    A daemonban a kérés a háttérben, teljes időkorláttal újra lefut."""
+    if entry is None or not resilience.stale_ok():
+        raise error
+    _count(stale=1)
+    resilience.mark_stale(entry[0]["fetched"])
+    _note_served(entry[0]["fetched"])
+    cache.touch(url)
+    resilience.revalidate_in_background(url, lambda: fetch(url, user_agent, revalidate_fresh=True))
+    return entry[1]
+
+
+def fetch(url, user_agent, revalidate_fresh=False):
+    """Letölti egy URL törzsét (bytes), a gyorsítótárat és a validátorokat felhasználva.
+    Az időkorlát a parancs hátralévő ideje; hiba, lejárt határidő vagy nyitott megszakító
+    esetén lásd _fallback (scores/resilience.py)."""
+    entry = cache.load_entry(url)
+    if entry is not None and not revalidate_fresh and cache.is_fresh(entry[0]):
+        _count(cache_hits=1)
+        _note_served(entry[0]["fetched"])
+        cache.touch(url)
+        return entry[1]
+
+    timeout = resilience.timeout(TIMEOUT)
+    if timeout < resilience.MIN_REQUEST_TIME:
+        return _fallback(url, user_agent, entry, resilience.Unavailable("lejárt a határidő"))
+    host = url.split("/", 3)[2]
+    if not resilience.BREAKER.allow(host):
+        retry_in = resilience.BREAKER.retry_in(host)
+        return _fallback(url, user_agent, entry,
+                         resilience.Unavailable(f"{host} nem válaszol, újrapróbálás {retry_in:.0f} s múlva"))
+
+    headers = {"User-Agent": user_agent}
+    if entry is not None:
+        meta = entry[0]
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    start = time.perf_counter()
+    try:
+        status, response_headers, body, wire_bytes = session().get(url, headers, timeout)
+        if status >= 500 or status == 429:
+            raise HTTPError(f"HTTP {status}: {url}")
+    except Exception as e:
+        telemetry.record("fetch.network", time.perf_counter() - start)
+        telemetry.error("fetch", e)
+        _count(errors=1)
+        resilience.BREAKER.failure(host)
+        return _fallback(url, user_agent, entry, e)
+    telemetry.record("fetch.network", time.perf_counter() - start)
+    resilience.BREAKER.success(host)
+
+    if status == 304 and entry is not None:
+        _count(requests=1, revalidated=1)
+        meta, body = entry
+        cache.store(url, body, {k: meta[k] for k in ("etag", "last_modified") if meta.get(k)})
+        _note_served(time.time())
+        return body
+
+    if status >= 300:
+        raise HTTPError(f"HTTP {status}: {url}")
+    _count(requests=1, refetched=1, bytes=wire_bytes, decoded_bytes=len(body))
+
+    validators = {}
+    if response_headers.get("ETag"):
+        validators["etag"] = response_headers["ETag"]
+    if response_headers.get("Last-Modified"):
+        validators["last_modified"] = response_headers["Last-Modified"]
+    cache.store(url, body, validators)
+    _note_served(time.time())
+    return body
+
+
+def fetch_json(url, user_agent):
+    """Mint a fetch(), de a dekódolt JSON-t adja vissza."""
+    return json.loads(fetch(url, user_agent))
+
+
+def format_stats():
+    with _stats_lock:
+        return "\n".join(f"{key:>14}: {value}" for key, value in STATS.items())
+
+
+if __name__ == "__main__":
+    target = sys.argv[1]
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    for _ in range(repeats):
+        fetch(target, "scores-http-bench/1.0", revalidate_fresh=True)
+    print(format_stats())
@@ -0,0 +1,146 @@
+#
+# live.py – inkrementális élő tenisz követés a /live/tennis/0 végponthoz.
+#
+# A LiveTracker memóriában tartja az előző normalizált pillanatképet (Eid szerint),
+# és minden lekérdezésnél csak azokat az eseményeket dolgozza fel újra, amelyek nyers
+# pontszám-mezői megváltoztak. Az eredmény eseményenkénti változáslista:
+# kezdés, befejezés, szett, game, adogató váltás és brék.
+#
+
+from collections import namedtuple
+
+from scores.model import Match, Side, Status, fmt_score, intern, to_int
+
+LIVE_STATUS = 'In Progress'
+
+# Egy változás: kind ∈ {'start', 'finish', 'set', 'game', 'break', 'server'}.
+# A 'side' a változást kiváltó oldal (Side), ahol értelmezhető.
+Change = namedtuple('Change', 'kind eid old new side')
+
+# Ezek a mezők határozzák meg, hogy egy eseményt újra kell-e normalizálni.
+_RAW_KEYS = ('Eps', 'Tr1', 'Tr2', 'Tr1G', 'Tr2G', 'Esv')
+
+
+def normalize(event, tournament=''):
+    """Egy nyers élő tenisz eseményből Match-et készít."""
+    t1 = event.get('T1', [{}])[0]
+    t2 = event.get('T2', [{}])[0]
+    return Match(
+        event.get('Eid'), tournament,
+        intern(t1.get('Nm', 'P1')), intern(t2.get('Nm', 'P2')),
+        Status.LIVE,
+        score1=to_int(event.get('Tr1', '0')), score2=to_int(event.get('Tr2', '0')),
+        games1=to_int(event.get('Tr1G')), games2=to_int(event.get('Tr2G')),
+        server=Side.FIRST if event.get('Esv') == t1.get('ID') else Side.SECOND,
+    )
+
+
+def diff_event(eid, old, new):
+    """Két állapot közötti változások egy eseményre."""
+    if old is None:
+        return [Change('start', eid, None, new, None)]
+    changes = []
+    for side, before, after in ((Side.FIRST, old.score1, new.score1), (Side.SECOND, old.score2, new.score2)):
+        if before is not None and after is not None and after > before:
+            changes.append(Change('set', eid, old, new, side))
+    if not changes:
+        for side, before, after in ((Side.FIRST, old.games1, new.games1), (Side.SECOND, old.games2, new.games2)):
+            if before is not None and after is not None and after > before:
+                kind = 'break' if old.server is not None and old.server is not side else 'game'
+                changes.append(Change(kind, eid, old, new, side))
+    if old.server is not None and old.server is not new.server:
+        changes.append(Change('server', eid, old, new, new.server))
+    return changes
+
+
+def format_score(match):
+    """'[szettek] (gamek)' alakú rövid állás."""
+    score = f"[{fmt_score(match.score1)}-{fmt_score(match.score2)}]"
+    if match.games1 is not None and match.games2 is not None:
+        score += f" ({match.games1}-{match.games2})"
+    return score
+
+
+def describe(match):
+    """'X vs Y [szettek] (gamek)' leírás értesítésekhez."""
+    if not match.name2:
+        # Régi állapotfájlból átvett bejegyzés: a teljes leírás a name1 mezőben van.
+        return match.name1
+    return f"{match.name1} vs {match.name2} {format_score(match)}"
+
+
+class LiveTracker:
+    """Az előző pillanatképet tartja, és lekérdezésenként csak a különbséget számolja.
+
+    keep: opcionális szűrő (name1, name2) -> bool, pl. a kedvencekre.
+    render: opcionális függvény (Match) -> str; csak a változott eseményekre fut le.
+    """
+
+    def __init__(self, snapshot=None, keep=None, render=None):
+        self.snapshot = dict(snapshot or {})
+        self.keep = keep
+        self.render = render
+        self.rendered = {}
+        self._raw = {}
+        self._ignored = set()
+
+    def set_filter(self, keep):
+        """Új szűrőt állít be; a korábban kiszűrt események újra elbírálásra kerülnek."""
+        self.keep = keep
+        self._ignored.clear()
+
+    def update(self, data):
+        """Feldolgoz egy élő payloadot, frissíti a pillanatképet, és visszaadja a változásokat."""
+        changes = []
+        new_snapshot = {}
+        for stage in data.get('Stages', []):
+            tournament = None
+            for event in stage.get('Events', []):
+                if event.get('Eps') != LIVE_STATUS:
+                    continue
+                eid = event.get('Eid')
+                if eid is None or eid in self._ignored:
+                    continue
+                raw = tuple(event.get(key) for key in _RAW_KEYS)
+                old = self.snapshot.get(eid)
+                if old is not None and self._raw.get(eid) == raw:
+                    new_snapshot[eid] = old
+                    continue
+                if tournament is None:
+                    tournament = intern(stage.get('Snm', ''))
+                try:
+                    match = normalize(event, tournament)
+                except (AttributeError, IndexError):
+                    continue
+                if self.keep is not None and not self.keep(match.name1, match.name2):
+                    self._ignored.add(eid)
+                    continue
+                self._raw[eid] = raw
+                new_snapshot[eid] = match
+                event_changes = diff_event(eid, old, match)
+                changes.extend(event_changes)
+                if self.render is not None and (event_changes or eid not in self.rendered):
+                    self.rendered[eid] = self.render(match)
+
+        for eid, old in self.snapshot.items():
+            if eid not in new_snapshot:
+                changes.append(Change('finish', eid, old, None, None))
+                self._raw.pop(eid, None)
+                self.rendered.pop(eid, None)
+
+        self.snapshot = new_snapshot
+        return changes
+
+    def to_json(self):
+        return {eid: match.to_list() for eid, match in self.snapshot.items()}
+
+    @classmethod
+    def from_json(cls, data, **kwargs):
+        snapshot = {}
+        for eid, value in (data or {}).items():
+            try:
+                snapshot[eid] = Match.from_list(value)
+            except (TypeError, ValueError):
+                # Régi állapotfájl formátum ("X vs Y [..]"): csak azt tudjuk, hogy fut.
+                snapshot[eid] = Match(eid, '', str(value), '', Status.LIVE)
+        return cls(snapshot, **kwargs)
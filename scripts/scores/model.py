@@ -0,0 +1,88 @@
+#
+# model.py – kompakt, típusos eseménymodell mindkét sportághoz.
+#
+# A korábbi meccsenkénti dict-ek (beágyazott 'details' dict, 't1'/'p1' sztring jelzők)
+# helyett egyetlen __slots__-os dataclass. A csapat-, játékos- és tornanevek
+# internáltak, így egy többhetes archívumban minden név csak egyszer szerepel a memóriában.
+#
+
+import sys
+from enum import Enum
+from dataclasses import dataclass
+
+
+class Status(Enum):
+    UPCOMING = 'upcoming'
+    LIVE = 'live'
+    FINISHED = 'finished'
+    CALLED_OFF = 'called_off'    # elhalasztva, törölve, félbeszakadt: se nem élő, se nem kész
+
+
+class Side(Enum):
+    """A meccs egyik oldala (hazai csapat / első játékos, illetve vendég / második)."""
+    FIRST = 1
+    SECOND = 2
+
+
+@dataclass(slots=True)
+class Match:
+    eid: str
+    tournament: str
+    name1: str
+    name2: str
+    status: Status
+    score1: int | None = None    # gólok, illetve nyert szettek
+    score2: int | None = None
+    games1: int | None = None    # tenisz: az aktuális szett gamjei
+    games2: int | None = None
+    clock: str | None = None     # foci: játékperc vagy státusz ("55'", "HT", "FT")
+    winner: Side | None = None
+    server: Side | None = None
+    priority: int = 0
+    main_tour: bool = False
+
+    def to_list(self):
+        """JSON-ba írható forma (állapotfájlokhoz, archívumhoz)."""
+        return [
+            self.eid, self.tournament, self.name1, self.name2, self.status.value,
+            self.score1, self.score2, self.games1, self.games2, self.clock,
+            self.winner and self.winner.value, self.server and self.server.value,
+            self.priority, self.main_tour,
+        ]
+
+    @classmethod
+    def from_list(cls, values):
+        (eid, tournament, name1, name2, status, score1, score2, games1, games2,
+         clock, winner, server, priority, main_tour) = values
+        return cls(
+            eid, intern(tournament), intern(name1), intern(name2), Status(status),
+            score1, score2, games1, games2, clock,
+            Side(winner) if winner else None, Side(server) if server else None,
+            priority, main_tour,
+        )
+
+
+def intern(name):
+    try:
+        return sys.intern(name)
+    except TypeError:
+        # Hiányzó (null) név: változatlanul hagyjuk.
+        return name
+
+
+def to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def fmt_score(value):
+    return '?' if value is None else value
+
+
+def side_by_score(score1, score2):
+    """A több pontot/szettet szerző oldal, döntetlennél vagy ismeretlen állásnál None."""
+    if score1 is None or score2 is None or score1 == score2:
+        return None
+    return Side.FIRST if score1 > score2 else Side.SECOND
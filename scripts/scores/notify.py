@@ -0,0 +1,203 @@
+#
+# notify.py – kötegelt, korlátozott ütemű értesítések a kedvencek meccseihez.
+#
+# A meccsenkénti notify-send folyamatok helyett:
+# - egy rövid ablakon belül érkező változásokat egy összefoglaló értesítésbe vonjuk össze,
+# - eseményenként (pl. meccsenként) legfeljebb egy értesítés megy ki egy időközön belül;
+#   a közben érkező újabb változás a függőben lévőt cseréli, és az időköz leteltével megy ki.
+#   Ez a korlát csak a memóriában él, tehát a daemonban hat; az egyszeri check-notify a
+#   végén mindent kiküld (a késleltetett értesítés a folyamattal elveszne). A futások
+#   közötti ismétlést az állapottár értesítési előzményei szűrik (scores/state.py),
+# - a küldés egy tartós D-Bus kapcsolaton át megy az org.freedesktop.Notifications
+#   szolgáltatásnak (jeepney), notify-send tartalékkal, ha nincs jeepney vagy session bus.
+#
+# Egy helyi, hamis értesítés-szerverrel kipróbálható: python3 -m bench.fake_notifications
+#
+# A jeepney és a subprocess csak az első küldéskor töltődik be, így az értesítés nélküli
+# futások (a sáv ikonja, a legtöbb check-notify) indulását nem lassítják.
+# A küldés ideje 'notify.send' néven, a hibái 'error.notify.*' néven mérődnek (scores/telemetry.py).
+#
+
+import time
+import threading
+
+from scores import telemetry
+
+APP_NAME = "scores"
+ICON = "dialog-information"
+# Az összevonási ablak: ennyi ideig gyűjtjük a változásokat egy értesítés előtt.
+COALESCE_WINDOW = 2.0
+# Eseményenként legfeljebb egy értesítés ennyi másodpercenként.
+PER_EVENT_INTERVAL = 30.0
+# Ennél több összevont változásnál csak az első néhány sor kerül a szövegbe.
+MAX_SUMMARY_LINES = 8
+
+
+class NotifySendSender:
+    """Tartalék: egy notify-send folyamat értesítésenként."""
+    name = "notify-send"
+
+    def send(self, title, body, replaces=0):
+        import subprocess
+        try:
+            subprocess.Popen(['notify-send', '-a', APP_NAME, '-i', ICON, title, body])
+        except FileNotFoundError:
+            pass
+        return 0
+
+
+class DBusSender:
+    """Tartós session bus kapcsolat; hibánál egyszer újracsatlakozik."""
+    name = "dbus"
+
+    def __init__(self, timeout=2.0):
+        from jeepney import DBusAddress
+        from jeepney.io.blocking import open_dbus_connection
+        self.timeout = timeout
+        self.address = DBusAddress(
+            "/org/freedesktop/Notifications",
+            bus_name="org.freedesktop.Notifications",
+            interface="org.freedesktop.Notifications",
+        )
+        self._open = lambda: open_dbus_connection(bus="SESSION")
+        self.conn = self._open()
+
+    def _notify(self, title, body, replaces):
+        from jeepney import new_method_call
+        from jeepney.wrappers import unwrap_msg
+        msg = new_method_call(self.address, "Notify", "susssasa{sv}i",
+                              (APP_NAME, replaces, ICON, title, body, [], {}, -1))
+        reply = self.conn.send_and_get_reply(msg, timeout=self.timeout)
+        # A D-Bus hibaválasz nem kivétel: az unwrap_msg DBusErrorResponse-t dob belőle, így
+        # a Dispatcher a notify-send tartalékra vált.
+        body = unwrap_msg(reply)
+        return body[0] if body else 0
+
+    def send(self, title, body, replaces=0):
+        try:
+            return self._notify(title, body, replaces)
+        except (OSError, ConnectionError):
+            self.conn.close()
+            self.conn = self._open()
+            return self._notify(title, body, replaces)
+
+    def close(self):
+        self.conn.close()
+
+
+def default_sender():
+    """D-Bus, ha a jeepney és a session bus elérhető; egyébként notify-send."""
+    try:
+        return DBusSender()
+    except Exception:
+        # Nincs jeepney, nincs session bus (DBUS_SESSION_BUS_ADDRESS), vagy nem sikerült
+        # a hitelesítés.
+        pass
+    return NotifySendSender()
+
+
+class Dispatcher:
+    """Összevonja és eseményenként korlátozza az értesítéseket.
+
+    submit(key, title, body): key az esemény azonosítója (pl. Eid). Ugyanarra a kulcsra
+    függőben lévő értesítést az újabb felülírja. Az ablak leteltével egy időzítő küldi ki;
+    window=0 esetén nincs időzítő, csak a flush()/close() küld. Egyszeri futásnál az
+    ablaktól függetlenül a close() küld a végén.
+
+    A last_sent (eseményenkénti korlát) és a replaces csak a memóriában van: a korlát
+    egy folyamaton belül, vagyis a daemonban érvényes.
+    """
+
+    def __init__(self, sender=None, window=COALESCE_WINDOW, per_event=PER_EVENT_INTERVAL,
+                 clock=time.monotonic):
+        self.sender = sender
+        self.window = window
+        self.per_event = per_event
+        self.clock = clock
+        self.pending = {}        # kulcs -> (cím, szöveg), beérkezési sorrendben
+        self.last_sent = {}      # kulcs -> utolsó küldés ideje
+        self.replaces = {}       # kulcs -> az utolsó értesítés azonosítója (D-Bus)
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()   # a D-Bus kapcsolatot egyszerre egy szál használja
+        self.timer = None
+        self.stats = {"submitted": 0, "sent": 0, "coalesced": 0, "deferred": 0}
+
+    def _sender(self):
+        if self.sender is None:
+            self.sender = default_sender()
+        return self.sender
+
+    def submit(self, key, title, body):
+        with self.lock:
+            self.stats["submitted"] += 1
+            if key in self.pending:
+                self.stats["coalesced"] += 1
+                del self.pending[key]
+            self.pending[key] = (title, body)
+            if self.window > 0 and self.timer is None:
+                self._schedule(self.window)
+
+    def _schedule(self, delay):
+        self.timer = threading.Timer(delay, self._on_timer)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def _on_timer(self):
+        with self.lock:
+            self.timer = None
+        self.flush()
+
+    def _ready(self, now):
+        """A most küldhető és a még korlátozott függő értesítések szétválasztása."""
+        ready, waiting = [], {}
+        for key, item in self.pending.items():
+            last = self.last_sent.get(key)
+            if last is None or now - last >= self.per_event:
+                ready.append((key, item))
+            else:
+                waiting[key] = item
+        return ready, waiting
+
+    def flush(self):
+        """Kiküldi a küldhető függő értesítéseket (többet egy összefoglalóban)."""
+        with self.lock:
+            now = self.clock()
+            ready, self.pending = self._ready(now)
+            self.stats["deferred"] += len(self.pending)
+            for key, _ in ready:
+                self.last_sent[key] = now
+            if self.pending and self.window > 0 and self.timer is None:
+                wait = min(self.per_event - (now - self.last_sent[key]) for key in self.pending)
+                self._schedule(max(wait, self.window))
+        if not ready:
+            return 0
+
+        if len(ready) == 1:
+            key, (title, body) = ready[0]
+        else:
+            key = None
+            lines = [f"{title} {body}" for _, (title, body) in ready[:MAX_SUMMARY_LINES]]
+            if len(ready) > MAX_SUMMARY_LINES:
+                lines.append(f"… és még {len(ready) - MAX_SUMMARY_LINES}")
+            title, body = f"{len(ready)} változás", "\n".join(lines)
+
+        with self.send_lock, telemetry.timer('notify.send'):
+            try:
+                notification_id = self._sender().send(title, body, self.replaces.get(key, 0))
+            except Exception as e:
+                # A D-Bus szolgáltatás hibázott: innentől notify-send.
+                telemetry.error('notify', e)
+                self.sender = NotifySendSender()
+                notification_id = self.sender.send(title, body)
+            if key is not None:
+                self.replaces[key] = notification_id
+            self.stats["sent"] += 1
+        return len(ready)
+
+    def close(self):
+        """Leállítja az időzítőt, és kiküldi, ami épp küldhető."""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        self.flush()
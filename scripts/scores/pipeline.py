@@ -0,0 +1,116 @@
+#
+# pipeline.py – a sportágaktól független közös csővezeték: letöltés (gyorsítótárral,
+# közös HTTP sessionnel), stage-enkénti dekódolás, normalizálás és archívum.
+#
+# A sportág-specifikus részeket (URL-ek, stage szűrés, esemény -> Match, prioritás,
+# megjelenítés) a scores/sports alatti pluginek adják, lásd scores/sports/base.py.
+# Mérések (scores/telemetry.py): 'fetch' (gyorsítótárral együtt), 'decode' (a fokozatos
+# dekódolás a fejléc-szűréssel), 'process' (stage szűrés és normalizálás).
+#
+
+import json
+import time
+from collections import defaultdict
+
+from scores import filters, http_client, resilience, store, stream, telemetry
+
+# A párhuzamos letöltések felső korlátja (a heti nézet 7 napot kér le).
+MAX_WORKERS = 7
+
+
+def fetch_data(sport, url):
+    """A teljes payload dict-ként (gyorsítótárral, feltételes kérésekkel)."""
+    with telemetry.timer('fetch'):
+        body = http_client.fetch(url, user_agent=sport.user_agent)
+    with telemetry.timer('decode.json'):
+        return json.loads(body)
+
+
+def fetch_stages(sport, url, statuses=None):
+    """Letölti a payloadot, és csak a sportág által kért stage-eket dekódolja (lásd
+    scores/stream.py): a fejléc-szűrőn átmenőket, illetve ha statuses meg van adva,
+    azokat, amelyekben van ilyen státuszú meccs."""
+    with telemetry.timer('fetch'):
+        body = http_client.fetch(url, user_agent=sport.user_agent)
+    require = stream.status_pattern(statuses) if statuses else None
+    return stream.iter_stages(body, keep_stage=sport.keep_stage(filters.get()), require=require)
+
+
+def process(sport, stages, statuses=None):
+    """Stage-ek -> {torna: [Match]}; statuses megadásakor csak az ilyen státuszú meccsek."""
+    events_by_tournament = defaultdict(list)
+    score_filters = filters.get()
+    if sport.stage_order is not None:
+        stages = sorted(stages, key=sport.stage_order)
+
+    for stage in stages:
+        info = sport.stage_info(stage, score_filters)
+        if info is None:
+            continue
+        for event in stage.get('Events', []):
+            try:
+                status = event.get('Eps')
+                if statuses is not None and status not in statuses:
+                    continue
+                match = sport.normalize(event, status, info)
+            except (AttributeError, KeyError, IndexError):
+                continue
+            events_by_tournament[info.name].append(match)
+
+    return events_by_tournament
+
+
+def events_for_url(sport, url, statuses=None):
+    stages = telemetry.TimedIter('decode', fetch_stages(sport, url, statuses))
+    start = time.perf_counter()
+    events = process(sport, stages, statuses)
+    telemetry.record('process', time.perf_counter() - start - stages.elapsed)
+    return events
+
+
+def events_for_day(sport, date_str, statuses=None):
+    """Egy nap eseményei; hiba esetén None."""
+    try:
+        return events_for_url(sport, sport.date_url(date_str), statuses)
+    except Exception as e:
+        telemetry.error('day', e)
+        return None
+
+
+def dated_events_for_day(sport, date_str, statuses=None):
+    """(események, letöltési idő) egy napra: a letöltési idő a kiszolgált payload valódi
+    letöltési ideje (gyorsítótárból vagy elavult tartalékból a bejegyzésé); hiba esetén
+    (None, None)."""
+    with http_client.served() as served_at:
+        events = events_for_day(sport, date_str, statuses)
+    if events is None or not served_at:
+        return None, None
+    return events, min(served_at)
+
+
+def events_for_days(sport, date_strs, statuses=None, max_workers=MAX_WORKERS):
+    """Párhuzamosan letölti több nap eseményeit; az eredmény a bemenet sorrendjét követi.
+    A hibás napok helyén None áll, a többi napot nem érinti."""
+    if not date_strs:
+        return []
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(date_strs))) as pool:
+        return list(pool.map(resilience.bind(lambda day: events_for_day(sport, day, statuses)), date_strs))
+
+
+def stored_events_for_days(sport, date_strs, statuses=None):
+    """Mint az events_for_days, de a lezárt napokat a helyi archívumból veszi (scores/store.py),
+    és csak a még nem tárolt napokat tölti le."""
+    try:
+        return store.events_for_days(sport.name, date_strs,
+                                     resilience.bind(lambda day: dated_events_for_day(sport, day, statuses)),
+                                     sport.store_scope(filters.get()))
+    except store.Error:
+        return events_for_days(sport, date_strs, statuses)
+
+
+def backfill(sport, date_strs, statuses=None):
+    """A hiányzó napok párhuzamos letöltése az archívumba; {nap: események vagy None}."""
+    return store.backfill(sport.name, date_strs,
+                          resilience.bind(lambda day: dated_events_for_day(sport, day, statuses)),
+                          sport.store_scope(filters.get()))
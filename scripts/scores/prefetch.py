@@ -0,0 +1,178 @@
+#
+# prefetch.py – a következő valószínű nézetek előkészítése a kattintás előtt (daemon).
+#
+# A jobb gombos "tegnap" nézet (foci: az elmúlt hét nap) adatai a tegnapi UTC nap vége után,
+# a késő esti meccsek ráhagyásával (cache.final_after) véglegessé válnak, és onnantól nem
+# változnak. A daemon ezért naponta ekkor (yesterday_at) lefuttatja a sportág prefetch_views
+# parancsait (alapból 'full yesterday'): a napok letöltődnek az archívumba (scores/store.py),
+# és a kész kimenet a memóriában marad; a kattintás ezt kapja, letöltés és megjelenítés
+# nélkül. Ha csak egy nap is nem tölthető le, semmi sem kerül a memóriába, és a munka
+# RETRY_INTERVAL múlva újra fut (a hiányos kimenet különben egész nap kiszolgálódna).
+# Az előkészített kimenet addig érvényes, amíg a nap és a szűrők (scores/filters.py) nem
+# változnak. A találati arány és az előtöltésre elköltött kérések/bájtok a 'prefetch'
+# paranccsal kérdezhetők le (a daemontól; daemon nélkül a parancs most futtatja a munkákat).
+#
+# Kikapcsolás: SCORES_NO_PREFETCH=1. Mérés: python3 -m bench.prefetch
+#
+
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+
+from scores import cache, filters, http_client, telemetry
+
+# Hibás munka újrapróbálása, és a leghosszabb várakozás (felfüggesztés után is időben ébredjünk).
+RETRY_INTERVAL = 10 * 60
+MAX_WAIT = 15 * 60
+
+ENABLED = not os.environ.get("SCORES_NO_PREFETCH")
+
+# sportág neve -> a daemonban futó Prefetcher
+_prefetchers = {}
+
+
+def yesterday_at(now):
+    """A mai 'yesterday' munka ideje (helyi): amikor a tegnapi nap payloadja végleges lesz."""
+    return datetime.fromtimestamp(cache.final_after((now - timedelta(days=1)).strftime("%Y%m%d")))
+
+
+def is_due(when, now):
+    """Elmúlt-e a munka mai időpontja (when(now))."""
+    return now >= when(now)
+
+
+def _format_bytes(count):
+    for unit in ("B", "KiB", "MiB"):
+        if count < 1024 or unit == "MiB":
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+
+
+class Prefetcher:
+    """Egy sportág előtöltő munkái, az előkészített kimenetek és a számlálók."""
+
+    def __init__(self, sport):
+        self.sport = sport
+        self.jobs = {"yesterday": (yesterday_at, self._yesterday)}
+        self.views = {}         # argumentumok -> (nap, szűrők, kimenet)
+        self.last_run = {}      # munka -> (nap, időpont)
+        self.failed = {}        # munka -> a következő próba (epoch)
+        self.spent = {name: {"requests": 0, "bytes": 0} for name in self.jobs}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    # --- Kiszolgálás ---
+
+    def serve(self, args):
+        """Az előkészített kimenet, ha az argumentumokhoz van érvényes; egyébként None."""
+        key = tuple(args)
+        if key not in self.sport.prefetch_views:
+            return None
+        with self.lock:
+            entry = self.views.get(key)
+            if entry and entry[0] == datetime.now().strftime("%Y%m%d") and entry[1] is filters.get():
+                self.hits += 1
+                telemetry.count('prefetch.hit')
+                return entry[2]
+            self.misses += 1
+            telemetry.count('prefetch.miss')
+            return None
+
+    # --- Munkák ---
+
+    def _yesterday(self):
+        # Háttérfutásban a hiányos nézet kivételt dob (resilience.partial_ok), így semmi sem
+        # kerül be; a már kész nézetek csak a végén, együtt.
+        day = datetime.now().strftime("%Y%m%d")
+        views = {args: (day, filters.get(), self.sport.run(list(args), background=True))
+                 for args in self.sport.prefetch_views}
+        with self.lock:
+            self.views.update(views)
+
+    def run_job(self, name):
+        """Egy munka futtatása most; a kéréseit és bájtjait a munkához számolja."""
+        _, job = self.jobs[name]
+        with http_client.tally() as counts:
+            try:
+                job()
+            except Exception:
+                self.failed[name] = time.time() + RETRY_INTERVAL
+                raise
+            finally:
+                self.spent[name]["requests"] += counts["requests"]
+                self.spent[name]["bytes"] += counts["bytes"]
+        self.failed.pop(name, None)
+        self.last_run[name] = (datetime.now().strftime("%Y%m%d"), time.time())
+
+    def due(self, now=None):
+        """A most esedékes munkák: ma még nem futottak, és elmúlt a napi időpontjuk."""
+        now = now or datetime.now()
+        today = now.strftime("%Y%m%d")
+        return [name for name, (when, _) in self.jobs.items()
+                if self.last_run.get(name, (None,))[0] != today and is_due(when, now)
+                and self.failed.get(name, 0) <= now.timestamp()]
+
+    def _loop(self):
+        while not self.stopped.is_set():
+            for name in self.due():
+                try:
+                    self.run_job(name)
+                except Exception as e:
+                    telemetry.error('prefetch', e)
+            self.stopped.wait(self._wait())
+
+    def _wait(self):
+        """Másodpercek a következő esedékes munkáig (legfeljebb MAX_WAIT)."""
+        now = datetime.now()
+        waits = [MAX_WAIT] + [max(1, at - now.timestamp()) for at in self.failed.values()]
+        for when, _ in self.jobs.values():
+            start = when(now)
+            if start > now:
+                waits.append((start - now).total_seconds())
+        return min(waits)
+
+    def start(self):
+        threading.Thread(target=self._loop, name=f"prefetch-{self.sport.name}", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+
+    # --- Jelentés ---
+
+    def report(self):
+        lookups = self.hits + self.misses
+        rate = (f"{self.hits}/{lookups} ({100 * self.hits / lookups:.0f}%)" if lookups
+                else "még nem volt kattintás")
+        lines = [f"Előtöltés ({self.sport.name}): találat {rate}"]
+        now = datetime.now()
+        for name, (when, _) in self.jobs.items():
+            spent = self.spent[name]
+            last = self.last_run.get(name)
+            last_at = datetime.fromtimestamp(last[1]).strftime("%m-%d %H:%M") if last else "még nem futott"
+            lines.append(f"  {name:<10} {when(now):%H:%M}-kor; utoljára: {last_at}, "
+                         f"{spent['requests']} kérés, {_format_bytes(spent['bytes'])}")
+        total_requests = sum(spent["requests"] for spent in self.spent.values())
+        total_bytes = sum(spent["bytes"] for spent in self.spent.values())
+        lines.append(f"  összesen: {total_requests} kérés, {_format_bytes(total_bytes)}")
+        return "\n".join(lines)
+
+
+def get(sport):
+    """A sportág daemonban futó előtöltője, vagy None."""
+    return _prefetchers.get(sport.name)
+
+
+def serve(sport, args):
+    """Az előkészített kimenet a daemonban, ha van; egyébként None."""
+    prefetcher = _prefetchers.get(sport.name)
+    return prefetcher.serve(args) if prefetcher is not None else None
+
+
+def start(sport):
+    """Elindítja a sportág előtöltőjét (a daemon hívja)."""
+    prefetcher = _prefetchers[sport.name] = Prefetcher(sport).start()
+    return prefetcher
@@ -0,0 +1,236 @@
+#
+# render.py – közös megjelenítés mindkét sportághoz, cserélhető kimeneti backenddel.
+#
+# Backendek:
+# - ansi:  színes terminál kimenet (less -R, a scores néző)
+# - pango: Pango markup a Qtile widgetekhez és popupokhoz
+# - plain: dísztelen szöveg szkripteknek
+# - json:  strukturált kimenet (nem soronként renderel, lásd to_json)
+#
+# A meccssorokat eseményenként memoizáljuk: a kulcs a backend és a meccs teljes
+# állapota, így egy gyakran frissülő élő nézetben csak a változott állású meccsek
+# sorát kell újra felépíteni.
+#
+
+import json
+import time
+import threading
+
+from scores.model import Side, Status, fmt_score
+
+# Ennyi renderelt sort tartunk meg (egy heti foci archívum is belefér);
+# betelésnél a legrégebbi fele kiesik.
+MAX_CACHED_LINES = 16384
+
+
+class Backend:
+    """Dísztelen szöveg; a többi backend ezt bővíti."""
+    name = 'plain'
+
+    def escape(self, text):
+        return text
+
+    def style(self, text, *styles):
+        return text
+
+
+class AnsiBackend(Backend):
+    name = 'ansi'
+    RESET = '\033[0m'
+    CODES = {
+        'bold': '\033[1m', 'dim': '\033[2m', 'cyan': '\033[96m', 'green': '\033[92m',
+        'red': '\033[91m', 'yellow': '\033[93m', 'white': '\033[97m', 'magenta': '\033[95m',
+    }
+
+    def style(self, text, *styles):
+        return "".join(self.CODES[s] for s in styles) + text + self.RESET
+
+
+class PangoBackend(Backend):
+    name = 'pango'
+    # A Dracula paletta színei, ugyanazok, mint az alacritty és a sáv beállításaiban.
+    ATTRS = {
+        'bold': 'weight="bold"', 'dim': 'alpha="60%"', 'cyan': 'foreground="#8be9fd"',
+        'green': 'foreground="#50fa7b"', 'red': 'foreground="#ff5555"',
+        'yellow': 'foreground="#f1fa8c"', 'white': 'foreground="#ffffff"',
+        'magenta': 'foreground="#ff79c6"',
+    }
+
+    def escape(self, text):
+        # Mint az xml.sax.saxutils.escape, de annak importja (urllib.request) nélkül.
+        return text.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+
+    def style(self, text, *styles):
+        return f"<span {' '.join(self.ATTRS[s] for s in styles)}>{text}</span>"
+
+
+ANSI = AnsiBackend()
+PANGO = PangoBackend()
+PLAIN = Backend()
+JSON = 'json'
+
+BACKENDS = {'ansi': ANSI, 'pango': PANGO, 'plain': PLAIN, 'json': JSON}
+
+
+def backend_from_args(args, default=ANSI):
+    """A parancssori argumentumok közül az első backend név (pl. 'full plain'), vagy az alapértelmezett."""
+    for arg in args:
+        if arg in BACKENDS:
+            return BACKENDS[arg]
+    return default
+
+
+class LineCache:
+    """Memo a renderelt sorokhoz. Olvasáskor nincs zár (a dict.get atomi); íráskor van,
+    mert a daemon több szálon renderel."""
+
+    def __init__(self, max_lines=MAX_CACHED_LINES):
+        self.max_lines = max_lines
+        self.lines = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build, *args):
+        line = self.lines.get(key)
+        if line is not None:
+            self.hits += 1
+            return line
+        line = build(*args)
+        with self.lock:
+            self.misses += 1
+            if len(self.lines) >= self.max_lines:
+                for old in list(self.lines)[:self.max_lines // 2]:
+                    del self.lines[old]
+            self.lines[key] = line
+        return line
+
+    def clear(self):
+        with self.lock:
+            self.lines.clear()
+            self.hits = self.misses = 0
+
+
+CACHE = LineCache()
+
+
+def _state(match):
+    # A sor a meccs minden megjelenített mezőjétől függ (a torna és a prioritás nem kell).
+    return (match.eid, match.name1, match.name2, match.status, match.score1, match.score2,
+            match.games1, match.games2, match.clock, match.winner, match.server)
+
+
+def heading(text, backend):
+    return backend.style(f"--- {backend.escape(text)} ---", 'bold', 'cyan')
+
+
+def title(text, backend):
+    return backend.style(f"📅 {backend.escape(text)}", 'bold', 'white')
+
+
+def stale_note(fetched_at, backend):
+    """Figyelmeztető sor, ha az adat (egy része) elavult gyorsítótár-bejegyzésből jön."""
+    fmt = "%H:%M" if time.time() - fetched_at < 20 * 3600 else "%m-%d %H:%M"
+    since = time.strftime(fmt, time.localtime(fetched_at))
+    return backend.style(f"⚠ Elavult adat ({since}-kori állapot): a livescore nem válaszolt időben", 'yellow')
+
+
+def _soccer_line(match, b):
+    t1 = b.escape(match.name1)
+    t2 = b.escape(match.name2)
+    if match.winner is Side.FIRST:
+        t1, t2 = b.style(t1, 'green'), b.style(t2, 'red')
+    elif match.winner is Side.SECOND:
+        t2, t1 = b.style(t2, 'green'), b.style(t1, 'red')
+
+    if match.status is Status.UPCOMING:
+        return f"  {t1} vs {t2} {b.style('(Hamarosan)', 'dim')}"
+    if match.status is Status.CALLED_OFF:
+        return f"  {t1} vs {t2} {b.style(f'({b.escape(str(match.clock))})', 'dim')}"
+    score = f"{fmt_score(match.score1)} - {fmt_score(match.score2)}"
+    return f"  {t1} vs {t2} [{b.style(score, 'yellow')}] ({b.style(b.escape(str(match.clock)), 'yellow')})"
+
+
+def soccer_line(match, backend):
+    """Egy foci meccs sora (memoizálva)."""
+    return CACHE.get((backend.name, _state(match)), _soccer_line, match, backend)
+
+
+def _tennis_line(match, b, favorite1, favorite2):
+    p1 = b.escape(match.name1)
+    p2 = b.escape(match.name2)
+
+    if favorite1:
+        p1 = b.style(f"⭐ {p1}", 'magenta')
+    if favorite2:
+        p2 = b.style(f"⭐ {p2}", 'magenta')
+
+    if match.server is Side.FIRST:
+        p1 = f"{b.style('●', 'green')} {p1}"
+    elif match.server is Side.SECOND:
+        p2 = f"{b.style('●', 'green')} {p2}"
+
+    if match.winner is Side.FIRST:
+        p1, p2 = b.style(p1, 'green'), b.style(p2, 'red')
+    elif match.winner is Side.SECOND:
+        p2, p1 = b.style(p2, 'green'), b.style(p1, 'red')
+
+    sets = f"{fmt_score(match.score1)}-{fmt_score(match.score2)}"
+    if match.games1 is not None and match.games2 is not None:
+        score = f"[{b.style(sets, 'yellow')}] ({b.style(f'{match.games1}-{match.games2}', 'yellow')})"
+    elif match.status is Status.UPCOMING:
+        score = b.style("(Hamarosan)", 'dim')
+    else:
+        score = f"[{b.style(sets, 'yellow')}]"
+
+    return f"  {p1} v {p2} {score}"
+
+
+def tennis_line(match, backend, is_favorite):
+    """Egy tenisz meccs sora a kedvencek kiemelésével (memoizálva)."""
+    favorite1 = is_favorite(match.name1)
+    favorite2 = is_favorite(match.name2)
+    key = (backend.name, favorite1, favorite2, _state(match))
+    return CACHE.get(key, _tennis_line, match, backend, favorite1, favorite2)
+
+
+def soccer_block(events_by_tournament, backend, title_text=""):
+    """Egy nap foci eseményei tornánként, opcionális főcímmel."""
+    if not events_by_tournament:
+        return ""
+    lines = []
+    if title_text:
+        lines.append(title(title_text, backend))
+    for tournament, events in sorted(events_by_tournament.items()):
+        lines.append(heading(tournament, backend))
+        lines.extend(soccer_line(match, backend) for match in events)
+        lines.append("")
+    return "\n".join(lines)
+
+
+def tennis_block(events_by_tournament, backend, is_favorite):
+    """Tenisz események tornánként, a torna prioritása szerint rendezve."""
+    lines = []
+    for tournament, events in sorted(events_by_tournament.items(), key=lambda item: item[1][0].priority):
+        lines.append(heading(tournament, backend))
+        lines.extend(tennis_line(match, backend, is_favorite) for match in events)
+        lines.append("")
+    return "\n".join(lines)
+
+
+def match_dict(match):
+    return {
+        "eid": match.eid, "name1": match.name1, "name2": match.name2,
+        "status": match.status.value, "score1": match.score1, "score2": match.score2,
+        "games1": match.games1, "games2": match.games2, "clock": match.clock,
+        "winner": match.winner and match.winner.value, "server": match.server and match.server.value,
+    }
+
+
+def to_json(sections):
+    """[(cím, {torna: [Match]})] → JSON; a napokat/nézeteket 'title' szerint adja vissza."""
+    return json.dumps([
+        {"title": section_title,
+         "tournaments": {t: [match_dict(m) for m in events] for t, events in events_by_tournament.items()}}
+        for section_title, events_by_tournament in sections
+    ], ensure_ascii=False)
@@ -0,0 +1,207 @@
+#
+# resilience.py – határidők, elavult adat és megszakító a letöltések körül.
+#
+# Ha a livescore lassú vagy nem elérhető, egy kattintás ne várjon kérésenként 10
+# másodpercet (a heti nézet hét, a tenisz mai nézete két kérést fűz egymás után):
+# - Parancsonkénti határidő (budget): a parancs összes kérése, a párhuzamos napi
+#   letöltésekkel együtt, ugyanabból a keretből gazdálkodik; a kérések időkorlátja a
+#   hátralévő idő.
+# - Elavult adat: ha a határidő lejár vagy a kérés hibázik, és a parancs megengedi, a
+#   gyorsítótár utolsó jó válasza szolgál ki, és a kimenet elavultként jelölődik.
+#   A daemonban a megszakadt kérés a háttérben, teljes időkorláttal újra lefut, hogy
+#   a következő kattintás friss adatot kapjon (stale-while-revalidate).
+# - Megszakító (circuit breaker): hostonként FAILURE_THRESHOLD egymást követő hiba
+#   után a kérések a várakozási idő lejártáig ki sem mennek (rögtön a gyorsítótár jön);
+#   utána egy próbakérés mehet, hiba esetén a várakozás duplázódik. Az állapot a
+#   $XDG_RUNTIME_DIR alatt van, így az egyszeri parancssori futások is közösen látják.
+#
+# Kipróbálás hibázó/lefagyó helyi szerverrel: python3 -m bench.outage
+#
+
+import os
+import json
+import time
+import tempfile
+import threading
+import contextvars
+from contextlib import contextmanager
+
+BREAKER_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), "scores-breaker.json"
+)
+FAILURE_THRESHOLD = 3
+BACKOFF = 5.0
+MAX_BACKOFF = 300.0
+# Félig nyitott állapotban ennyi ideig csak a próbakérés mehet ki.
+TRIAL_WINDOW = 10.0
+# Ennél kevesebb hátralévő időnél már el sem indítjuk a kérést.
+MIN_REQUEST_TIME = 0.05
+
+# A parancsonkénti határidők felülírása másodpercben (0: nincs határidő).
+DEADLINE_OVERRIDE = os.environ.get("SCORES_DEADLINE")
+# A daemon kapcsolja be: az elavult adattal kiszolgált kérések a háttérben újra lefutnak.
+BACKGROUND_REVALIDATE = False
+
+
+class Unavailable(Exception):
+    """A végpont nem érhető el (megszakító nyitva, vagy lejárt a határidő), és nincs
+    tartalék adat."""
+
+
+class Budget:
+    """Egy parancs kerete: abszolút határidő (monotonic), a kiszolgált elavult
+    bejegyzések letöltési ideje, és hogy jó-e a hiányos (néhány nap nélküli) eredmény."""
+
+    def __init__(self, seconds, stale_ok, partial_ok=True):
+        self.deadline = time.monotonic() + seconds if seconds else None
+        self.stale_ok = stale_ok
+        self.partial_ok = partial_ok
+        self.stale = []
+
+    def remaining(self, limit):
+        if self.deadline is None:
+            return limit
+        return min(limit, self.deadline - time.monotonic())
+
+
+_budget = contextvars.ContextVar("scores_budget", default=None)
+
+
+@contextmanager
+def budget(seconds=None, stale_ok=False, partial_ok=True):
+    """Határidő és elavult-adat szabály a blokkban (és a bind()-olt szálakban) futó letöltésekre."""
+    if DEADLINE_OVERRIDE is not None:
+        seconds = float(DEADLINE_OVERRIDE) or None
+    current = Budget(seconds, stale_ok, partial_ok)
+    token = _budget.set(current)
+    try:
+        yield current
+    finally:
+        _budget.reset(token)
+
+
+def bind(fn):
+    """A hívó keretét átviszi egy másik szálon (pl. ThreadPoolExecutor) futó függvénybe."""
+    context = contextvars.copy_context()
+    return lambda *args: context.copy().run(fn, *args)
+
+
+def timeout(limit):
+    """A következő kérés időkorlátja: a kérésenkénti korlát és a hátralévő idő közül a kisebb."""
+    current = _budget.get()
+    return limit if current is None else current.remaining(limit)
+
+
+def stale_ok():
+    current = _budget.get()
+    return current is not None and current.stale_ok
+
+
+def partial_ok():
+    """Jó-e a több napos nézet a le nem tölthető napok nélkül (a háttérmunkának nem)."""
+    current = _budget.get()
+    return current is None or current.partial_ok
+
+
+def mark_stale(fetched_at):
+    current = _budget.get()
+    if current is not None:
+        current.stale.append(fetched_at)
+
+
+def stale_since():
+    """A kiszolgált legrégebbi elavult adat letöltési ideje, vagy None, ha minden friss."""
+    current = _budget.get()
+    return min(current.stale) if current is not None and current.stale else None
+
+
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+
+def revalidate_in_background(key, fn):
+    """A daemonban fn-t egy háttérszálon futtatja (kulcsonként egyszerre csak egyet)."""
+    if not BACKGROUND_REVALIDATE:
+        return
+    with _revalidating_lock:
+        if key in _revalidating:
+            return
+        _revalidating.add(key)
+
+    def run():
+        try:
+            fn()
+        except Exception:
+            pass
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(key)
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+class Breaker:
+    """Hostonkénti megszakító, az állapot egy kis JSON fájlban:
+    {host: {"failures": n, "backoff": s, "open_until": időpont}}."""
+
+    def __init__(self, path=BREAKER_PATH, clock=time.time):
+        self.path = path
+        self.clock = clock
+        self.lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, states):
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(states, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def allow(self, key):
+        """Mehet-e kérés; lejárt várakozás után csak egy próbakérés (félig nyitott állapot)."""
+        with self.lock:
+            states = self._load()
+            state = states.get(key)
+            if not state or state["failures"] < FAILURE_THRESHOLD:
+                return True
+            now = self.clock()
+            if now < state["open_until"]:
+                return False
+            state["open_until"] = now + TRIAL_WINDOW
+            self._save(states)
+            return True
+
+    def retry_in(self, key):
+        """Másodpercek a következő próbáig (0, ha a megszakító zárva van)."""
+        state = self._load().get(key)
+        if not state or state["failures"] < FAILURE_THRESHOLD:
+            return 0
+        return max(0, state["open_until"] - self.clock())
+
+    def success(self, key):
+        with self.lock:
+            states = self._load()
+            if key in states:
+                del states[key]
+                self._save(states)
+
+    def failure(self, key):
+        with self.lock:
+            states = self._load()
+            state = states.setdefault(key, {"failures": 0, "backoff": 0, "open_until": 0})
+            state["failures"] += 1
+            if state["failures"] >= FAILURE_THRESHOLD:
+                state["backoff"] = min(MAX_BACKOFF, state["backoff"] * 2 or BACKOFF)
+                state["open_until"] = self.clock() + state["backoff"]
+            self._save(states)
+
+
+BREAKER = Breaker()
@@ -0,0 +1,158 @@
+#
+# schedule.py – adatvezérelt lekérdezési ütem az élő értesítésekhez és a sávhoz.
+#
+# Fix időközű lekérdezés helyett a következő ébredést maga az adat adja:
+# - ha egy figyelt meccs (teniszben a kedvencek meccsei) zajlik: LIVE_INTERVAL,
+# - ha csak ezután kezdődő (NS) meccsek vannak: a legközelebbi kezdés előtt START_LEAD-del
+#   ébredünk, addig legfeljebb SCHEDULED_INTERVAL-onként nézünk rá (a sorrend változhat),
+# - ha a kezdési idő elmúlt, de a meccs még nem indult el: OVERDUE_INTERVAL,
+# - ha ma már nincs figyelt meccs: "éjszakai" pihenő a holnapi első kezdésig, legfeljebb
+#   IDLE_INTERVAL-ig.
+# A kezdési idők a dátum payload 'Esd' mezőjéből jönnek (YYYYMMDDhhmmss; a /0 végű
+# URL-ek miatt UTC). A payloadok a közös gyorsítótárból jönnek (scores/cache.py), így a
+# tervezés a lekérdezés mellett legfeljebb a dátum payload ritka frissítésébe kerül.
+#
+# A daemon a sportágak polled_commands parancsait (teniszben a check-notify) egy Poller
+# szálon ebben az ütemben futtatja; a sáv widget a 'view' JSON 'next_poll' mezőjéből
+# állítja a saját frissítési idejét.
+#
+# A fix és az adaptív ütem összevetése egy szimulált napon: python3 -m bench.polling
+#
+
+import time
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from scores import filters, pipeline, telemetry
+from scores.model import Status
+
+LIVE_INTERVAL = 30
+SCHEDULED_INTERVAL = 15 * 60
+OVERDUE_INTERVAL = 60
+IDLE_INTERVAL = 6 * 3600
+START_LEAD = 60
+MIN_INTERVAL = 15
+# Hiba után (pl. nyitott megszakító, lásd scores/resilience.py) ennyi múlva próbáljuk újra.
+RETRY_INTERVAL = 2 * 60
+# Ennél régebben "kezdődő", de még el nem indult meccsre már nem várunk (elhalasztották).
+OVERDUE_WINDOW = 3 * 3600
+
+# A következő lekérdezés: késleltetés másodpercben és az ok (naplóhoz, 'next_poll' mellé).
+Plan = namedtuple('Plan', 'delay reason')
+
+
+def parse_start(esd):
+    """Az 'Esd' kezdési idő epoch másodpercben, vagy None."""
+    try:
+        return datetime.strptime(str(esd), "%Y%m%d%H%M%S").replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def next_poll(live, starts, later_starts, now):
+    """A következő lekérdezés terve.
+    live: zajló figyelt meccsek száma; starts: a mai, még el nem kezdődött figyelt meccsek
+    kezdési ideje; later_starts: ugyanez holnapra (None, ha nem kellett letölteni)."""
+    if live:
+        return Plan(LIVE_INTERVAL, 'élő')
+    upcoming = [start for start in starts if start > now - OVERDUE_WINDOW]
+    if upcoming:
+        wait = min(upcoming) - START_LEAD - now
+        if wait <= 0:
+            return Plan(OVERDUE_INTERVAL, 'kezdésre vár')
+        return Plan(max(MIN_INTERVAL, min(wait, SCHEDULED_INTERVAL)), 'kezdés')
+    later = [start for start in later_starts or () if start > now]
+    if later:
+        return Plan(max(MIN_INTERVAL, min(min(later) - START_LEAD - now, IDLE_INTERVAL)), 'holnap')
+    return Plan(IDLE_INTERVAL, 'nincs meccs')
+
+
+def _watched(sport, url, statuses):
+    """A figyelt meccsek egy payloadból: (Match, nyers esemény) párok."""
+    score_filters = filters.get()
+    watched = sport.watched(score_filters)
+    for stage in pipeline.fetch_stages(sport, url, statuses):
+        info = sport.stage_info(stage, score_filters)
+        if info is None:
+            continue
+        for event in stage.get('Events', []):
+            try:
+                match = sport.normalize(event, event.get('Eps'), info)
+            except (AttributeError, KeyError, IndexError):
+                continue
+            if watched is None or watched(match):
+                yield match, event
+
+
+def live_count(sport, events_by_tournament):
+    """A figyelt élő meccsek száma egy már feldolgozott nézetben. A nézet a prioritize()
+    előtti legyen: a főtornákra szűrés egy kedvenc más tornán zajló meccsét is elhagyná."""
+    watched = sport.watched(filters.get())
+    return sum(1 for events in events_by_tournament.values() for match in events
+               if match.status is Status.LIVE and (watched is None or watched(match)))
+
+
+def _starts(sport, day):
+    starts = []
+    for _, event in _watched(sport, sport.date_url(day.strftime("%Y%m%d")), ['NS']):
+        if event.get('Eps') == 'NS':
+            start = parse_start(event.get('Esd'))
+            if start is not None:
+                starts.append(start)
+    return starts
+
+
+def plan_for(sport, events_by_tournament=None, now=None):
+    """A sportág következő lekérdezésének terve. Az élő meccseket a megadott nézetből, vagy
+    ha nincs, az élő payloadból számolja; a kezdési időket a mai (ha ma már nincs figyelt
+    meccs, a holnapi) dátum payloadból. Hiba esetén RETRY_INTERVAL."""
+    now = time.time() if now is None else now
+    try:
+        if events_by_tournament is None:
+            live = sum(1 for match, _ in _watched(sport, sport.live_url(), None)
+                       if match.status is Status.LIVE)
+        else:
+            live = live_count(sport, events_by_tournament)
+        if live:
+            return next_poll(live, (), None, now)
+        today = datetime.fromtimestamp(now)
+        starts = _starts(sport, today)
+        later_starts = None
+        if not [start for start in starts if start > now - OVERDUE_WINDOW]:
+            later_starts = _starts(sport, today + timedelta(days=1))
+        return next_poll(0, starts, later_starts, now)
+    except Exception as e:
+        telemetry.error('schedule', e)
+        return Plan(RETRY_INTERVAL, 'hiba')
+
+
+class Poller:
+    """Egy sportág parancsát futtatja háttérszálon, a sportág poll_plan()-je szerinti ütemben.
+    A legutóbbi terv és a futások száma a last_plan/runs mezőkben látszik."""
+
+    def __init__(self, sport, command):
+        self.sport = sport
+        self.command = command
+        self.stopped = threading.Event()
+        self.last_plan = None
+        self.runs = 0
+        self.thread = threading.Thread(target=self._loop, name=f"poll-{sport.name}-{command}", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+
+    def _loop(self):
+        delay = 0
+        while not self.stopped.wait(delay):
+            try:
+                self.sport.run([self.command])
+            except Exception as e:
+                telemetry.error('poll', e)
+            self.runs += 1
+            self.last_plan = self.sport.poll_plan(self.command)
+            delay = self.last_plan.delay
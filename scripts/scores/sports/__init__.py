@@ -0,0 +1,28 @@
+#
+# scores.sports – sportág pluginek (lásd base.py).
+#
+# Új sportág: egy modul egy SPORT példánnyal (a Sport osztály leszármazottja),
+# és egy sor a _MODULES-ban (modul és a sáv ikonja). A modulok csak az első használatkor
+# töltődnek be; az argumentum nélküli futás (a sáv ikonja) be sem tölti őket.
+#
+
+import importlib
+
+_MODULES = {
+    'soccer': ('scores.sports.soccer', '⚽'),
+    'tennis': ('scores.sports.tennis', '🎾'),
+}
+
+
+def names():
+    return list(_MODULES)
+
+
+def get(name):
+    """A sportág plugin példánya; ismeretlen névre KeyError."""
+    return importlib.import_module(_MODULES[name][0]).SPORT
+
+
+def icon(name):
+    """A sportág ikonja a plugin betöltése nélkül; ismeretlen névre KeyError."""
+    return _MODULES[name][1]
@@ -0,0 +1,229 @@
+#
+# base.py – a sportág pluginek közös felülete és parancsai.
+#
+# Egy plugin megadja:
+# - az URL-eket (date_url, live_url; alapból a livescore API sportág-útvonala),
+# - a stage szűrést dekódolás előtt (keep_stage) és a stage adatait (stage_info),
+# - az esemény -> Match normalizálást (normalize) és a fontossági szűrést (prioritize),
+# - a megjelenítést (render, summary) és a mai nézetet (today).
+# A letöltés, gyorsítótár, dekódolás, archívum és a közös parancsok (view, full,
+# backfill, history) a scores/pipeline.py és ez az osztály dolgában vannak.
+# A parancsok határidővel futnak (deadlines, lásd scores/resilience.py); a 'view' és a
+# 'full' lejárt határidőnél vagy hibánál az utolsó jó adatot mutatja, elavultként jelölve.
+# A lekérdezések ütemét a figyelt meccsek (watched) állapota és kezdési ideje adja, lásd
+# scores/schedule.py; a daemon a polled_commands parancsokat maga futtatja ebben az ütemben.
+# A prefetch_views nézeteket a daemon naponta előre elkészíti (scores/prefetch.py).
+# A parancsok futásideje 'command.<sportág>.<parancs>' néven mérődik (scores/telemetry.py).
+#
+
+import json
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from scores import filters, http_client, pipeline, prefetch, render, resilience, schedule, store, telemetry
+from scores.render import ANSI, PANGO
+
+# Egy stage megjelenítési adatai: torna neve, rendezési prioritás, főtorna-e.
+StageInfo = namedtuple('StageInfo', 'name priority main_tour')
+
+
+def last_days(count):
+    """Az elmúlt napok dátumai (tegnaptól visszafelé)."""
+    return [datetime.now() - timedelta(days=i) for i in range(1, count + 1)]
+
+
+class Sport:
+    name = ''
+    icon = ''
+    user_agent = 'scores/1.0'
+    # Ezeket a parancsokat a daemon szolgálja ki, ha fut.
+    daemon_commands = ('full', 'view', 'prefetch')
+    # A parancsok sorrendje: az első, amelyik szerepel az argumentumok között, fut le.
+    commands = ('view', 'backfill', 'history', 'prefetch', 'full')
+    # Az archívumba kerülő napok státuszai (None: mind).
+    archive_statuses = None
+    # A 'history' alapértelmezett időablaka napokban.
+    history_days = 30
+    # Opcionális kulcsfüggvény a stage-ek rendezéséhez normalizálás előtt.
+    stage_order = None
+    # Parancsonkénti teljes határidő másodpercben; a többinek csak kérésenkénti időkorlátja van.
+    deadlines = {'view': 4.0, 'full': 6.0}
+    # Ezeknél a parancsoknál hiba vagy lejárt határidő esetén elavult adat is megfelel.
+    stale_commands = ('view', 'full')
+    # Ezeket a parancsokat a daemon a háttérben, adaptív ütemben futtatja (scores/schedule.py).
+    polled_commands = ()
+    # Ezeket a nézeteket (pontos argumentumlista) a daemon a tegnapi nap véglegessé válása
+    # után előre elkészíti (scores/prefetch.py).
+    prefetch_views = (('full', 'yesterday'),)
+
+    # --- A pluginek által megadott részek ---
+
+    def date_url(self, date_str):
+        return http_client.date_url(self.name, date_str)
+
+    def live_url(self):
+        return http_client.live_url(self.name)
+
+    def keep_stage(self, score_filters):
+        """Opcionális (Cnm, Snm) -> bool szűrő a dekódolás előtt."""
+        return None
+
+    def stage_info(self, stage, score_filters):
+        """A stage StageInfo-ja, vagy None, ha a stage nem kell."""
+        raise NotImplementedError
+
+    def normalize(self, event, status, info):
+        """Egy nyers eseményből Match (a pipeline az AttributeError/KeyError/IndexError-t eldobja)."""
+        raise NotImplementedError
+
+    def prioritize(self, events_by_tournament):
+        return events_by_tournament
+
+    def store_scope(self, score_filters):
+        """Az archívum szűrési köre; ha változik, a tárolt napokat újra letöltjük."""
+        return ""
+
+    def render(self, events_by_tournament, backend=ANSI, title=""):
+        raise NotImplementedError
+
+    def summary(self, events_by_tournament, backend=PANGO):
+        return self.icon
+
+    def watched(self, score_filters):
+        """Match -> bool: mely meccsekhez igazodjon a lekérdezések üteme (None: mind)."""
+        return None
+
+    def poll_plan(self, command=None, events_by_tournament=None):
+        """A következő lekérdezés terve (schedule.Plan) az adott parancshoz."""
+        return schedule.plan_for(self, events_by_tournament)
+
+    def today(self):
+        """A mai nézet eseményei, a prioritize() előtt (az ütem ezekből számol); hiba
+        esetén kivételt dob."""
+        raise NotImplementedError
+
+    def yesterday_days(self):
+        """A 'full yesterday' napjai."""
+        return last_days(1)
+
+    def empty_text(self, period):
+        return "Nincsenek megjeleníthető események."
+
+    def close(self):
+        """Egyszeri futás végén hívódik (pl. függő értesítések kiküldése)."""
+
+    # --- Közös parancsok ---
+
+    def run(self, args, background=False):
+        """Egy parancs végrehajtása; a kimenetet sztringként adja vissza (a daemon is ezt hívja).
+        background: háttérmunka (előtöltés), nincs határidő, és elavult adat sem jó."""
+        filters.refresh()
+        if not background:
+            output = prefetch.serve(self, args)
+            if output is not None:
+                return output
+        for command in self.commands:
+            if command in args:
+                deadline = None if background else self.deadlines.get(command)
+                stale_ok = not background and command in self.stale_commands
+                with resilience.budget(deadline, stale_ok=stale_ok, partial_ok=not background), \
+                        telemetry.timer(f'command.{self.name}.{command}'):
+                    return getattr(self, 'cmd_' + command.replace('-', '_'))(args)
+        return self.icon
+
+    def cmd_view(self, args):
+        """A sáv widget nézete egyetlen letöltésből: Pango összefoglaló, teljes mai lista és
+        a következő frissítésig javasolt idő másodpercben (JSON)."""
+        try:
+            events = self.today()
+        except Exception as e:
+            telemetry.error('view', e)
+            return json.dumps({"summary": f"{self.icon} ?", "full": f"{self.icon} Hiba: {e}",
+                               "next_poll": schedule.RETRY_INTERVAL})
+        shown = self.prioritize(events)
+        full = self.render(shown) if shown else self.empty_text('today')
+        summary = self.summary(shown)
+        stale_since = resilience.stale_since()
+        if stale_since is not None:
+            full = f"{render.stale_note(stale_since, render.ANSI)}\n{full}"
+            summary += f" {render.PANGO.style('⌛', 'yellow')}"
+        plan = self.poll_plan('view', events)
+        return json.dumps({"summary": summary, "full": full, "stale": stale_since,
+                           "next_poll": round(plan.delay)})
+
+    def cmd_full(self, args):
+        output = self._full(args)
+        backend = render.backend_from_args(args)
+        stale_since = resilience.stale_since()
+        if stale_since is None or backend is render.JSON:
+            return output
+        return f"{render.stale_note(stale_since, backend)}\n{output}"
+
+    def _full(self, args):
+        backend = render.backend_from_args(args)
+        if 'yesterday' not in args:
+            events = self.prioritize(self.today())
+            if backend is render.JSON:
+                return render.to_json([(datetime.now().strftime("%Y%m%d"), events or {})])
+            if not events:
+                return self.empty_text('today')
+            return self.render(events, backend)
+
+        days = self.yesterday_days()
+        results = pipeline.stored_events_for_days(self, [day.strftime("%Y%m%d") for day in days],
+                                                  self.archive_statuses)
+        if None in results and (len(days) == 1 or not resilience.partial_ok()):
+            raise RuntimeError("a tegnapi meccsek nem tölthetők le")
+        daily = [(day.strftime("%Y-%m-%d (%A)"), self.prioritize(events))
+                 for day, events in zip(days, results) if events]
+        if backend is render.JSON:
+            return render.to_json(daily)
+        if not daily:
+            return self.empty_text('yesterday')
+        if len(days) == 1:
+            return self.render(daily[0][1], backend)
+        return "\n\n".join(self.render(events, backend, title) for title, events in daily)
+
+    def cmd_backfill(self, args):
+        """Az elmúlt N (alapból 30) nap párhuzamos letöltése az archívumba."""
+        count = next((int(a) for a in args if a.isdigit()), 30)
+        date_strs = [day.strftime("%Y%m%d") for day in last_days(count)]
+        start = time.perf_counter()
+        fetched = pipeline.backfill(self, date_strs, self.archive_statuses)
+        failed = sum(1 for events in fetched.values() if events is None)
+        return (f"{len(fetched) - failed} nap letöltve, {len(date_strs) - len(fetched)} már megvolt"
+                f"{f', {failed} hibás' if failed else ''} ({time.perf_counter() - start:.2f} s)")
+
+    def history_query(self, term, since):
+        """{nap: {torna: [Match]}} az archívumból: előbb tornára, aztán névre keres."""
+        results = store.query(self.name, since=since, competition=term or None)
+        if term and not results:
+            results = store.query(self.name, since=since, name=term)
+        return results
+
+    def cmd_prefetch(self, args):
+        """Az előtöltés találati aránya és költsége a daemonból; daemon nélkül most lefuttatja
+        a munkákat (archívum és gyorsítótár), és a ráköltött kéréseket írja ki."""
+        prefetcher = prefetch.get(self)
+        if prefetcher is None:
+            prefetcher = prefetch.Prefetcher(self)
+            for name in prefetcher.jobs:
+                prefetcher.run_job(name)
+        return prefetcher.report()
+
+    def cmd_history(self, args):
+        """Előzmények az archívumból: 'history [N] <keresett név>'."""
+        backend = render.backend_from_args(args)
+        words = [a for a in args if a != 'history' and a not in render.BACKENDS]
+        days = next((int(w) for w in words if w.isdigit()), self.history_days)
+        term = " ".join(w for w in words if not w.isdigit())
+        since = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+
+        sections = [(datetime.strptime(day, "%Y%m%d").strftime("%Y-%m-%d (%A)"), events)
+                    for day, events in self.history_query(term, since).items()]
+        if backend is render.JSON:
+            return render.to_json(sections)
+        if not sections:
+            return "Nincs találat az archívumban."
+        return "\n\n".join(self.render(events, backend, title) for title, events in sections)
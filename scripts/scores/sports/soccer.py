@@ -0,0 +1,128 @@
+#
+# soccer.py – foci plugin: csak a figyelt top ligák (scores/filters.py), a heti
+# eredménylista a helyi archívumból.
+#
+
+import re
+import time
+from datetime import datetime
+
+from scores import cache, http_client, pipeline, render, sports, store, telemetry
+from scores.render import ANSI, PANGO
+from scores.model import Match, Status, intern, side_by_score, to_int
+from scores.sports.base import Sport, StageInfo, last_days
+
+FINISHED_STATUSES = ('FT', 'AET', 'AP')
+# Játékban lévő állapotok a játékpercen ("55'", "90+3'") kívül: első és második félidő,
+# félidő, szünet a hosszabbítás előtt, hosszabbítás, tizenegyesek. Minden más (Postp.,
+# Canc., Abd., AAW, ...) elmaradt meccs: se nem élő, se nem kész.
+IN_PLAY_STATUSES = ('1H', 'HT', '2H', 'BT', 'ET', 'Pen.')
+_MINUTE = re.compile(r"\d+(\+\d+)?'?$")
+
+
+def is_in_play(status):
+    return status in IN_PLAY_STATUSES or _MINUTE.match(status) is not None
+
+
+class Soccer(Sport):
+    name = 'soccer'
+    icon = sports.icon('soccer')
+    user_agent = 'i3blocks-soccer-script/1.0'
+    commands = ('timing',) + Sport.commands
+
+    @staticmethod
+    def stage_order(stage):
+        return (stage.get('Cnm', ''), stage.get('Snm', ''))
+
+    def keep_stage(self, score_filters):
+        return score_filters.is_league
+
+    def stage_info(self, stage, score_filters):
+        country_name = stage.get('Cnm', '')
+        league_name = stage.get('Snm', 'Unknown League')
+        if not score_filters.is_league(country_name, league_name):
+            return None
+        return StageInfo(intern(f"{country_name} - {league_name}"), 0, False)
+
+    def normalize(self, event, status, info):
+        match = Match(
+            event.get('Eid'), info.name,
+            intern(event.get('T1', [{}])[0].get('Nm', 'Csapat 1')),
+            intern(event.get('T2', [{}])[0].get('Nm', 'Csapat 2')),
+            Status.UPCOMING,
+        )
+        if status != 'NS':
+            status = status or ''
+            if status in FINISHED_STATUSES:
+                match.status = Status.FINISHED
+            elif is_in_play(status):
+                match.status = Status.LIVE
+            else:
+                match.status = Status.CALLED_OFF
+            match.score1 = to_int(event.get('Tr1', '0'))
+            match.score2 = to_int(event.get('Tr2', '0'))
+
+            live_minute = event.get('Epr')
+            if live_minute and match.status is Status.LIVE and status != 'HT':
+                match.clock = f"{live_minute}'"
+            else:
+                match.clock = status
+
+            if status == 'FT':
+                match.winner = side_by_score(match.score1, match.score2)
+        return match
+
+    def store_scope(self, score_filters):
+        # A figyelt ligák halmaza: ha változik, a napokat újra letöltjük.
+        return store.scope_of(score_filters.leagues)
+
+    def render(self, events_by_tournament, backend=ANSI, title=""):
+        with telemetry.timer('render.soccer'):
+            return render.soccer_block(events_by_tournament, backend, title)
+
+    def summary(self, events_by_tournament, backend=PANGO):
+        """Rövid, sávba szánt összefoglaló: az élő top liga meccsek száma."""
+        live_count = sum(1 for events in events_by_tournament.values()
+                         for match in events if match.status is Status.LIVE)
+        return f"⚽ {backend.style(f'{live_count} élő', 'green')}" if live_count else "⚽"
+
+    def today(self):
+        events = pipeline.events_for_day(self, datetime.now().strftime("%Y%m%d"))
+        if events is None:
+            raise RuntimeError("a mai meccsek nem tölthetők le.")
+        return events
+
+    def yesterday_days(self):
+        # A 'full yesterday' itt az elmúlt hét eredményeit jelenti.
+        return last_days(7)
+
+    def empty_text(self, period):
+        if period == 'yesterday':
+            return "Nincsenek eredmények az elmúlt héten a top ligákban."
+        return "Nincsenek mai meccsek a top ligákban."
+
+    def cmd_timing(self, args):
+        """Összeméri a heti letöltés soros és párhuzamos falióra-idejét (gyorsítótár nélkül)."""
+        date_strs = [day.strftime("%Y%m%d") for day in last_days(7)]
+        cache.ENABLED = False
+
+        start = time.perf_counter()
+        serial = [pipeline.events_for_day(self, d) for d in date_strs]
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent = pipeline.events_for_days(self, date_strs)
+        concurrent_time = time.perf_counter() - start
+
+        ok_serial = sum(1 for r in serial if r is not None)
+        ok_concurrent = sum(1 for r in concurrent if r is not None)
+        speedup = serial_time / concurrent_time if concurrent_time else float('inf')
+        return "\n".join([
+            f"API: {http_client.API_BASE}",
+            f"Soros:      {serial_time:.3f} s ({ok_serial}/{len(date_strs)} nap OK)",
+            f"Párhuzamos: {concurrent_time:.3f} s ({ok_concurrent}/{len(date_strs)} nap OK)",
+            f"Gyorsulás:  {speedup:.1f}x",
+        ])
+
+
+SPORT = Soccer()
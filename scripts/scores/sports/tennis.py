@@ -0,0 +1,238 @@
+#
+# tennis.py – tenisz plugin: tornák fontosság szerint (főtornák előre), kedvenc
+# játékosok kiemelése és élő értesítések a kedvencek meccseiről.
+#
+# Az élő állapot és az értesítési előzmények: scores/state.py (SQLite, WAL).
+# A régi JSON állapotfájlt csak egyszer, az első indításkor olvassuk be.
+#
+
+import json
+from datetime import datetime
+
+from scores import filters, live, notify, pipeline, render, schedule, sports, state, store, telemetry
+from scores.render import ANSI, PANGO
+from scores.model import Match, Side, Status, intern, side_by_score, to_int
+from scores.sports.base import Sport, StageInfo
+
+LEGACY_STATE_FILE = "/tmp/tennis_notification_state.json"
+
+FINISHED_STATUSES = ['Finished', 'FT', 'Ret.', 'W.O.']
+
+
+class Tennis(Sport):
+    name = 'tennis'
+    icon = sports.icon('tennis')
+    user_agent = 'i3blocks-tennis-script/1.0'
+    daemon_commands = ('full', 'check-notify', 'view', 'prefetch')
+    commands = ('check-notify',) + Sport.commands
+    archive_statuses = FINISHED_STATUSES
+    history_days = 365
+    # A check-notify nem kaphat elavult adatot: a követő visszafelé lépne.
+    deadlines = dict(Sport.deadlines, **{'check-notify': 8.0})
+    polled_commands = ('check-notify',)
+
+    def __init__(self):
+        self.state = state.StateStore(self.name)
+        # Értesítések: összevonás rövid ablakon belül, meccsenkénti korlát, D-Bus (scores/notify.py).
+        # A daemonban az ablak végén egy időzítő küld; egyszeri futásnál a close() a végén.
+        self.notifications = notify.Dispatcher()
+        # A daemonban a követő a memóriában marad két lekérdezés között; csak akkor töltjük
+        # újra az állapottárból, ha azóta más lekérdező is írt bele (lásd scores/state.py).
+        self._live_tracker = None
+        self._tracker_version = None
+
+    def stage_info(self, stage, score_filters):
+        is_main_tour = score_filters.is_main_tour(stage.get('Cnm'))
+        return StageInfo(intern(stage.get('Snm', 'Ismeretlen Torna')), 0 if is_main_tour else 1, is_main_tour)
+
+    def normalize(self, event, status, info):
+        if status == 'In Progress':
+            match = live.normalize(event, info.name)
+        else:
+            match = Match(
+                event.get('Eid'), info.name,
+                intern(event.get('T1', [{}])[0].get('Nm', 'P1')),
+                intern(event.get('T2', [{}])[0].get('Nm', 'P2')),
+                Status.UPCOMING,
+            )
+        match.priority = info.priority
+        match.main_tour = info.main_tour
+
+        if status in FINISHED_STATUSES:
+            match.status = Status.FINISHED
+            match.score1 = to_int(event.get('Tr1', '0'))
+            match.score2 = to_int(event.get('Tr2', '0'))
+            winner_id = event.get('Ewt')
+            p1_id = event.get('T1', [{}])[0].get('ID')
+            p2_id = event.get('T2', [{}])[0].get('ID')
+            if winner_id:
+                if p1_id and str(winner_id) == str(p1_id): match.winner = Side.FIRST
+                elif p2_id and str(winner_id) == str(p2_id): match.winner = Side.SECOND
+            if match.winner is None:
+                match.winner = side_by_score(match.score1, match.score2)
+        return match
+
+    def store_scope(self, score_filters):
+        # A tárolt sorok main_tour/priority mezője a főtornák listájától függ: ha az
+        # változik, a napokat újra letöltjük.
+        return store.scope_of(score_filters.main_tours)
+
+    def prioritize(self, events_by_tournament):
+        """Szűri az eseményeket a főbb tornákra, ha vannak ilyenek."""
+        main_tour_events = {t: e for t, e in events_by_tournament.items() if any(match.main_tour for match in e)}
+        return main_tour_events or events_by_tournament
+
+    def render(self, events_by_tournament, backend=ANSI, title=""):
+        if not events_by_tournament:
+            return self.empty_text('today')
+        with telemetry.timer('render.tennis'):
+            block = render.tennis_block(events_by_tournament, backend, filters.get().is_favorite)
+        return f"{render.title(title, backend)}\n{block}" if title else block
+
+    def summary(self, events_by_tournament, backend=PANGO):
+        """Rövid, sávba szánt összefoglaló: a kedvencek élő meccse, vagy az élő meccsek száma."""
+        any_favorite = filters.get().any_favorite
+        live_matches = [match for events in events_by_tournament.values()
+                        for match in events if match.status is Status.LIVE]
+        favorite_matches = [match for match in live_matches if any_favorite(match.name1, match.name2)]
+        if favorite_matches:
+            match = favorite_matches[0]
+            score = backend.style(backend.escape(live.format_score(match)), 'yellow')
+            summary = f"🎾 {backend.escape(match.name1)} {score} {backend.escape(match.name2)}"
+            if len(favorite_matches) > 1:
+                summary += f" +{len(favorite_matches) - 1}"
+            return summary
+        return f"🎾 {backend.style(f'{len(live_matches)} élő', 'green')}" if live_matches else "🎾"
+
+    def watched(self, score_filters):
+        """A kedvencek meccsei; kedvencek nélkül az összes (a sáv az élő meccseket számolja)."""
+        if not score_filters.favorites:
+            return None
+        return lambda match: score_filters.any_favorite(match.name1, match.name2)
+
+    def poll_plan(self, command=None, events_by_tournament=None):
+        # Kedvencek nélkül a check-notify nem tölt le semmit; elég ritkán ránézni.
+        if command == 'check-notify' and not filters.get().favorites:
+            return schedule.Plan(schedule.SCHEDULED_INTERVAL, 'nincs kedvenc')
+        return Sport.poll_plan(self, command, events_by_tournament)
+
+    def today(self):
+        """Az élő meccsek és a mai, még el nem kezdődött meccsek (a főtornákra szűrés a
+        megjelenítésnél, prioritize)."""
+        combined_events = pipeline.events_for_url(self, self.live_url(), ['In Progress'])
+        date_str = datetime.now().strftime("%Y%m%d")
+        upcoming_events = pipeline.events_for_url(self, self.date_url(date_str), ['NS'])
+
+        live_event_ids = {match.eid for tournament in combined_events.values() for match in tournament}
+        for tournament, events in upcoming_events.items():
+            for match in events:
+                if match.eid not in live_event_ids:
+                    combined_events[tournament].append(match)
+
+        return combined_events
+
+    def history_query(self, term, since):
+        """Előbb játékosra, aztán tornára keres; név nélkül a kedvencek meccsei."""
+        if term:
+            return (store.query(self.name, since=since, name=term)
+                    or store.query(self.name, since=since, competition=term))
+        # A kedvencek casefold-olt formában vannak tárolva; a NOCASE egyezés ezt lefedi.
+        results = {}
+        for player in filters.get().favorites:
+            for day, events in store.query(self.name, since=since, name=player).items():
+                for tournament, matches in events.items():
+                    results.setdefault(day, {}).setdefault(tournament, []).extend(matches)
+        return dict(sorted(results.items(), reverse=True))
+
+    def close(self):
+        self.notifications.close()
+
+    # --- Értesítések ---
+
+    def _import_legacy_state(self):
+        """Az első indításkor átveszi a régi /tmp JSON állapotfájl pillanatképét."""
+        try:
+            with open(LEGACY_STATE_FILE, 'r') as f: old_state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError): return {}
+        snapshot = live.LiveTracker.from_json(old_state).snapshot
+        self.state.save_changes({}, snapshot)
+        return snapshot
+
+    def _load_tracker(self, score_filters, version):
+        """A memóriában tartott követőt adja vissza, vagy az állapottárból építi fel.
+        Az állapottár zárja alatt hívandó."""
+        if self._live_tracker is None or self._tracker_version != version:
+            snapshot = self.state.load_snapshot()
+            if not snapshot and version == 0:
+                snapshot = self._import_legacy_state()
+                version = self.state.version()
+            self._live_tracker = live.LiveTracker(snapshot)
+            self._tracker_version = version
+        if getattr(self._live_tracker, 'filters', None) is not score_filters:
+            self._live_tracker.filters = score_filters
+            self._live_tracker.set_filter(score_filters.any_favorite)
+        return self._live_tracker
+
+    @staticmethod
+    def notification_for(change):
+        """Egy változásból (cím, szöveg) értesítést készít; None, ha nem érdemes szólni."""
+        match = change.new or change.old
+        if change.kind == 'start':
+            return "Meccs Kezdődött!", live.describe(match)
+        if change.kind == 'finish':
+            return "Meccs Befejeződött!", live.describe(match)
+        winner = match.name1 if change.side is Side.FIRST else match.name2
+        loser = match.name2 if change.side is Side.FIRST else match.name1
+        if change.kind == 'set':
+            return "Szett Vége!", f"{winner} nyerte a szettet: {live.describe(match)}"
+        if change.kind == 'break':
+            return "Brék!", f"{winner} elvette {loser} adogatását: {live.describe(match)}"
+        return None
+
+    @staticmethod
+    def notification_key(change):
+        """Az értesítés azonosítója az előzményekben: kezdésről és befejezésről eseményenként
+        egy, a többiről állásonként egy értesítés mehet ki."""
+        if change.kind in ('start', 'finish'):
+            return ''
+        return live.format_score(change.new or change.old)
+
+    def cmd_check_notify(self, args):
+        """Ellenőrzi a kedvenc játékosok meccseit és értesítést küld a változásokról.
+        Csak a változott eseményeket dolgozza fel és írja; a párhuzamos lekérdezők
+        az állapottár zárján sorba állnak, így egy változásról egyszer szólunk."""
+        score_filters = filters.get()
+        if not score_filters.favorites: return ""
+        try:
+            live_data = pipeline.fetch_data(self, self.live_url())
+
+            pending = []
+            with self.state.locked():
+                tracker = self._load_tracker(score_filters, self.state.version())
+                before = dict(tracker.snapshot)
+                try:
+                    changes = tracker.update(live_data)
+                    self._tracker_version = self.state.save_changes(before, tracker.snapshot) or self._tracker_version
+
+                    for change in changes:
+                        notification = self.notification_for(change)
+                        if not notification:
+                            continue
+                        key = self.notification_key(change)
+                        if self.state.was_notified(change.eid, change.kind, key):
+                            continue
+                        self.state.record_notification(change.eid, change.kind, key)
+                        pending.append((change.eid, notification))
+                except BaseException:
+                    # A memóriabeli követő már előrébb jár, mint a visszagörgetett tár.
+                    self._live_tracker = None
+                    raise
+
+            for eid, notification in pending:
+                self.notifications.submit(eid, *notification)
+        except Exception as e:
+            telemetry.error('check-notify', e)
+        return ""
+
+
+SPORT = Tennis()
@@ -0,0 +1,130 @@
+#
+# state.py – összeomlás-biztos állapottár az élő értesítésekhez (SQLite, WAL napló).
+#
+# A /tmp/tennis_notification_state.json helyett, amit minden lekérdezés teljesen újraírt
+# (nem atomikusan: egy félbeszakadt írás után az állapot elveszett, és minden
+# "Meccs Kezdődött!" újra kiment):
+# - csak a változott események sorai íródnak, tranzakcióban (WAL napló),
+# - eseményenként megmarad, mikor és milyen állásnál ment ki értesítés,
+# - a párhuzamos lekérdezők (daemon, kézi check-notify) egy írási zárral sorba állnak;
+#   a 'version' számláló alapján a memóriában tartott pillanatkép csak akkor töltődik
+#   újra, ha közben más is írt, így egy lekérdezés I/O-ja nem nő a követett események
+#   számával.
+#
+# Az adatbázis: $XDG_STATE_HOME/scores/state.sqlite3
+#
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from scores.model import Match
+
+STATE_PATH = os.path.join(
+    os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state"), "scores", "state.sqlite3"
+)
+# Ennyi napig őrizzük az értesítési előzményeket.
+HISTORY_DAYS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS live (
+    scope TEXT NOT NULL, eid TEXT NOT NULL, match TEXT NOT NULL, updated REAL NOT NULL,
+    PRIMARY KEY (scope, eid)
+);
+CREATE TABLE IF NOT EXISTS notifications (
+    scope TEXT NOT NULL, eid TEXT NOT NULL, kind TEXT NOT NULL, score TEXT NOT NULL, at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notifications_event ON notifications (scope, eid, kind, score);
+CREATE INDEX IF NOT EXISTS notifications_at ON notifications (at);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('version', 0);
+"""
+
+Error = sqlite3.Error
+
+
+def _differs(old, new):
+    # A követő változatlan eseménynél ugyanazt az objektumot tartja meg; újratöltés után
+    # az egyenlőség dönt.
+    return old is not new and old != new
+
+
+class StateStore:
+    """Egy 'scope' (pl. 'tennis') élő pillanatképe és értesítési előzményei."""
+
+    def __init__(self, scope, path=None):
+        self.scope = scope
+        self.path = path or STATE_PATH
+        self._local = threading.local()
+
+    def connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # isolation_level=None: a tranzakciókat magunk kezeljük (BEGIN IMMEDIATE).
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def locked(self):
+        """Írási zár a teljes olvasás-összevetés-írás ciklusra; hibánál visszagörget."""
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def version(self):
+        return self.connect().execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0]
+
+    def load_snapshot(self):
+        """A tárolt élő pillanatkép: {eid: Match}."""
+        rows = self.connect().execute("SELECT eid, match FROM live WHERE scope = ?", (self.scope,))
+        return {eid: Match.from_list(json.loads(value)) for eid, value in rows}
+
+    def save_changes(self, before, after):
+        """Csak a változott (új vagy lecserélt) és a megszűnt események sorait írja.
+        A 'locked()' blokkon belül hívandó; az új verziót adja vissza (None, ha nem volt mit írni)."""
+        now = time.time()
+        changed = [(self.scope, eid, json.dumps(match.to_list()), now)
+                   for eid, match in after.items() if _differs(before.get(eid), match)]
+        removed = [(self.scope, eid) for eid in before if eid not in after]
+        if not changed and not removed:
+            return None
+        conn = self.connect()
+        conn.executemany("INSERT OR REPLACE INTO live (scope, eid, match, updated) VALUES (?, ?, ?, ?)", changed)
+        conn.executemany("DELETE FROM live WHERE scope = ? AND eid = ?", removed)
+        if removed:
+            conn.execute("DELETE FROM notifications WHERE at < ?", (now - HISTORY_DAYS * 86400,))
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+        return self.version()
+
+    def was_notified(self, eid, kind, score):
+        """Ment-e már értesítés erről az eseményről ugyanezzel az állással."""
+        return self.connect().execute(
+            "SELECT EXISTS (SELECT 1 FROM notifications WHERE scope = ? AND eid = ? AND kind = ? AND score = ?)",
+            (self.scope, eid, kind, score),
+        ).fetchone()[0]
+
+    def record_notification(self, eid, kind, score):
+        self.connect().execute(
+            "INSERT INTO notifications (scope, eid, kind, score, at) VALUES (?, ?, ?, ?, ?)",
+            (self.scope, eid, kind, score, time.time()),
+        )
+
+    def history(self, eid):
+        """Egy esemény értesítései időrendben: [(fajta, állás, időpont)]."""
+        return self.connect().execute(
+            "SELECT kind, score, at FROM notifications WHERE scope = ? AND eid = ? ORDER BY at",
+            (self.scope, eid),
+        ).fetchall()
@@ -0,0 +1,184 @@
+#
+# store.py – helyi eredmény-archívum (SQLite) a lezárt napokhoz.
+#
+# Mindkét szkript ide írja a normalizált meccseket, így a heti nézet és az előzmény
+# lekérdezések (pl. "a Premier League elmúlt 30 napja", "X összes meccse idén")
+# indexből, ezredmásodpercek alatt válaszolhatók meg. Egy napot csak akkor tekintünk
+# tároltnak, ha a letöltése a nap (UTC) vége után, ráhagyással történt (cache.is_final), és a
+# szűrési köre ('scope', pl. a figyelt ligák halmaza) azóta nem változott.
+#
+# Az adatbázis: $XDG_DATA_HOME/scores/results.sqlite3
+# Indexek: (sport, nap), (sport, torna, nap), (sport, név1/név2, nap) kis-nagybetű függetlenül.
+#
+
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from scores.cache import is_final
+from scores.model import Match
+
+DB_PATH = os.path.join(
+    os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share"), "scores", "results.sqlite3"
+)
+# Méréshez kikapcsolható; SCORES_NO_STORE=1 is kikapcsolja.
+ENABLED = not os.environ.get("SCORES_NO_STORE")
+
+BACKFILL_WORKERS = 7
+
+# A hívók ezt kapják el, ha az archívum nem elérhető (pl. sérült vagy írásvédett fájl).
+Error = sqlite3.Error
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    sport TEXT NOT NULL, day TEXT NOT NULL, eid TEXT NOT NULL, tournament TEXT NOT NULL,
+    name1 TEXT, name2 TEXT, status TEXT NOT NULL,
+    score1 INTEGER, score2 INTEGER, games1 INTEGER, games2 INTEGER, clock TEXT,
+    winner INTEGER, server INTEGER, priority INTEGER NOT NULL DEFAULT 0, main_tour INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (sport, day, eid)
+);
+CREATE INDEX IF NOT EXISTS matches_tournament ON matches (sport, tournament, day);
+CREATE INDEX IF NOT EXISTS matches_name1 ON matches (sport, name1 COLLATE NOCASE, day);
+CREATE INDEX IF NOT EXISTS matches_name2 ON matches (sport, name2 COLLATE NOCASE, day);
+CREATE TABLE IF NOT EXISTS days (
+    sport TEXT NOT NULL, day TEXT NOT NULL, scope TEXT NOT NULL, fetched REAL NOT NULL,
+    PRIMARY KEY (sport, day)
+);
+"""
+
+_COLUMNS = ("eid, tournament, name1, name2, status, score1, score2, games1, games2, "
+            "clock, winner, server, priority, main_tour")
+
+_local = threading.local()
+
+
+def connect(path=None):
+    """Szálanként egy kapcsolat (a daemon több szálon is kérdezhet)."""
+    path = path or DB_PATH
+    conn = getattr(_local, "conns", {}).get(path)
+    if conn is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        _local.__dict__.setdefault("conns", {})[path] = conn
+    return conn
+
+
+def scope_of(items):
+    """Rövid, stabil azonosító egy szűrő-halmazhoz (pl. a figyelt ligákhoz)."""
+    return hashlib.sha1(json.dumps(sorted(items)).encode("utf-8")).hexdigest()[:12]
+
+
+def missing_days(sport, days, scope="", path=None):
+    """A megadott napok (YYYYMMDD) közül azok, amelyek még nincsenek (ugyanazzal a scope-pal) tárolva."""
+    if not ENABLED:
+        return list(days)
+    rows = connect(path).execute(
+        f"SELECT day FROM days WHERE sport = ? AND scope = ? AND day IN ({','.join('?' * len(days))})",
+        (sport, scope, *days),
+    ).fetchall()
+    stored = {day for (day,) in rows}
+    return [day for day in days if day not in stored]
+
+
+def save_day(sport, day, events_by_tournament, scope="", fetched_at=None, path=None):
+    """Egy nap meccseit írja az archívumba. Csak lezárt napot jelöl tároltnak; True, ha így történt.
+    fetched_at az adat valódi letöltési ideje (gyorsítótárból vagy elavult tartalékból a
+    bejegyzésé, nem a mentésé), különben egy éjfél előtti állapot véglegesnek látszana."""
+    fetched_at = fetched_at or time.time()
+    if not ENABLED or not is_final(day, fetched_at):
+        return False
+    rows = [(sport, day, *match.to_list())
+            for events in events_by_tournament.values() for match in events]
+    conn = connect(path)
+    with conn:
+        conn.execute("DELETE FROM matches WHERE sport = ? AND day = ?", (sport, day))
+        conn.executemany(f"INSERT INTO matches (sport, day, {_COLUMNS}) VALUES ({','.join('?' * 16)})", rows)
+        conn.execute("INSERT OR REPLACE INTO days (sport, day, scope, fetched) VALUES (?, ?, ?, ?)",
+                     (sport, day, scope, fetched_at))
+    return True
+
+
+def _group(rows):
+    events_by_tournament = defaultdict(list)
+    for row in rows:
+        match = Match.from_list(row)
+        events_by_tournament[match.tournament].append(match)
+    return events_by_tournament
+
+
+def load_day(sport, day, path=None):
+    """Egy tárolt nap meccsei tornánként, a mentés sorrendjében."""
+    rows = connect(path).execute(
+        f"SELECT {_COLUMNS} FROM matches WHERE sport = ? AND day = ? ORDER BY rowid", (sport, day)
+    ).fetchall()
+    return _group(rows)
+
+
+def query(sport, since=None, until=None, competition=None, name=None, path=None):
+    """Előzmények napok szerint: {nap: {torna: [Match]}}, a legfrissebb nap elöl.
+
+    competition: a torna nevének része (pl. 'Premier League'); name: csapat vagy játékos
+    pontos neve (kis-nagybetű független)."""
+    conn = connect(path)
+    where, params = ["sport = ?"], [sport]
+    if since:
+        where.append("day >= ?")
+        params.append(since)
+    if until:
+        where.append("day <= ?")
+        params.append(until)
+    if competition:
+        # A teljes tornanevek feloldása az index alapján, utána pontos egyezés.
+        tournaments = [t for (t,) in conn.execute(
+            "SELECT DISTINCT tournament FROM matches WHERE sport = ? AND tournament LIKE ?",
+            (sport, f"%{competition}%"),
+        )]
+        if not tournaments:
+            return {}
+        where.append(f"tournament IN ({','.join('?' * len(tournaments))})")
+        params.extend(tournaments)
+
+    condition = " AND ".join(where)
+    if name:
+        sql = (f"SELECT day, {_COLUMNS} FROM matches WHERE {condition} AND name1 = ? COLLATE NOCASE"
+               f" UNION ALL "
+               f"SELECT day, {_COLUMNS} FROM matches WHERE {condition} AND name2 = ? COLLATE NOCASE"
+               f" ORDER BY 1 DESC")
+        rows = conn.execute(sql, (*params, name, *params, name)).fetchall()
+    else:
+        rows = conn.execute(f"SELECT day, {_COLUMNS} FROM matches WHERE {condition} ORDER BY day DESC, rowid",
+                            params).fetchall()
+
+    by_day = defaultdict(list)
+    for day, *row in rows:
+        by_day[day].append(row)
+    return {day: _group(day_rows) for day, day_rows in by_day.items()}
+
+
+def backfill(sport, days, fetch_day, scope="", max_workers=BACKFILL_WORKERS, path=None):
+    """A hiányzó napokat párhuzamosan letölti (fetch_day(nap) -> ({torna: [Match]}, letöltési
+    idő) vagy (None, None)), és egyetlen szálról írja az archívumba: csak azokat a napokat,
+    amelyek az adat letöltési ideje szerint már lezártak voltak.
+    A letöltött napokat adja vissza: {nap: események vagy None}."""
+    missing = missing_days(sport, days, scope, path)
+    if not missing:
+        return {}
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+        fetched = dict(zip(missing, pool.map(fetch_day, missing)))
+    for day, (events, fetched_at) in fetched.items():
+        if events is not None:
+            save_day(sport, day, events, scope, fetched_at, path)
+    return {day: events for day, (events, _) in fetched.items()}
+
+
+def events_for_days(sport, days, fetch_day, scope="", path=None):
+    """Napok eseményei a bemenet sorrendjében: a tárolt napok az archívumból, a többi letöltve.
+    A hibás napok helyén None áll."""
+    fetched = backfill(sport, days, fetch_day, scope, path=path)
+    return [fetched[day] if day in fetched else load_day(sport, day, path) for day in days]
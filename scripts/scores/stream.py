@@ -0,0 +1,110 @@
+#
+# stream.py – fokozatos JSON feldolgozás a livescore dátum/élő payloadokhoz.
+#
+# A payloadok a világ összes versenyét tartalmazzák, de nekünk ebből csak néhány kell.
+# Az iter_stages() a nyers szövegen lépked végig, és a 'Stages' tömb elemeit egyenként
+# adja vissza: egy stage-et csak akkor dekódol (és csak akkor épül fel az 'Events'
+# listája), ha a Cnm/Snm fejléce és az opcionális szövegminta alapján kell.
+# A kihagyott stage-ekből egyetlen Python objektum sem készül.
+#
+# Ez nem valódi folyamfeldolgozás: a teljes törzs a memóriában van (a letöltés és a
+# gyorsítótár is egyben adja), csak a dekódolt objektumok maradnak el. Mérés
+# (bench/bench_stream.py): a csúcsmemória töredéke a json.loads()-énak, a futásidő
+# viszont nagyobb, mert a zárójel-léptetés Pythonban fut.
+#
+
+import re
+import json
+
+_DECODER = json.JSONDecoder()
+_STAGES = re.compile(r'"Stages"\s*:\s*\[')
+# Mindent elnyel (sztringekkel együtt) a következő zárójelig, így Python szinten csak a
+# zárójeleken kell lépkedni.
+_UNTIL_BRACKET = re.compile(r'(?:[^"{}\[\]]++|"[^"\\]*+(?:\\.[^"\\]*+)*+")*+')
+_SPACE = re.compile(r'[\s,]*')
+_EVENTS = re.compile(r'"Events"\s*:\s*')
+_CNM = re.compile(r'"Cnm"\s*:\s*("[^"\\]*(?:\\.[^"\\]*)*")')
+_SNM = re.compile(r'"Snm"\s*:\s*("[^"\\]*(?:\\.[^"\\]*)*")')
+
+
+def status_pattern(statuses):
+    """Olyan mintát ad, ami egy stage szövegében legalább egy megadott 'Eps' státuszt talál."""
+    alternatives = "|".join(re.escape(json.dumps(s)[1:-1]) for s in statuses)
+    return re.compile(r'"Eps"\s*:\s*"(?:' + alternatives + r')"')
+
+
+def _skip_container(text, pos):
+    """A pos-on kezdődő objektum/tömb utáni pozíciót adja vissza, dekódolás nélkül."""
+    depth = 0
+    skip = _UNTIL_BRACKET.match
+    end = len(text)
+    while pos < end:
+        char = text[pos]
+        if char in '{[':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos = skip(text, pos + 1).end()
+    raise ValueError("Befejezetlen JSON")
+
+
+def _header(pattern, text, start, end):
+    match = pattern.search(text, start, end)
+    return json.loads(match.group(1)) if match else None
+
+
+def _stage_header(text, start, end):
+    """A stage (Cnm, Snm) mezői dekódolás nélkül. Általában az 'Events' előtt állnak; ha
+    nem (más kulcssorrend), az 'Events' értéke utáni részben is keres, magában az
+    'Events'-ben (a meccsek mezőiben) soha."""
+    events = _EVENTS.search(text, start, end)
+    head_end = end if events is None else events.start()
+    cnm = _header(_CNM, text, start, head_end)
+    snm = _header(_SNM, text, start, head_end)
+    if events is not None and (cnm is None or snm is None):
+        value_at = events.end()
+        tail = _skip_container(text, value_at) if text[value_at] in '{[' else value_at
+        if cnm is None:
+            cnm = _header(_CNM, text, tail, end)
+        if snm is None:
+            snm = _header(_SNM, text, tail, end)
+    return cnm or '', snm or ''
+
+
+def iter_stages(text, keep_stage=None, require=None):
+    """Egyenként adja vissza a 'Stages' elemeit.
+
+    keep_stage: opcionális (Cnm, Snm) -> bool szűrő; a Cnm/Snm mezőket dekódolás előtt
+                olvassa, a kulcsok sorrendjétől függetlenül (_stage_header).
+    require:    opcionális lefordított minta; a stage-et csak akkor dekódolja, ha
+                a stage szövegében előfordul (pl. status_pattern(['NS'])).
+    """
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode('utf-8')
+    match = _STAGES.search(text)
+    if match is None:
+        return
+    pos = match.end()
+    while True:
+        pos = _SPACE.match(text, pos).end()
+        if pos >= len(text) or text[pos] == ']':
+            return
+        if keep_stage is None:
+            # Fejléc-szűrő nélkül a C dekóder gyorsabban találja meg a stage végét, mint a
+            # zárójel-léptetés; a nem kellő stage így is azonnal eldobható.
+            stage, end = _DECODER.raw_decode(text, pos)
+            if require is None or require.search(text, pos, end) is not None:
+                yield stage
+            pos = end
+            continue
+        end = _skip_container(text, pos)
+        if not keep_stage(*_stage_header(text, pos, end)):
+            pos = end
+            continue
+        if require is not None and require.search(text, pos, end) is None:
+            pos = end
+            continue
+        stage, pos = _DECODER.raw_decode(text, pos)
+        yield stage
@@ -0,0 +1,309 @@
+#
+# telemetry.py – időmérők és számlálók a letöltés, dekódolás, feldolgozás, megjelenítés
+# és értesítés lépéseihez, forgatott helyi metrika fájllal és 'stats' jelentéssel.
+#
+# A mérések a memóriában gyűlnek (időmérőnként hisztogram BUCKETS_MS határokkal, darabszám,
+# összeg és maximum; számlálónként egy egész), és egy JSON sorként kerülnek a
+# $XDG_STATE_HOME/scores/metrics.jsonl fájlba: az egyszeri parancssori futás a végén, a
+# daemon FLUSH_INTERVAL-onként. MAX_BYTES fölött a fájl metrics.jsonl.1-be forog (KEEP
+# régi fájl marad). A Qtile widgetek ugyanebbe a könyvtárba, ugyanilyen sorokat írnak
+# (config/qtile/score_widgets.py, qtile-metrics.jsonl).
+#
+# A hibák a lépés és a kategória szerint számlálódnak (error.<lépés>.<kategória>), így a
+# széles 'except Exception' ágak sem nyelik el őket nyomtalanul.
+#
+# Jelentés: python3 -m scores stats [--hours 24] [szűrő]
+# Kikapcsolás: SCORES_NO_METRICS=1.
+#
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+
+METRICS_DIR = os.path.join(
+    os.environ.get("XDG_STATE_HOME") or os.path.expanduser("~/.local/state"), "scores"
+)
+METRICS_FILE = os.path.join(METRICS_DIR, "metrics.jsonl")
+MAX_BYTES = 1024 * 1024
+KEEP = 3
+FLUSH_INTERVAL = 60
+
+ENABLED = not os.environ.get("SCORES_NO_METRICS")
+
+# A hisztogram vödrök felső határai ezredmásodpercben (az utolsó felett: "több").
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+_lock = threading.Lock()
+_timers = {}      # név -> [darab, összeg ms, max ms, {vödör: darab}]
+_counters = {}    # név -> darab
+_source = "cli"
+
+
+def set_source(name):
+    """A rekordok forrása a jelentésben (pl. 'daemon'); alapból 'cli'."""
+    global _source
+    _source = name
+
+
+def _bucket(ms):
+    for bound in BUCKETS_MS:
+        if ms <= bound:
+            return str(bound)
+    return "inf"
+
+
+def record(name, seconds):
+    """Egy időmérés hozzáadása."""
+    if not ENABLED:
+        return
+    ms = seconds * 1000
+    bucket = _bucket(ms)
+    with _lock:
+        timer = _timers.get(name)
+        if timer is None:
+            timer = _timers[name] = [0, 0.0, 0.0, {}]
+        timer[0] += 1
+        timer[1] += ms
+        timer[2] = max(timer[2], ms)
+        timer[3][bucket] = timer[3].get(bucket, 0) + 1
+
+
+@contextmanager
+def timer(name):
+    """A blokk futásidejét a név alá méri (kivétel esetén is)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+class TimedIter:
+    """Egy iterátor, ami a next() hívásokban töltött időt összegzi (elapsed, másodperc),
+    és a kimerülésekor egy mérésként rögzíti; pl. a fokozatos stage-dekódoláshoz."""
+
+    def __init__(self, name, iterable):
+        self.name = name
+        self.iterator = iter(iterable)
+        self.elapsed = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            item = next(self.iterator)
+        except StopIteration:
+            self.elapsed += time.perf_counter() - start
+            record(self.name, self.elapsed)
+            raise
+        self.elapsed += time.perf_counter() - start
+        return item
+
+
+def count(name, value=1):
+    if not ENABLED or not value:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def category(error):
+    """A hiba rövid kategóriája a számlálóhoz."""
+    name = type(error).__name__
+    if isinstance(error, TimeoutError) or "Timeout" in name:
+        return "timeout"
+    if name == "Unavailable":
+        return "unavailable"
+    if name == "HTTPError":
+        # "HTTP 503: <url>" (scores/http_client.py)
+        status = str(error)[5:8]
+        return f"http_{status[0]}xx" if status.isdigit() else "http"
+    if isinstance(error, ValueError):
+        return "decode"
+    if isinstance(error, (ConnectionError, OSError)) or "Connection" in name:
+        return "connection"
+    return name
+
+
+def error(stage, exc):
+    """Egy elkapott hiba számlálása a lépés és a kategória szerint."""
+    count(f"error.{stage}.{category(exc)}")
+
+
+def snapshot(reset=False):
+    """Az eddigi mérések egy rekordként (a metrika fájl egy sora)."""
+    with _lock:
+        data = {
+            "time": time.time(), "pid": os.getpid(), "source": _source,
+            "timers": {name: {"count": t[0], "sum": round(t[1], 3), "max": round(t[2], 3), "buckets": dict(t[3])}
+                       for name, t in _timers.items()},
+            "counters": dict(_counters),
+        }
+        if reset:
+            _timers.clear()
+            _counters.clear()
+    return data
+
+
+def _rotate(path):
+    for index in range(KEEP - 1, 0, -1):
+        older = f"{path}.{index}"
+        if os.path.exists(older):
+            os.replace(older, f"{path}.{index + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def append(data, path=None):
+    """Egy rekord hozzáfűzése a metrika fájlhoz (MAX_BYTES fölött forgatva)."""
+    path = path or METRICS_FILE
+    import json
+    import fcntl
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    line = json.dumps(data, separators=(",", ":")) + "\n"
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        # Forgatás közben egy másik író már az új fájlba ír; a zár csak a régiét védi.
+        if f.tell() + len(line) > MAX_BYTES and os.path.exists(path):
+            _rotate(path)
+            with open(path, "a") as fresh:
+                fresh.write(line)
+            return
+        f.write(line)
+
+
+def flush():
+    """Az összegyűlt mérések kiírása és nullázása; hibát nem dob."""
+    if not ENABLED:
+        return
+    data = snapshot(reset=True)
+    if not data["timers"] and not data["counters"]:
+        return
+    try:
+        append(data)
+    except OSError:
+        pass
+
+
+def start_flusher(interval=FLUSH_INTERVAL):
+    """A daemonban: háttérszál, ami interval-onként kiírja a méréseket."""
+    stopped = threading.Event()
+
+    def loop():
+        while not stopped.wait(interval):
+            flush()
+
+    threading.Thread(target=loop, name="metrics-flush", daemon=True).start()
+    return stopped
+
+
+# --- Jelentés ---
+
+def load(since=None, directory=None):
+    """A metrika fájlok (a forgatottakkal és a Qtile widgetekével együtt) since óta írt rekordjai."""
+    import json
+    directory = directory or METRICS_DIR
+    records = []
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return records
+    for name in names:
+        if ".jsonl" not in name:
+            continue
+        try:
+            with open(os.path.join(directory, name)) as f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                    except ValueError:
+                        continue
+                    if since is None or data.get("time", 0) >= since:
+                        records.append(data)
+        except OSError:
+            continue
+    return records
+
+
+def merge(records):
+    """Rekordok összevonása: ({név: {count, sum, max, buckets}}, {számláló: darab})."""
+    timers, counters = {}, {}
+    for data in records:
+        for name, t in data.get("timers", {}).items():
+            merged = timers.setdefault(name, {"count": 0, "sum": 0.0, "max": 0.0, "buckets": {}})
+            merged["count"] += t["count"]
+            merged["sum"] += t["sum"]
+            merged["max"] = max(merged["max"], t["max"])
+            for bucket, n in t["buckets"].items():
+                merged["buckets"][bucket] = merged["buckets"].get(bucket, 0) + n
+        for name, n in data.get("counters", {}).items():
+            counters[name] = counters.get(name, 0) + n
+    return timers, counters
+
+
+def _bounds(buckets):
+    return sorted(buckets, key=lambda b: float(b))
+
+
+def percentile(t, fraction):
+    """A fraction-edik kvantilis felső becslése a vödrökből (ms; a legfelső vödörben a maximum)."""
+    target = fraction * t["count"]
+    seen = 0
+    for bound in _bounds(t["buckets"]):
+        seen += t["buckets"][bound]
+        if seen >= target:
+            return t["max"] if bound == "inf" else min(float(bound), t["max"])
+    return t["max"]
+
+
+def _histogram(t, width=30):
+    lines = []
+    bounds = _bounds(t["buckets"])
+    top = max(t["buckets"].values())
+    for bound in bounds:
+        n = t["buckets"][bound]
+        label = f"> {BUCKETS_MS[-1]} ms" if bound == "inf" else f"≤ {bound} ms"
+        lines.append(f"    {label:>10} {'█' * max(1, round(width * n / top)):<{width}} {n}")
+    return lines
+
+
+def report(hours=24, term="", directory=None):
+    since = time.time() - hours * 3600 if hours else None
+    records = load(since, directory)
+    if not records:
+        return "Nincs mérés" + (f" az elmúlt {hours:g} órából." if hours else ".")
+    timers, counters = merge(records)
+    sources = sorted({data.get("source", "?") for data in records})
+    period = f"az elmúlt {hours:g} óra" if hours else "az összes"
+    lines = [f"Mérések: {period}, {len(records)} rekord ({', '.join(sources)})"]
+
+    for name in sorted(timers):
+        if term not in name:
+            continue
+        t = timers[name]
+        lines.append("")
+        lines.append(f"{name}: {t['count']} mérés, átlag {t['sum'] / t['count']:.1f} ms, "
+                     f"p50 {percentile(t, 0.5):.0f} ms, p90 {percentile(t, 0.9):.0f} ms, "
+                     f"p99 {percentile(t, 0.99):.0f} ms, max {t['max']:.1f} ms")
+        lines.extend(_histogram(t))
+
+    hits, requests = counters.get("http.cache_hits", 0), counters.get("http.requests", 0)
+    if hits + requests and term in "http.cache":
+        lines.append("")
+        lines.append(f"Gyorsítótár: {hits} találat, {requests} hálózati kérés "
+                     f"({100 * hits / (hits + requests):.0f}% találati arány)")
+    shown = [name for name in sorted(counters) if term in name and not name.startswith("error.")]
+    if shown:
+        lines.append("")
+        lines.append("Számlálók:")
+        lines.extend(f"  {name:<32} {counters[name]}" for name in shown)
+    errors = [name for name in sorted(counters) if name.startswith("error.") and term in name]
+    lines.append("")
+    if errors:
+        lines.append("Hibák (lépés.kategória):")
+        lines.extend(f"  {name[len('error.'):]:<32} {counters[name]}" for name in errors)
+    else:
+        lines.append("Hibák: nincs")
+    return "\n".join(lines)
@@ -0,0 +1,153 @@
+#
+# viewer.py – előre elindított eredmény-néző a Qtile 'scores' scratchpadjéhez.
+#
+# A néző egy DropDown terminálban fut (alacritty --class scores -e scores-viewer), és
+# egy helyi Unix socketen várja a már kirenderelt szöveget. Minden új szöveget egy
+# friss 'less -R' kap csövön keresztül, így egy megjelenítés nem ír fájlt, nem indít
+# shellt és új terminált: a kattintástól a látható listáig néhány ezredmásodperc.
+#
+# Protokoll: a kliens egy JSON sort küld ({"text": ..., "clicked": <monotonic>}), a néző
+# válasza {"ok": true, "latency_ms": ...}, ahol a késleltetés a kattintástól a pagernek
+# átadott szövegig tart. Üres kérés ({"ping": true}) csak azt jelzi, hogy a néző él.
+#
+# Futtatás: PYTHONPATH=<scripts könyvtár> python3 -m scores.viewer          (néző)
+#           ... | python3 -m scores.viewer send                               (küldés)
+#
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import tempfile
+import threading
+import subprocess
+import socketserver
+
+SOCKET_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), "scores-viewer.sock"
+)
+CONNECT_TIMEOUT = 0.2
+# -K: SIGINT-re a less rendben kilép (visszaállítja a terminált), így cserélhető.
+PAGER = ["less", "-R", "-K"]
+IDLE_TEXT = "🎾 ⚽  Kattints egy eredmény widgetre a sávon…"
+
+
+def send(text, clicked=None, timeout=2):
+    """Átadja a szöveget a nézőnek. None-t ad vissza, ha a néző nem fut."""
+    payload = {"ping": True} if text is None else {"text": text, "clicked": clicked}
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except OSError:
+        return None
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(SOCKET_PATH)
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        return json.loads(sock.makefile("rb").readline())
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+
+class Viewer:
+    """A terminálban mindig legfeljebb egy pager fut; az új szöveg lecseréli a régit."""
+
+    def __init__(self, pager=PAGER):
+        self.pager = pager
+        self.proc = None
+        self.lock = threading.Lock()
+
+    def _stop(self):
+        proc, self.proc = self.proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    @staticmethod
+    def _feed(proc, data):
+        # A less csak annyit olvas, amennyi a képernyőhöz kell; a maradék a háttérben megy.
+        try:
+            proc.stdin.write(data)
+            proc.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+
+    def show(self, text):
+        with self.lock:
+            self._stop()
+            sys.stdout.write("\033[H\033[2J")
+            sys.stdout.flush()
+            self.proc = subprocess.Popen(self.pager, stdin=subprocess.PIPE)
+            threading.Thread(target=self._feed, args=(self.proc, text.encode("utf-8")), daemon=True).start()
+
+    def close(self):
+        with self.lock:
+            self._stop()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            req = json.loads(self.rfile.readline())
+            if "text" in req:
+                self.server.viewer.show(req["text"])
+            reply = {"ok": True}
+            if req.get("clicked") is not None:
+                reply["latency_ms"] = (time.monotonic() - req["clicked"]) * 1000
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class ViewerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, viewer):
+        self.viewer = viewer
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        super().__init__(path, _Handler)
+        os.chmod(path, 0o600)
+
+
+def main(argv):
+    if argv[:1] == ["send"]:
+        clicked = time.monotonic()
+        reply = send(sys.stdin.read(), clicked)
+        if reply is None:
+            print("A néző nem fut.", file=sys.stderr)
+            return 1
+        print(f"Megjelenítés: {reply.get('latency_ms', 0.0):.1f} ms", file=sys.stderr)
+        return 0 if reply.get("ok") else 1
+
+    viewer = Viewer()
+    server = ViewerServer(SOCKET_PATH, viewer)
+    # A terminál ^C-je a pagernek szól; a néző maga csak SIGTERM-re áll le.
+    # (Kezelőt állítunk be, nem SIG_IGN-t, hogy a less exec után alapállapotot kapjon.)
+    signal.signal(signal.SIGINT, lambda *_: None)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(IDLE_TEXT, flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        viewer.close()
+        server.server_close()
+        try:
+            os.unlink(SOCKET_PATH)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))